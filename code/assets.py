@@ -0,0 +1,52 @@
+from settings import *
+
+
+class AssetRegistry:
+    """
+    Images du jeu décodées et mises à l'échelle à la première utilisation, puis gardées en mémoire.
+    Importer settings ne charge donc plus aucune image : les outils et la simulation sans affichage
+    n'en paient pas le coût, et le jeu peut les préparer à l'avance (warm_up).
+    """
+
+    def __init__(self, images: dict[str, tuple]):
+        """
+        :param images: Nom -> (chemin du fichier, taille voulue ou None pour la taille d'origine)
+        """
+        self.images = images
+        self.cache: dict[str, pygame.Surface] = {}  # Nom -> image déjà chargée
+
+    def get(self, name: str) -> pygame.Surface:
+        """
+        Retourne une image, chargée au premier appel.
+
+        :param name: Nom de l'image (clé de IMAGES dans settings.py)
+        :raise KeyError: Si le nom n'est pas déclaré
+        """
+        image = self.cache.get(name)
+        if image is None:
+            path, size = self.images[name]
+            image = pygame.image.load(path)
+            if size is not None:
+                image = pygame.transform.scale(image, size)
+            # Si deux threads chargent la même image, la première arrivée est gardée
+            image = self.cache.setdefault(name, image)
+        return image
+
+    def warm_up(self, names: list[str] = None) -> None:
+        """
+        Charge des images à l'avance (par défaut IMAGES_WARM_UP).
+        N'utilise pas l'écran : peut tourner dans un autre thread.
+
+        :param names: Noms des images à charger
+        """
+        for name in IMAGES_WARM_UP if names is None else names:
+            self.get(name)
+
+
+# Registre partagé par tout le jeu
+ASSETS = AssetRegistry(IMAGES)
+
+
+def get_image(name: str) -> pygame.Surface:
+    """Raccourci pour ASSETS.get : image chargée à la première utilisation (voir IMAGES dans settings.py)"""
+    return ASSETS.get(name)
@@ -0,0 +1,240 @@
+import numpy as np
+
+from settings import *
+from engine import Engine
+from player import Player
+from map import MapTerrain
+
+
+class TerrainGrid:
+    """
+    Terrain d'une carte précalculé en tableaux NumPy, pour des requêtes sur de nombreux points à la fois.
+    Les tuiles (64px) débordent d'un pixel sur la grille (63px) : dans une cellule, les tuiles qui couvrent
+    un point ne changent qu'entre le décalage 0 et les autres décalages, sur chaque axe.
+    Chaque cellule est donc découpée en 4 zones, calculées une fois avec les requêtes de MapTerrain.
+    """
+
+    def __init__(self, terrain: MapTerrain, engine: Engine):
+        """
+        :param terrain: Terrain de la carte
+        :param engine: Moteur dont on reprend les règles de friction et de sortie des limites
+        """
+        self.columns = terrain.map_width // TILE_SIZE + 1
+        self.rows = terrain.map_height // TILE_SIZE + 1
+
+        # Zone d'un point : 0 à l'intérieur, +1 sur le bord gauche de la cellule, +2 sur le bord haut
+        self.friction = np.full((self.rows, self.columns, 4), GROUND_GRASS_FRICTION)
+        self.valid = np.zeros((self.rows, self.columns, 4), dtype=bool)  # Point sur une tuile autre que l'eau
+
+        probe = Player((0, 0, 0), (0, 0))
+        for cell_y in range(self.rows):
+            for cell_x in range(self.columns):
+                for zone in range(4):
+                    x = cell_x * TILE_SIZE + (0 if zone & 1 else 1)
+                    y = cell_y * TILE_SIZE + (0 if zone & 2 else 1)
+                    probe.position.update(x, y)
+                    self.friction[cell_y, cell_x, zone] = engine.get_friction_at_point((x, y))
+                    self.valid[cell_y, cell_x, zone] = not engine.is_out_of_bounds(probe)
+
+    def locate(self, positions: np.ndarray):
+        """
+        Retourne la cellule et la zone de chaque point.
+        Les coordonnées sont tronquées vers zéro, comme Rect.collidepoint le fait pour les flottants.
+
+        :param positions: Tableau (N, 2) de positions dans le monde
+        :return: Tuple (lignes, colonnes, zones, dans_la_grille)
+        """
+        points = np.trunc(positions).astype(np.int64)
+        cell_x, offset_x = np.divmod(points[:, 0], TILE_SIZE)
+        cell_y, offset_y = np.divmod(points[:, 1], TILE_SIZE)
+        inside = (cell_x >= 0) & (cell_x < self.columns) & (cell_y >= 0) & (cell_y < self.rows)
+        zones = (offset_x == 0) * 1 + (offset_y == 0) * 2
+        return np.where(inside, cell_y, 0), np.where(inside, cell_x, 0), zones, inside
+
+    def get_friction(self, positions: np.ndarray) -> np.ndarray:
+        """Coefficient de friction sous chaque point (l'herbe en dehors de la carte)"""
+        rows, columns, zones, inside = self.locate(positions)
+        return np.where(inside, self.friction[rows, columns, zones], GROUND_GRASS_FRICTION)
+
+    def is_out_of_bounds(self, positions: np.ndarray) -> np.ndarray:
+        """Indique pour chaque point s'il est hors des limites du terrain"""
+        rows, columns, zones, inside = self.locate(positions)
+        return ~(inside & self.valid[rows, columns, zones])
+
+
+class BatchEngine:
+    """
+    Moteur physique pour de nombreuses balles à la fois, sur un même terrain.
+    L'état des balles est stocké en tableaux NumPy (positions, vitesses) et l'intégration, la friction
+    exponentielle, la limitation de vitesse, les sorties de terrain, le trou et la mise en sommeil des balles
+    arrêtées sont calculés en une seule opération pour toutes les balles.
+    Seules les balles qui touchent (ou vont toucher pendant le pas) un obstacle, un bumper ou un accélérateur
+    passent par le moteur classique (Engine) pour leurs contacts, avec exactement les mêmes règles.
+    Les balles sont indépendantes : pas de collision entre elles, ni de bonus.
+    Utile pour chercher un tir, simuler une grande partie ou jouer côté serveur.
+    """
+
+    def __init__(self, terrain: MapTerrain, count: int, radius: int = BALL_RADIUS, sound_sink=None, respawn_sink=None):
+        """
+        :param terrain: Terrain de la carte (ex : MapTerrain.from_tmx)
+        :param count: Nombre de balles
+        :param radius: Rayon des balles
+        :param sound_sink: Fonction appelée avec le chemin de chaque son déclenché (optionnel)
+        :param respawn_sink: Fonction appelée avec l'indice de chaque balle replacée au spawn (optionnel)
+        """
+        self.map = terrain
+        self.radius = radius
+        self.respawn_sink = respawn_sink
+
+        # État des balles, une ligne par balle
+        self.spawn = np.array([terrain.spawn.x, terrain.spawn.y], dtype=float)
+        self.positions = np.tile(self.spawn, (count, 1))
+        self.velocities = np.zeros((count, 2))
+        self.finished = np.zeros(count, dtype=bool)
+        # Mise en sommeil, comme Player.asleep et Player.rest_time (voir Engine.update_sleep)
+        self.asleep = np.zeros(count, dtype=bool)
+        self.rest_time = np.zeros(count)
+
+        # Moteur classique pour les contacts, sur une balle "sonde" recopiée depuis les tableaux
+        self.probe = Player((0, 0, 0), (0, 0), radius=radius)
+        self.players = [self.probe]
+        self.debug_collisions = []
+        self.engine = Engine(self, sound_sink=sound_sink)
+
+        self.grid = TerrainGrid(terrain, self.engine)
+
+        # Rectangles des obstacles et des tuiles à contact (gauche, haut, droite, bas)
+        rects = list(terrain.colliders) + [tile.rect for tile in terrain.contact_tiles]
+        self.contact_rects = np.array([(rect.left, rect.top, rect.right, rect.bottom) for rect in rects],
+                                      dtype=float).reshape(-1, 4)
+        self.hole = np.array([terrain.hole.x, terrain.hole.y], dtype=float)
+
+    def shoot(self, velocities) -> None:
+        """
+        Applique un tir à chaque balle (même limitation que Engine.resolve_shot).
+        Comme pour un joueur, les balles tirées se réveillent (même pour un tir très faible).
+
+        :param velocities: Tableau (N, 2) des impulsions, ou une seule impulsion pour toutes les balles
+        """
+        impulses = np.broadcast_to(np.asarray(velocities, dtype=float), self.velocities.shape)
+        max_length = MAX_PLAYER_VELOCITY.length()
+        lengths = np.linalg.norm(impulses, axis=1, keepdims=True)
+        scale = np.where(lengths >= max_length, max_length / np.maximum(lengths, 1e-12), 1.0)
+        self.velocities += np.where(self.finished[:, None], 0.0, impulses * scale)
+        self.asleep[~self.finished] = False
+        self.rest_time[~self.finished] = 0.0
+
+    def step(self, dt: float = PHYSICS_DT) -> None:
+        """
+        Fait avancer toutes les balles d'un pas de temps, dans le même ordre que Engine.update.
+
+        :param dt: Pas de temps (en secondes)
+        """
+        # Une balle endormie est immobile : sans collision entre balles, seul un tir peut la réveiller
+        moving = ~self.finished & ~self.asleep
+
+        # Limitation de vitesse
+        np.clip(self.velocities, -MAX_BALL_SPEED, MAX_BALL_SPEED, out=self.velocities)
+
+        # 1. Intégration (Euler explicite), les balles près d'un contact sont balayées une par une
+        displacements = self.velocities * dt
+        ends = self.positions + displacements
+        near = moving & self.touches_contact_rects(np.minimum(self.positions, ends), np.maximum(self.positions, ends))
+        fractions = np.ones(len(self.positions))
+        for index in np.flatnonzero(near):
+            self.load_probe(index)
+            fractions[index] = self.engine.sweep_player(self.probe, Vector(*displacements[index]))
+        self.positions += np.where(moving[:, None], displacements * fractions[:, None], 0.0)
+
+        # Friction exponentielle: v(t) = v0·e^(-kt) avec k = friction/masse
+        friction = self.grid.get_friction(self.positions)
+        self.velocities *= np.where(moving, np.exp(-(friction / BALL_MASS) * dt), 1.0)[:, None]
+
+        # 2. Contacts avec les tuiles, par le moteur classique
+        near = moving & self.touches_contact_rects(self.positions, self.positions)
+        for index in np.flatnonzero(near):
+            self.load_probe(index)
+            self.engine.resolve_tile_collisions(self.probe, dt)
+            self.positions[index] = self.probe.position
+            self.velocities[index] = self.probe.velocity
+
+        # 3. Sorties de terrain : retour au spawn
+        out = moving & self.grid.is_out_of_bounds(self.positions)
+        if out.any():
+            self.engine.play_sound(SOUNDS["water"])
+            self.positions[out] = self.spawn
+            self.velocities[out] = 0.0
+            if self.respawn_sink is not None:
+                for index in np.flatnonzero(out):
+                    self.respawn_sink(index)
+
+        # 4. Arrivée dans le trou
+        in_hole = moving & (np.linalg.norm(self.positions - self.hole, axis=1) < (BALL_RADIUS + 1))
+        if in_hole.any():
+            self.engine.play_sound(SOUNDS["victory"])
+            self.finished |= in_hole
+            self.velocities[in_hole] = 0.0
+
+        # 5. Les balles s'endorment si elles restent sous VELOCITY_THRESHOLD pendant SLEEP_DELAY secondes
+        moving &= ~self.finished
+        slow = (self.velocities ** 2).sum(axis=1) <= VELOCITY_THRESHOLD ** 2
+        self.rest_time[moving] = np.where(slow[moving], self.rest_time[moving] + dt, 0.0)
+        falling_asleep = moving & (self.rest_time >= SLEEP_DELAY)
+        if falling_asleep.any():
+            self.asleep |= falling_asleep
+            self.velocities[falling_asleep] = 0.0
+            self.rest_time[falling_asleep] = 0.0
+
+    def touches_contact_rects(self, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+        """
+        Indique pour chaque balle si la zone qu'elle couvre touche un obstacle ou une tuile à contact.
+        La zone va de low à high (coins des centres) élargie du rayon, plus une marge pour la troncature du rect.
+
+        :param low: Tableau (N, 2) des coins haut gauche des centres
+        :param high: Tableau (N, 2) des coins bas droite des centres
+        """
+        margin = self.radius + 1
+        rects = self.contact_rects
+        overlap = ((low[:, None, 0] - margin < rects[None, :, 2]) & (high[:, None, 0] + margin > rects[None, :, 0])
+                   & (low[:, None, 1] - margin < rects[None, :, 3]) & (high[:, None, 1] + margin > rects[None, :, 1]))
+        return overlap.any(axis=1)
+
+    def load_probe(self, index: int) -> None:
+        """Recopie l'état d'une balle dans la balle sonde du moteur classique"""
+        self.probe.position.update(*self.positions[index])
+        self.probe.velocity.update(*self.velocities[index])
+        self.probe.update()
+
+    def at_rest(self) -> np.ndarray:
+        """Indique pour chaque balle si elle est arrêtée (même seuil que le jeu), endormie ou dans le trou"""
+        return self.finished | self.asleep | (np.linalg.norm(self.velocities, axis=1) <= VELOCITY_THRESHOLD)
+
+    def run_until_rest(self, dt: float = PHYSICS_DT, max_steps: int = 60 * PHYSICS_RATE) -> int:
+        """
+        Fait avancer les balles jusqu'à ce qu'elles soient toutes arrêtées.
+
+        :param dt: Pas de temps (en secondes)
+        :param max_steps: Nombre maximum de pas simulés
+        :return: Nombre de pas effectués
+        """
+        steps = 0
+        while steps < max_steps:
+            self.step(dt)
+            steps += 1
+            if self.at_rest().all():
+                break
+        return steps
+
+
+if __name__ == '__main__':
+    import time
+
+    # Recherche de tir : 1000 balles tirées dans toutes les directions depuis le spawn
+    batch = BatchEngine(MapTerrain.from_tmx(MAPS["0"]["path"]), 1000)
+    angles = np.linspace(0, 2 * np.pi, len(batch.positions), endpoint=False)
+    batch.shoot(np.column_stack((np.cos(angles), np.sin(angles))) * 800)
+
+    start = time.time()
+    steps = batch.run_until_rest()
+    print(f"{len(batch.positions)} balles, {steps} pas en {time.time() - start:.2f}s")
+    print(f"Balles dans le trou : {int(batch.finished.sum())}")
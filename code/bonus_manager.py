@@ -4,8 +4,8 @@ import time
 import pygame
 
 from settings import DEBUG_MODE
-from settings import OVERLAY_MENU_MARGIN, SOUNDS
-from gif_manager import Gif
+from settings import OVERLAY_MENU_MARGIN, SOUNDS, EXPLOSION_RADIUS, MAX_BALL_SPEED_BONUS, GROUND_ICE_FRICTION
+from gif_manager import Gif, get_gif_frames
 import settings
 from broadcast import BroadcastManager
 from player import Player
@@ -16,6 +16,10 @@ RESPAWN = False
 RESPAWN_TIME = 15  # temps en sec
 
 EXPLOSION_MAX_POWER = 1
+SPEED_BONUS_MULTIPLIER = 3  # Facteur de déplacement avec le bonus de vitesse
+MAGNET_DURATION = 5  # Durée (en secondes) du bonus aimant
+BONUS_SLOT_GIF = "../asset/GIF/Bonus_V1.2.gif"  # Animation des emplacements de bonus sur la carte
+BONUS_GIF_SCALE = .05  # Échelle des GIFs de bonus
 
 
 class BonusType:
@@ -24,7 +28,7 @@ class BonusType:
         self.color = color
         self.icon_id = icon_id
         self.broadcast_manager = broadcast_manager
-        self.gif = Gif(icon_id, OVERLAY_MENU_MARGIN, OVERLAY_MENU_MARGIN, .05, False, False)
+        self.gif = Gif(icon_id, OVERLAY_MENU_MARGIN, OVERLAY_MENU_MARGIN, BONUS_GIF_SCALE, False, False)
         self.sound = SoundManager()
 
     def apply_bonus(self, player: Player, players: [Player]) -> None:
@@ -70,30 +74,36 @@ class BonusType:
 
 
 class BonusSpeed(BonusType):
+    ICON = "../asset/GIF/Bonus_vitesse.gif"
+
     def __init__(self, broadcast_manager:BroadcastManager):
-        super().__init__("BonusSpeed", "green", "../asset/GIF/Bonus_vitesse.gif", broadcast_manager)
+        super().__init__("BonusSpeed", "green", self.ICON, broadcast_manager)
         self.active = False
 
     def apply_bonus(self, player: Player, players: [Player]) -> None:
         player.bonus = self
+        player.modifiers.max_velocity = MAX_BALL_SPEED_BONUS  # Vitesse maximale relevée dès le ramassage
 
     def consume_bonus(self, player: Player, players: [Player], overlay:pygame.Surface) -> None:
         self.active = True
+        player.modifiers.speed_multiplier = SPEED_BONUS_MULTIPLIER
         self.show_usage_message()
         self.sound.play_sound(SOUNDS["clic"])
 
     def next_turn(self, player:Player):
         if self.active:
             self.active = False
-            player.bonus = None
+            player.clear_bonus()
             self.broadcast_manager.broadcast("Vous n'avez plus de bonus de vitesse !")
 
     def show_usage_message(self) -> None:
         self.broadcast_manager.broadcast("Vous avez ce bonus de vitesse jusqu'à la fin de ce tour !")
 
 class BonusExplosion(BonusType):
+    ICON = "../asset/GIF/malus_explosion.gif"
+
     def __init__(self, broadcast_manager:BroadcastManager):
-        super().__init__("BonusExplosion", "red", "../asset/GIF/malus_explosion.gif", broadcast_manager)
+        super().__init__("BonusExplosion", "red", self.ICON, broadcast_manager)
         self.active = False
         self.start_time = -1
         self.end_time = -1
@@ -102,12 +112,16 @@ class BonusExplosion(BonusType):
         player.bonus = self
 
     def consume_bonus(self, player: Player, players: [Player], overlay:pygame.Surface) -> None:
+        """
+        :param players: Joueurs à repousser, il suffit de donner ceux à moins de EXPLOSION_RADIUS
+                        (ex : Engine.get_players_around), les autres sont ignorés
+        """
 
         self.active = True
         self.sound.play_sound(SOUNDS["clic"])
 
         player_pos = player.position
-        MAX_REPULSION_DISTANCE = 500
+        MAX_REPULSION_DISTANCE = EXPLOSION_RADIUS
         EXPLOSION_MAX_POWER = 10
         REPULSION_FORCE = 750
 
@@ -149,8 +163,10 @@ class BonusExplosion(BonusType):
         self.broadcast_manager.broadcast("Appuyez sur 'E' pour utiliser le bonus d'explosion !")
 
 class BonusFantome(BonusType):
+    ICON = "../asset/GIF/Bonus_invisible.gif"
+
     def __init__(self, broadcast_manager:BroadcastManager):
-        super().__init__("BonusFantome", "blue", "../asset/GIF/Bonus_invisible.gif", broadcast_manager)
+        super().__init__("BonusFantome", "blue", self.ICON, broadcast_manager)
         self.active = False
 
     def apply_bonus(self, player: Player, players: [Player]) -> None:
@@ -158,26 +174,30 @@ class BonusFantome(BonusType):
 
     def consume_bonus(self, player: Player, players: [Player], overlay:pygame.Surface) -> None:
         self.active = True
+        player.modifiers.ghost = True
+        player.modifiers.extra_friction = GROUND_ICE_FRICTION  # Le fantôme glisse un peu moins loin
         self.show_usage_message()
         self.sound.play_sound(SOUNDS["clic"])
 
     def next_turn(self,player: Player):
         if self.active:
             self.active = False
-            player.bonus = None
+            player.clear_bonus()
             self.broadcast_manager.broadcast("Vous n'êtes plus invisible !")
 
     def show_usage_message(self) -> None:
         self.broadcast_manager.broadcast("Vous êtes maintenant invisible !")
 
 class BonusAimant(BonusType):
+    ICON = "../asset/GIF/Bonus_aimant.gif"
+
     def __init__(self, broadcast_manager:BroadcastManager):
-        super().__init__("BonusAimant", "yellow", "../asset/GIF/Bonus_aimant.gif", broadcast_manager)
+        super().__init__("BonusAimant", "yellow", self.ICON, broadcast_manager)
         self.active = False
         self.start_time = -1
 
     def isActive(self):
-        if time.time() - self.start_time > 5:
+        if time.time() - self.start_time > MAGNET_DURATION:
             self.active = False
         return self.active
 
@@ -189,10 +209,11 @@ class BonusAimant(BonusType):
             self.active = True
             self.sound.play_sound(SOUNDS["magnet"])
             self.start_time = time.time()
+            player.modifiers.attractor_until = self.start_time + MAGNET_DURATION
 
     def next_turn(self,player: Player):
         if self.start_time != -1:
-            player.bonus = None
+            player.clear_bonus()
 
     def show_usage_message(self) -> None:
         self.broadcast_manager.broadcast("Appuyez sur 'E' pour utiliser le bonus d'aimant pendant ce tour !")
@@ -213,7 +234,7 @@ class Bonus:
         self.available = True
         self.last_pick = 0
 
-        self.gif = Gif("../asset/GIF/Bonus_V1.2.gif",self.x-40,self.y-40,.05,True,False)
+        self.gif = Gif(BONUS_SLOT_GIF,self.x-40,self.y-40,BONUS_GIF_SCALE,True,False)
 
     def pick_bonus(self, player: Player, players: [Player]) -> None:
         if not self.available or isinstance(player.bonus, BonusType):
@@ -226,8 +247,7 @@ class Bonus:
         self.bonus.apply_bonus(player, players)
         self.gif.hide = True
 
-    def update_bonus(self, surface: pygame.Surface) -> None:
-        self.bonus.update(surface, self.x, self.y)
+    def update_bonus(self) -> None:
         if not self.available and time.time() - self.last_pick > RESPAWN_TIME:
             self.respawn_bonus()
 
@@ -237,9 +257,10 @@ class Bonus:
         self.last_pick = 0
         self.gif.hide = False
 
-    def draw_bonus(self, surface: pygame.Surface):
+    def draw_bonus(self, surface: pygame.Surface, offset: tuple[int, int] = (0, 0)):
+        self.bonus.update(surface, self.x + offset[0], self.y + offset[1])
         if self.available:
-            self.gif.update(surface)
+            self.gif.update(surface, offset)
 
     def print_bonus_log(self):
         if DEBUG_MODE:
@@ -257,3 +278,12 @@ class Bonus:
 
 BonusList = [BonusExplosion,BonusSpeed,BonusAimant, BonusFantome]
 
+
+def preload_bonus_gifs() -> None:
+    """
+    Décode à l'avance les GIFs des bonus (mis en cache par get_gif_frames).
+    N'utilise pas l'écran : appelé par le préchargement des cartes, hors du thread principal.
+    """
+    get_gif_frames(BONUS_SLOT_GIF, BONUS_GIF_SCALE)
+    for bonus_type in BonusList:
+        get_gif_frames(bonus_type.ICON, BONUS_GIF_SCALE)
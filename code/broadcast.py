@@ -14,7 +14,7 @@ class BroadcastManager:
                 WINDOW_WIDTH // 2,
                 OVERLAY_MENU_MARGIN + OVERLAY_MENU_PADDING + 6
             ),
-            font_size=12,
+            font_size=BROADCAST_FONT_SIZE,
             color=(255, 255, 255),
             align="center"
         )
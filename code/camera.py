@@ -1,5 +1,6 @@
 from camera_animator import *
 from settings import *
+from math import floor, ceil
 import pygame
 
 
@@ -135,6 +136,23 @@ class Camera:
         screen_x, screen_y = self.world_to_screen(world_x, world_y)
         return self.is_position_on_screen(screen_x, screen_y)
 
+    def visible_world_rect(self, margin=0):
+        """
+        Returns the part of the world visible on screen.
+
+        Args:
+            margin: Extra world pixels added on each side (absorbs rounding errors)
+
+        Returns:
+            pygame.Rect: Visible area in world space
+        """
+        left, top = self.screen_to_world_coords(0, 0)
+        right, bottom = self.screen_to_world_coords(self.screen.get_width(), self.screen.get_height())
+
+        left, top = floor(left) - margin, floor(top) - margin
+        right, bottom = ceil(right) + margin, ceil(bottom) + margin
+        return pygame.Rect(left, top, right - left, bottom - top)
+
     def screen_to_world(self, screen_coord):
         """
         Converts a screen coordinate tuple to world coordinate.
@@ -0,0 +1,172 @@
+from settings import *
+import numpy as np
+
+
+class ChunkCache:
+    """
+    Découpe le fond d'une carte en morceaux carrés (chunks) dessinés à la demande et gardés en cache.
+    Chaque chunk existe en plusieurs niveaux de zoom (principe des mipmaps) : un zoom intermédiaire
+    est obtenu à partir du niveau le plus proche avec un petit redimensionnement.
+    La mémoire occupée par les chunks est limitée par un budget en octets (les moins récemment utilisés
+    sont supprimés), elle ne dépend donc pas de la taille de la carte.
+    Ce cache remplace la pyramide de fonds réduits (ZoomPyramid) et reprend son budget mémoire par carte.
+    Chaque carte possède son propre cache, libéré avec elle.
+    """
+
+    def __init__(self, map_obj, chunk_size: int = CHUNK_SIZE, levels: list = ZOOM_CACHE_LEVELS,
+                 memory_budget: int = CHUNK_CACHE_BUDGET):
+        """
+        :param map_obj: Carte dont on dessine le fond (calques de gids et atlas des tuiles)
+        :param chunk_size: Taille d'un chunk (en pixels du monde)
+        :param levels: Niveaux de zoom (inférieurs à 1) pré-calculés en plus de la taille réelle
+        :param memory_budget: Mémoire maximale (en octets) occupée par les chunks, dessinés d'avance compris
+        """
+        self.map = map_obj
+        self.chunk_size = chunk_size
+        self.levels = sorted(level for level in levels if level < DEFAULT_ZOOM)
+        self.memory_budget = memory_budget
+        self.memory_used = 0  # Octets occupés par les chunks de self.chunks et self.baked
+        self.bounds = pygame.Rect(0, 0, map_obj.map_width, map_obj.map_height)
+
+        # Chunks dessinés {(zoom du niveau, colonne, ligne): surface}, du moins récemment utilisé au plus récent
+        self.chunks: dict = dict()
+        # Chunks dessinés d'avance et pas encore convertis au format de l'écran (voir bake)
+        self.baked: dict = dict()
+
+    def get_level_zoom(self, zoom: float) -> float:
+        """
+        Retourne le niveau de zoom des chunks à utiliser pour un zoom de caméra.
+        On prend le plus petit niveau supérieur ou égal au zoom, pour ne jamais agrandir une image réduite.
+        """
+        return next((level for level in self.levels if level >= zoom), DEFAULT_ZOOM)
+
+    def get_chunk_rect(self, chunk_x: int, chunk_y: int) -> pygame.Rect:
+        """Retourne la zone du monde couverte par un chunk (limitée aux bords de la carte)"""
+        rect = pygame.Rect(chunk_x * self.chunk_size, chunk_y * self.chunk_size, self.chunk_size, self.chunk_size)
+        return rect.clip(self.bounds)
+
+    def get_visible_chunks(self, world_rect: pygame.Rect) -> list[tuple[int, int]]:
+        """Retourne les coordonnées des chunks qui touchent une zone du monde"""
+        area = world_rect.clip(self.bounds)
+        if area.width <= 0 or area.height <= 0:
+            return []
+
+        return [
+            (chunk_x, chunk_y)
+            for chunk_y in range(area.top // self.chunk_size, (area.bottom - 1) // self.chunk_size + 1)
+            for chunk_x in range(area.left // self.chunk_size, (area.right - 1) // self.chunk_size + 1)
+        ]
+
+    def get_chunk(self, chunk_x: int, chunk_y: int, level_zoom: float = DEFAULT_ZOOM) -> pygame.Surface:
+        """
+        Retourne la surface d'un chunk à un niveau de zoom, en la dessinant si elle n'est pas en cache.
+
+        :param chunk_x: Colonne du chunk
+        :param chunk_y: Ligne du chunk
+        :param level_zoom: Niveau de zoom (1 ou une valeur de self.levels)
+        """
+        key = (level_zoom, chunk_x, chunk_y)
+        surface = self.chunks.pop(key, None)
+        if surface is None:
+            baked = self.baked.pop(key, None)
+            if baked is not None:
+                self.memory_used -= self.get_surface_bytes(baked)
+                surface = baked.convert()  # Dessiné d'avance (voir bake), il ne reste qu'à le convertir
+            elif level_zoom == DEFAULT_ZOOM:
+                surface = self.render_chunk(chunk_x, chunk_y)
+            else:
+                # Les niveaux réduits sont dérivés du chunk en taille réelle
+                surface = self.scale_chunk(self.get_chunk(chunk_x, chunk_y), level_zoom)
+
+            size_bytes = self.get_surface_bytes(surface)
+            while (self.chunks or self.baked) and self.memory_used + size_bytes > self.memory_budget:
+                self.evict_oldest()
+            self.memory_used += size_bytes
+
+        # On le remet en fin de dictionnaire : c'est le chunk le plus récemment utilisé
+        self.chunks[key] = surface
+        return surface
+
+    def evict_oldest(self) -> None:
+        """Supprime le chunk affiché le moins récemment, ou à défaut le plus ancien des chunks dessinés d'avance"""
+        cache = self.chunks if self.chunks else self.baked
+        surface = cache.pop(next(iter(cache)))
+        self.memory_used -= self.get_surface_bytes(surface)
+
+    @staticmethod
+    def get_surface_bytes(surface: pygame.Surface) -> int:
+        """Mémoire (en octets) occupée par les pixels d'une surface"""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @staticmethod
+    def scale_chunk(full_size: pygame.Surface, level_zoom: float) -> pygame.Surface:
+        """Réduit un chunk en taille réelle à un niveau de zoom"""
+        size = (
+            max(1, round(full_size.get_width() * level_zoom)),
+            max(1, round(full_size.get_height() * level_zoom))
+        )
+        return pygame.transform.scale(full_size, size)
+
+    def render_chunk(self, chunk_x: int, chunk_y: int, convert: bool = True) -> pygame.Surface:
+        """
+        Dessine les tuiles visibles d'un chunk en taille réelle
+
+        :param convert: Faux pour dessiner sans l'écran (hors du thread principal), voir bake
+        """
+        rect = self.get_chunk_rect(chunk_x, chunk_y)
+        surface = pygame.Surface(rect.size)
+        if convert:
+            surface = surface.convert()
+        surface.fill("#BDDFFF")
+
+        # Cellules dont une tuile peut toucher le chunk (les images débordent sur les cellules suivantes)
+        first_x = max(0, (rect.left - self.map.max_tile_size) // TILE_SIZE + 1)
+        first_y = max(0, (rect.top - self.map.max_tile_size) // TILE_SIZE + 1)
+        last_x, last_y = (rect.right - 1) // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE
+
+        atlas = self.map.atlas
+        for layer in self.map.layers:
+            # Les calques de debug (collisions, bumpers) ne sont affichés qu'en DEBUG_MODE
+            if layer.name in {"Collision", "Bounce"} and not DEBUG_MODE:
+                continue
+            # Calque par calque puis ligne par ligne, comme l'ordre de chargement de la carte
+            grid = layer.grid[first_y:last_y + 1, first_x:last_x + 1]
+            surface.blits([
+                (atlas.surface,
+                 ((first_x + x) * TILE_SIZE - rect.x, (first_y + y) * TILE_SIZE - rect.y),
+                 atlas.rects[grid[y, x]])
+                for y, x in zip(*np.nonzero(grid))
+            ], doreturn=False)
+
+        if DEBUG_MODE:
+            print(f"[ChunkCache] Chunk ({chunk_x}, {chunk_y}) dessiné")
+        return surface
+
+    def bake(self) -> None:
+        """
+        Dessine d'avance les chunks de la carte (taille réelle puis niveaux réduits), dans la limite du budget mémoire.
+        N'utilise pas l'écran : peut tourner dans le thread qui précharge la carte.
+        Chaque surface n'est convertie au format de l'écran qu'à sa première utilisation (get_chunk),
+        sur le thread principal : la conversion est répartie sur les premières images du niveau.
+        """
+        self.clear()
+        for level_zoom in [DEFAULT_ZOOM] + self.levels:
+            for chunk_x, chunk_y in self.get_visible_chunks(self.bounds):
+                if level_zoom == DEFAULT_ZOOM:
+                    surface = self.render_chunk(chunk_x, chunk_y, convert=False)
+                else:
+                    full_size = self.baked.get((DEFAULT_ZOOM, chunk_x, chunk_y))
+                    if full_size is None:
+                        return
+                    surface = self.scale_chunk(full_size, level_zoom)
+                size_bytes = self.get_surface_bytes(surface)
+                if self.memory_used + size_bytes > self.memory_budget:
+                    return
+                self.baked[(level_zoom, chunk_x, chunk_y)] = surface
+                self.memory_used += size_bytes
+
+    def clear(self):
+        """Vide le cache"""
+        self.chunks.clear()
+        self.baked.clear()
+        self.memory_used = 0
@@ -0,0 +1,104 @@
+from math import sqrt
+
+import pygame
+
+
+def sweep_circle_rect(start, displacement, radius: float, rect: pygame.Rect):
+    """
+    Calcule le temps d'impact d'un cercle qui se déplace en ligne droite contre un rectangle.
+    Le rectangle est élargi du rayon (somme de Minkowski, coins arrondis) et on lance
+    un rayon depuis le centre du cercle : plaques sur les deux axes, puis cercle du coin
+    si le point d'entrée tombe dans un coin.
+
+    :param start: Position (x, y) du centre du cercle au début du déplacement
+    :param displacement: Déplacement (dx, dy) du centre pendant le pas
+    :param radius: Rayon du cercle
+    :param rect: Rectangle de l'obstacle
+    :return: Fraction du déplacement (entre 0 et 1) au moment du contact, ou None s'il n'y a pas
+             de contact pendant le pas (ou si le cercle touche déjà le rectangle au départ)
+    """
+    x, y = start[0], start[1]
+    dx, dy = displacement[0], displacement[1]
+
+    # Test des plaques sur le rectangle élargi du rayon
+    t_enter, t_exit = float("-inf"), float("inf")
+    for position, direction, low, high in (
+            (x, dx, rect.left - radius, rect.right + radius),
+            (y, dy, rect.top - radius, rect.bottom + radius)):
+        if direction == 0:
+            if position < low or position > high:
+                return None  # Parallèle à la plaque et en dehors : pas de contact
+            continue
+        t1, t2 = (low - position) / direction, (high - position) / direction
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_enter, t_exit = max(t_enter, t1), min(t_exit, t2)
+
+    if t_enter > t_exit or t_enter > 1 or t_exit < 0:
+        return None  # Pas de contact pendant ce pas
+    if t_enter < 0:
+        # Départ dans le rectangle élargi : soit le cercle touche déjà le rectangle,
+        # soit il est dans la zone d'un coin, sans toucher le coin arrondi (le contact reste à calculer)
+        if circle_rect_contact(start, radius, rect) is not None:
+            return None
+        t_enter = 0
+
+    # Point d'entrée : s'il est en face d'un côté, le contact se fait sur ce côté
+    hit_x, hit_y = x + dx * t_enter, y + dy * t_enter
+    if rect.left <= hit_x <= rect.right or rect.top <= hit_y <= rect.bottom:
+        return t_enter
+
+    # Sinon, le contact se fait sur le coin arrondi : intersection rayon-cercle
+    corner_x = rect.left if hit_x < rect.left else rect.right
+    corner_y = rect.top if hit_y < rect.top else rect.bottom
+    fx, fy = x - corner_x, y - corner_y
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    c = fx * fx + fy * fy - radius * radius
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None  # Le rayon passe à côté du coin
+
+    t = (-b - sqrt(discriminant)) / (2 * a)
+    if t < 0 or t > 1:
+        return None
+    return t
+
+
+def circle_rect_contact(center, radius: float, rect: pygame.Rect):
+    """
+    Calcule le contact entre un cercle et un rectangle aligné sur les axes.
+    On cherche le point du rectangle le plus proche du centre du cercle : la normale de contact
+    va de ce point vers le centre, et la pénétration est le rayon moins leur distance.
+    Si le centre est dans le rectangle, on sort par le côté le plus proche.
+
+    :param center: Position (x, y) du centre du cercle
+    :param radius: Rayon du cercle
+    :param rect: Rectangle de l'obstacle
+    :return: Tuple (normale, pénétration) avec une normale unitaire orientée vers l'extérieur
+             du rectangle, ou None si le cercle ne touche pas le rectangle
+    """
+    x, y = center[0], center[1]
+
+    # Point du rectangle le plus proche du centre
+    closest_x = min(max(x, rect.left), rect.right)
+    closest_y = min(max(y, rect.top), rect.bottom)
+    diff_x, diff_y = x - closest_x, y - closest_y
+    square_dist = diff_x * diff_x + diff_y * diff_y
+
+    if square_dist >= radius * radius:
+        return None  # Pas de contact
+
+    if square_dist > 0:
+        distance = sqrt(square_dist)
+        return pygame.math.Vector2(diff_x / distance, diff_y / distance), radius - distance
+
+    # Centre dans le rectangle : on sort par le côté le plus proche
+    exits = (
+        (x - rect.left, pygame.math.Vector2(-1, 0)),
+        (rect.right - x, pygame.math.Vector2(1, 0)),
+        (y - rect.top, pygame.math.Vector2(0, -1)),
+        (rect.bottom - y, pygame.math.Vector2(0, 1)),
+    )
+    distance, normal = min(exits, key=lambda side: side[0])
+    return normal, radius + distance
@@ -1,7 +1,10 @@
 import math
 import random
-from bonus_manager import BonusSpeed, BonusFantome, BonusAimant
+import time
 from player import Player
+from collision import sweep_circle_rect, circle_rect_contact
+from spatial_hash import SpatialHash
+from terrain import BOUNCE, COLLISION
 from settings import *
 from math import exp, sqrt
 
@@ -12,11 +15,46 @@ class Engine:
     entre les joueurs et le terrain.
     """
 
-    def __init__(self, level):
+    def __init__(self, level, sound_sink=None, respawn_sink=None, rest_sink=None):
+        """
+        :param level: Niveau (ou simulation) fournissant la carte et les joueurs
+        :param sound_sink: Fonction appelée avec le chemin du son à jouer (aucun son si None)
+        :param respawn_sink: Fonction appelée avec le joueur replacé au spawn (rien si None)
+        :param rest_sink: Fonction appelée quand tous les joueurs s'arrêtent (rien si None)
+        """
         self.level = level  # Stocke le niveau actuel
         self.players = level.players  # Liste des joueurs (objets physiques mobiles)
         self.num_players = len(self.players)  # Nombre total de joueurs
 
+        # Les événements sont envoyés à des "sinks", ce qui permet de simuler sans affichage ni son
+        self.sound_sink = sound_sink
+        self.respawn_sink = respawn_sink
+        self.rest_sink = rest_sink
+
+        # Vrai quand plus aucun joueur ne bouge (vitesse sous VELOCITY_THRESHOLD)
+        self.at_rest = True
+
+        # Temps écoulé pas encore simulé (inférieur à un pas physique après chaque frame)
+        self.accumulator = 0.0
+
+        # Grille spatiale des joueurs en jeu, pour ne tester que les paires de joueurs proches
+        # Une case fait deux diamètres : deux balles en contact, même après avoir été poussées, sont voisines
+        max_radius = max([player.radius for player in self.players] + [BALL_RADIUS])
+        self.player_hash = SpatialHash(4 * max_radius)
+
+        # Types de terrain de la carte, avec ses propriétés physiques (voir build_terrain_table)
+        self.terrains = level.map.terrains
+        # Méthode appelée au contact de chaque type de terrain qui en a une (bumper, accélérateurs)
+        self.contact_handlers = {terrain.id: getattr(self, terrain.handler)
+                                 for terrain in self.terrains if terrain.contact}
+
+    def play_sound(self, sound_path: str) -> None:
+        """
+        Transmet un effet sonore au sink des sons, s'il y en a un.
+        """
+        if self.sound_sink is not None:
+            self.sound_sink(sound_path)
+
     def resolve_shot(self, player: Player, velocity_vector: Vector):
         """
         Applique une impulsion au joueur lorsqu'il frappe la balle.
@@ -31,17 +69,57 @@ class Engine:
         # Application de l'impulsion: addition vectorielle de la vitesse
         player.velocity += velocity_vector
 
+        # Le joueur se réveille, et on attend qu'il s'arrête à nouveau (même pour un tir très faible)
+        player.wake()
+        self.at_rest = False
+
     def update_position(self, player: Player, dt: float) -> None:
         """
         Met à jour la position du joueur selon l'équation du mouvement: x(t+dt) = x(t) + v·dt
         On utilise la méthode d'Euler explicite
         "dt" représente l'intervalle de temps écoulé depuis la dernière mise à jour (en secondes).
+        Le déplacement est arrêté au premier obstacle rencontré (détection continue),
+        pour qu'une balle rapide ne puisse pas traverser un mur pendant un pas.
         """
-        bonus_modifier = 1  # Facteur multiplicateur normal
-        if isinstance(player.bonus, BonusSpeed) and player.bonus.active:
-            bonus_modifier = 3  # Triple la vitesse si le bonus de vitesse est actif
+        # Le bonus de vitesse multiplie le déplacement (voir BonusModifiers)
+        displacement = player.velocity * dt * player.modifiers.speed_multiplier
+        player.position += displacement * self.sweep_player(player, displacement)
 
-        player.position += player.velocity * dt * bonus_modifier
+    def sweep_player(self, player: Player, displacement: Vector) -> float:
+        """
+        Détection continue des collisions: on balaie le cercle du joueur le long de son déplacement
+        contre les obstacles et les bumpers, et on cherche le premier instant de contact.
+        Le joueur avance jusqu'à ce contact (plus CONTACT_SKIN pixels), la résolution des collisions
+        qui suit gère ensuite le rebond comme d'habitude. Le reste du pas est abandonné.
+
+        :return: Fraction du déplacement que le joueur peut parcourir (1 s'il n'y a pas de contact)
+        """
+        # Le bonus fantôme permet de traverser les obstacles et les bumpers
+        if player.modifiers.ghost:
+            return 1.0
+
+        length = displacement.length()
+        if length == 0:
+            return 1.0
+
+        # Zone couverte par le joueur pendant le déplacement
+        swept_area = player.rect.union(player.rect.move(int(displacement.x), int(displacement.y)))
+
+        obstacles = self.level.map.get_colliders_around_rect(swept_area, margin=1)
+        for tile in self.level.map.get_contact_tiles_around_rect(swept_area, margin=1):
+            if tile.terrain == BOUNCE:
+                obstacles.append(tile.rect)
+
+        time_of_impact = 1.0
+        for obstacle in obstacles:
+            t = sweep_circle_rect(player.position, displacement, player.radius, obstacle)
+            if t is not None and t < time_of_impact:
+                time_of_impact = t
+
+        if time_of_impact < 1.0:
+            # Légère pénétration pour que la résolution des collisions détecte le contact
+            time_of_impact = min(1.0, time_of_impact + CONTACT_SKIN / length)
+        return time_of_impact
 
     def apply_friction(self, player: Player, dt: float) -> None:
         """
@@ -49,9 +127,9 @@ class Engine:
         Modèle de friction où la force est proportionnelle à la vitesse: F = -k·v
         Se traduit par une décroissance exponentielle de la vitesse (e^-kt).
         """
-        # Cas spécial: sur la glace avec le bonus "fantôme"
-        if isinstance(player.bonus, BonusFantome) and player.bonus.active:
-            player.velocity *= exp(-(GROUND_ICE_FRICTION / BALL_MASS) * dt)
+        # Friction ajoutée par un bonus (ex : le fantôme)
+        if player.modifiers.extra_friction:
+            player.velocity *= exp(-(player.modifiers.extra_friction / BALL_MASS) * dt)
 
         # Récupère le coefficient de friction selon la surface
         friction = self.get_friction_at_point(player.position)
@@ -63,16 +141,13 @@ class Engine:
     def get_friction_at_point(self, point: tuple[float, float]) -> float:
         """
         Détermine le coefficient de friction à une position donnée selon le type de terrain.
+        Seules les tuiles de la cellule sous le point sont parcourues (dans l'ordre des calques).
         """
-        for tile in self.level.map.tiles:
-            if tile.rect.collidepoint(point):
-                # Différentes surfaces ont différents coefficients de friction
-                if tile.id == "Grass":
-                    return GROUND_GRASS_FRICTION  # Herbe: friction moyenne
-                elif tile.id == "Sand":
-                    return GROUND_SAND_FRICTION  # Sable: friction élevée
-                elif tile.id == "Ice":
-                    return GROUND_ICE_FRICTION  # Glace: friction faible
+        for terrain in self.level.map.get_terrains_at_point(point):
+            # Différentes surfaces ont différents coefficients de friction
+            friction = self.terrains[terrain].friction
+            if friction is not None:
+                return friction  # Herbe, sable, glace... (voir terrain.py)
 
         # Par défaut, on considère le joueur sur l'herbe
         return GROUND_GRASS_FRICTION
@@ -87,7 +162,7 @@ class Engine:
             return
 
         # Le bonus fantôme permet de traverser les autres joueurs
-        if isinstance(player1.bonus, BonusFantome) and player1.bonus.active:
+        if player1.modifiers.ghost:
             return
 
         # Calcul de la distance entre les deux joueurs
@@ -120,12 +195,12 @@ class Engine:
         Équivalent à une condition aux limites avec repositionnement.
         """
         # Le bonus fantôme permet de sortir des limites
-        if isinstance(player.bonus, BonusFantome) and player.bonus.active:
+        if player.modifiers.ghost:
             return
 
         if self.is_out_of_bounds(player):
             # Effet sonore pour signaler la sortie
-            self.level.game.sound_manager.play_sound(SOUNDS["water"])
+            self.play_sound(SOUNDS["water"])
 
             # Arrêt mouvement
             player.velocity = Vector(0.0, 0.0)
@@ -134,15 +209,16 @@ class Engine:
             self.level.map.teleportPlayerToSpawn(player)
             print(f"Joueur:{player.name} est sorti des limites")
 
-            # On recentre la caméra sur le joueur
-            self.level.centerOnPlayer(player)
+            # On signale la réapparition (ex : recentrer la caméra sur le joueur)
+            if self.respawn_sink is not None:
+                self.respawn_sink(player)
 
     def is_out_of_bounds(self, player: Player) -> bool:
         """
         Vérifie si un joueur est sorti des limites du terrain.
         """
-        for tile in self.level.map.tiles:
-            if tile.rect.collidepoint(player.position) and tile.id != "Water":
+        for terrain in self.level.map.get_terrains_at_point(player.position):
+            if not self.terrains[terrain].out_of_bounds:
                 return False  # Le joueur est sur une tuile valide
         return True  # Le joueur n'est sur aucune tuile valide, il est "hors limites"
 
@@ -156,7 +232,7 @@ class Engine:
             player.velocity = Vector(0.0, 0.0)
             player.finished = True
             # Effet sonore de victoire
-            self.level.game.sound_manager.play_sound(SOUNDS["victory"])
+            self.play_sound(SOUNDS["victory"])
 
     def is_on_finish(self, player: Player) -> None:
         """
@@ -175,83 +251,43 @@ class Engine:
         if distance < (BALL_RADIUS + 1):
             self.resolve_finish(player)
 
-    def resolve_player_obstacle_collision(self, player: Player, tile) -> None:
+    def resolve_player_obstacle_collision(self, player: Player, obstacle: pygame.Rect) -> bool:
         """
-        Résolution (améliorée) des collisions joueur-obstacle.
+        Résolution des collisions joueur-obstacle, avec le cercle exact du joueur.
+        L'obstacle est un rectangle fusionné de plusieurs tuiles "Collision" (voir MapTerrain.colliders).
+        On calcule la normale et la pénétration du contact, on sort le joueur de l'obstacle
+        puis on réfléchit la composante normale de la vitesse.
+
+        :return: True s'il y avait un contact
         """
         # Le bonus fantôme permet de traverser les obstacles
-        if isinstance(player.bonus, BonusFantome) and player.bonus.active:
-            return
+        if player.modifiers.ghost:
+            return False
+
+        contact = circle_rect_contact(player.position, player.radius, obstacle)
+        if contact is None:
+            return False  # Pas de contact
+        normal, penetration = contact
 
         # Sauvegarde de l'état avant collision
         original_velocity = player.velocity.copy()
         original_position = player.position.copy()
 
-        # Calcul de l'intersection entre rectangle du joueur et celui de l'obstacle
-        intersection = player.rect.clip(tile.rect)
-
-        # Calcul de la pénétration joueur-obstacle
-        pen_x = intersection.width
-        pen_y = intersection.height
-
-        if pen_x == 0 and pen_y == 0:
-            return  # Pas d'intersection, donc pas de collision
-
-        # Calcul de la distance du joueur à chaque face de l'obstacle
-        dist_left = abs(player.rect.right - tile.rect.left)
-        dist_right = abs(player.rect.left - tile.rect.right)
-        dist_top = abs(player.rect.bottom - tile.rect.top)
-        dist_bottom = abs(player.rect.top - tile.rect.bottom)
-
-        # On détermine la face la plus proche
-        min_dist = min(dist_left, dist_right, dist_top, dist_bottom)
-
-        normal = Vector(0, 0)  # Vecteur normal à la surface de collision
-        collision_type = ""  # Type de collision (pour debug)
-
         buffer = 1.0  # Petite marge pour éviter les collisions répétées
 
-        # Résolution de la collision selon la face la plus proche
-        # Pour chaque cas: on repositionne + on inverse la vitesse normale à la surface
-        if min_dist == dist_left:
-            # Collision avec le bord gauche de l'obstacle
-            player.position.x = tile.rect.left - player.radius - buffer
-            player.velocity.x = -abs(player.velocity.x)  # vitesse vers la gauche
-            normal = Vector(-1, 0)
-            collision_type = "left edge"
-
-        elif min_dist == dist_right:
-            # Collision avec le bord droit de l'obstacle
-            player.position.x = tile.rect.right + player.radius + buffer
-            player.velocity.x = abs(player.velocity.x)  # vitesse vers la droite
-            normal = Vector(1, 0)
-            collision_type = "right edge"
-
-        elif min_dist == dist_top:
-            # Collision avec le bord supérieur de l'obstacle
-            player.position.y = tile.rect.top - player.radius - buffer
-            player.velocity.y = -abs(player.velocity.y)  # vitesse vers le haut
-            normal = Vector(0, -1)
-            collision_type = "top edge"
-
-        elif min_dist == dist_bottom:
-            # Collision avec le bord inférieur de l'obstacle
-            player.position.y = tile.rect.bottom + player.radius + buffer
-            player.velocity.y = abs(player.velocity.y)  # vitesse vers le bas
-            normal = Vector(0, 1)
-            collision_type = "bottom edge"
+        # On sort le joueur de l'obstacle le long de la normale
+        player.position += normal * (penetration + buffer)
+
+        # On inverse la vitesse normale à la surface si le joueur va vers l'obstacle
+        normal_speed = player.velocity.dot(normal)
+        if normal_speed < 0:
+            player.velocity -= normal * ((1 + self.terrains[COLLISION].restitution) * normal_speed)
+            normal_speed = -normal_speed
 
         # On donne une vitesse minimale après collision pour éviter que le joueur reste "collé"
         min_escape_velocity = 20.0
-
-        # Vitesse pour s'éloigner de l'obstacle
-        if normal.x != 0:
-            if abs(player.velocity.x) < min_escape_velocity:
-                player.velocity.x = normal.x * min_escape_velocity
-
-        if normal.y != 0:
-            if abs(player.velocity.y) < min_escape_velocity:
-                player.velocity.y = normal.y * min_escape_velocity
+        if normal_speed < min_escape_velocity:
+            player.velocity += normal * (min_escape_velocity - normal_speed)
 
         # Limitation de la vitesse après collision pour éviter les accélérations excessives
         max_collision_speed = MAX_PLAYER_VELOCITY.length()
@@ -266,7 +302,7 @@ class Engine:
 
         # Informations de debug
         if DEBUG_MODE:
-            print(f"Collision: {player.name} a touché {collision_type} - Pen X: {pen_x}, Pen Y: {pen_y}")
+            print(f"Collision: {player.name} a touché un obstacle - Normale: ({normal.x:.2f}, {normal.y:.2f}), Pénétration: {penetration:.1f}")
             print(
                 f"  Position originale: ({original_position.x:.1f}, {original_position.y:.1f}) → Nouvelle position: ({player.position.x:.1f}, {player.position.y:.1f})")
             print(
@@ -283,181 +319,177 @@ class Engine:
                 'time': pygame.time.get_ticks(),
             })
 
-    def resolve_bonus(self):
+        return True
+
+    def resolve_bonus(self, player: Player) -> None:
         """
-        Vérifie et active les bonus lorsqu'un joueur passe dessus.
+        Vérifie et active les bonus lorsque le joueur passe dessus.
+        Seuls les emplacements proches (grille spatiale de la carte) sont testés, avec la distance au carré.
         """
-        for player in self.players:
-            for bonus in self.level.map.bonuses:
-                # Calcul de la distance entre le joueur et le bonus
-                diff_x, diff_y = player.position.x - bonus.x, player.position.y - bonus.y
-
-                # Utilisation de la distance euclidienne
-                distance = sqrt(diff_x ** 2 + diff_y ** 2)
+        for bonus in self.level.map.get_bonuses_around(player.position, BONUS_PICKUP_RADIUS):
+            diff_x, diff_y = player.position.x - bonus.x, player.position.y - bonus.y
 
-                # Si le joueur est suffisamment proche et que le bonus est disponible
-                if distance < (BALL_RADIUS + 5) and bonus.available:
-                    bonus.pick_bonus(player, self.players)
+            # Si le joueur est suffisamment proche et que le bonus est disponible
+            if diff_x * diff_x + diff_y * diff_y < BONUS_PICKUP_RADIUS * BONUS_PICKUP_RADIUS and bonus.available:
+                bonus.pick_bonus(player, self.players)
 
-    def resolve_player_bounce_collision(self, player: Player, tile) -> None:
+    def resolve_player_bounce_collision(self, player: Player, tile, dt: float = PHYSICS_DT) -> bool:
         """
         Gère la collision entre un joueur et une tuile bumper (ressort).
-        On simule un rebond avec une amplification de la vitesse.
+        On simule un rebond avec une amplification de la vitesse, sur la normale exacte du contact.
+        dt n'est pas utilisé : le rebond est instantané (même signature que les autres tuiles à contact).
+
+        :return: True s'il y avait un contact
         """
         # Le bonus fantôme permet de traverser les bumpers
-        if isinstance(player.bonus, BonusFantome) and player.bonus.active:
-            return
+        if player.modifiers.ghost:
+            return False
 
-        # Calcul de l'intersection
-        intersection = player.rect.clip(tile.rect)
+        contact = circle_rect_contact(player.position, player.radius, tile.rect)
+        if contact is None:
+            return False  # Pas de contact
+        normal, penetration = contact
 
         # Effet sonore de rebond
-        self.level.game.sound_manager.play_sound(SOUNDS["bounce"])
+        self.play_sound(SOUNDS["bounce"])
+
+        # On sort le joueur du bumper le long de la normale
+        player.position += normal * penetration
 
-        # Calcul des superpositions sur les deux axes
-        pen_x = intersection.width
-        pen_y = intersection.height
+        # On inverse la composante normale de la vitesse, amplifiée par la restitution du bumper
+        normal_speed = player.velocity.dot(normal)
+        if normal_speed < 0:
+            player.velocity -= normal * ((1 + self.terrains[tile.terrain].restitution) * normal_speed)
 
         # Variation aléatoire de l'angle (± 1 degré)
         angle_variation = random.uniform(-1, 1) * (math.pi / 180)  # Conversion degrés -> radians
 
-        # Résolution de la collision en X
-        if pen_x < pen_y:
-            # Collision horizontale
-            if player.rect.centerx < tile.rect.centerx:
-                # Joueur à gauche du bumper
-                player.position.x -= pen_x
-            else:
-                # Joueur à droite du bumper
-                player.position.x += pen_x
-
-            # On inverse la vélocité en X avec une légère variation d'angle
-            vx = -2 * player.velocity.x
-            vy = player.velocity.y
-
-            # Calcul de l'amplitude et de l'angle actuel
-            speed = math.sqrt(vx ** 2 + vy ** 2)
-            angle = math.atan2(vy, vx)
-
-            # Application de la variation d'angle
-            angle += angle_variation
-
-            # Recalcul des composantes de la vélocité
-            player.velocity.x = speed * math.cos(angle)
-            player.velocity.y = speed * math.sin(angle)
-
-        else:
-            # Collision verticale
-            if player.rect.centery < tile.rect.centery:
-                # Joueur au-dessus du bumper
-                player.position.y -= pen_y
-            else:
-                # Joueur en dessous du bumper
-                player.position.y += pen_y
-
-            # On inverse la vélocité en Y avec une légère variation d'angle
-            vx = player.velocity.x
-            vy = -2 * player.velocity.y
+        # Calcul de l'amplitude et de l'angle actuel
+        speed = player.velocity.length()
+        angle = math.atan2(player.velocity.y, player.velocity.x)
 
-            # Calcul de l'amplitude et de l'angle actuel
-            speed = math.sqrt(vx ** 2 + vy ** 2)
-            angle = math.atan2(vy, vx)
+        # Application de la variation d'angle
+        angle += angle_variation
 
-            # Application de la variation d'angle
-            angle += angle_variation
+        # Recalcul des composantes de la vélocité
+        player.velocity.x = speed * math.cos(angle)
+        player.velocity.y = speed * math.sin(angle)
 
-            # Recalcul des composantes de la vélocité
-            player.velocity.x = speed * math.cos(angle)
-            player.velocity.y = speed * math.sin(angle)
+        player.update()
+        return True
 
-    def resolve_player_speed_right(self, player: Player) -> None:
+    def reference_steps(self, dt: float) -> float:
         """
-        Accélère le joueur vers la droite.
+        Les effets appliqués à chaque pas (accélérateurs, aimant) sont réglés pour EFFECTS_REFERENCE_RATE pas par seconde.
+        Retourne le nombre de pas de référence contenus dans dt, pour que ces effets ne dépendent pas de PHYSICS_RATE.
         """
-        # Le bonus fantôme empêche l'effet d'accélération
-        if isinstance(player.bonus, BonusFantome) and player.bonus.active:
-            return
-
-        # Effet sonore de boost
-        self.level.game.sound_manager.play_sound(SOUNDS["boost"])
+        return dt * EFFECTS_REFERENCE_RATE
 
-        if player.velocity.x > 0:
-            # Si déjà en mouvement vers la droite, amplifie la vitesse
-            player.velocity.x = player.velocity.x * 1.1
-        else:
-            # Si en mouvement vers la gauche, réduit cette composante et ajoute une impulsion vers la droite
-            player.velocity.x = player.velocity.x * 0.9 + 10
+    def boost_steps(self, dt: float) -> float:
+        """
+        Nombre de pas de référence appliqués par un accélérateur pendant dt (BOOST_STRENGTH par pas de référence).
+        """
+        return self.reference_steps(dt) * BOOST_STRENGTH
 
-    def resolve_player_speed_left(self, player: Player) -> None:
+    def resolve_player_speed_collision(self, player: Player, tile, dt: float) -> bool:
         """
-        Accélère le joueur vers la gauche.
+        Accélère le joueur dans la direction de l'accélérateur (boost de son type de terrain).
+        Sur chaque axe du boost : si le joueur va déjà dans ce sens, sa vitesse est amplifiée,
+        sinon elle est réduite et on ajoute une impulsion dans ce sens.
+
+        :return: True s'il y avait un contact
         """
+        if not player.rect.colliderect(tile.rect):
+            return False  # Pas de contact
+
         # Le bonus fantôme empêche l'effet d'accélération
-        if isinstance(player.bonus, BonusFantome) and player.bonus.active:
-            return
+        if player.modifiers.ghost:
+            return False
 
         # Effet sonore de boost
-        self.level.game.sound_manager.play_sound(SOUNDS["boost"])
+        self.play_sound(SOUNDS["boost"])
 
-        if player.velocity.x > 0:
-            # Si en mouvement vers la droite, réduit cette composante et ajoute une impulsion vers la gauche
-            player.velocity.x = player.velocity.x * 0.9 - 10
-        else:
-            # Si déjà en mouvement vers la gauche, amplifie la vitesse
-            player.velocity.x = player.velocity.x * 1.1
+        steps = self.boost_steps(dt)
+        boost = self.terrains[tile.terrain].boost
 
-    def resolve_player_speed_down(self, player: Player) -> None:
+        for axis in (0, 1):
+            if boost[axis] == 0:
+                continue
+            if player.velocity[axis] * boost[axis] > 0:
+                # Si déjà en mouvement dans ce sens, amplifie la vitesse
+                player.velocity[axis] = player.velocity[axis] * 1.1 ** steps
+            else:
+                # Sinon, réduit cette composante et ajoute une impulsion dans le sens du boost
+                player.velocity[axis] = player.velocity[axis] * 0.9 ** steps + 10 * steps * boost[axis]
+        return True
+
+    def step(self, frame_dt: float) -> int:
         """
-        Accélère le joueur vers le bas.
+        Fait avancer la physique du temps écoulé depuis la dernière frame, par pas fixes de PHYSICS_DT.
+        Le temps restant est gardé pour la frame suivante, et l'affichage des joueurs est
+        interpolé entre les deux derniers états physiques.
+        Au-delà de MAX_PHYSICS_SUBSTEPS pas, le retard est abandonné (le jeu ralentit au lieu de figer).
+
+        :param frame_dt: Durée de la dernière frame (en secondes)
+        :return: Nombre de pas physiques effectués
         """
-        # Le bonus fantôme empêche l'effet d'accélération
-        if isinstance(player.bonus, BonusFantome) and player.bonus.active:
-            return
+        self.accumulator += frame_dt
+        substeps = 0
 
-        # Effet sonore de boost
-        self.level.game.sound_manager.play_sound(SOUNDS["boost"])
+        while self.accumulator >= PHYSICS_DT and substeps < MAX_PHYSICS_SUBSTEPS:
+            for player in self.players:
+                player.save_state()
+            self.update(PHYSICS_DT)
+            self.accumulator -= PHYSICS_DT
+            substeps += 1
 
-        if player.velocity.y > 0:
-            # Si déjà en mouvement vers le bas, amplifie la vitesse
-            player.velocity.y = player.velocity.y * 1.1
-        else:
-            # Si en mouvement vers le haut, réduit cette composante et ajoute une impulsion vers le bas
-            player.velocity.y = player.velocity.y * 0.9 + 10
+        if self.accumulator >= PHYSICS_DT:
+            self.accumulator %= PHYSICS_DT  # Trop de retard, on abandonne les pas en trop
 
-    def resolve_player_speed_up(self, player: Player) -> None:
+        # Position d'affichage entre l'état précédent et l'état actuel
+        alpha = self.accumulator / PHYSICS_DT
+        for player in self.players:
+            player.interpolate(alpha)
+
+        return substeps
+
+    def resolve_tile_collisions(self, player: Player, dt: float) -> None:
         """
-        Accélère le joueur vers le haut.
+        Résout en une seule passe les contacts du joueur avec les obstacles et les tuiles qui agissent au contact.
         """
-        # Le bonus fantôme empêche l'effet d'accélération
-        if isinstance(player.bonus, BonusFantome) and player.bonus.active:
-            return
+        # Collision avec les obstacles (bords de map), fusionnés en grands rectangles
+        # Un mur droit n'est donc résolu qu'une fois, sans accroche entre deux tuiles
+        for obstacle in self.level.map.get_colliders_around_rect(player.rect):
+            self.resolve_player_obstacle_collision(player, obstacle)
 
-        # Effet sonore de boost
-        self.level.game.sound_manager.play_sound(SOUNDS["boost"])
+        # Traitement des collisions avec les tuiles qui agissent au contact
+        # On ne teste que les tuiles des cellules autour du rectangle du joueur,
+        # et la méthode à appeler est lue dans la table des types de terrain
+        for tile in self.level.map.get_contact_tiles_around_rect(player.rect):
+            self.contact_handlers[tile.terrain](player, tile, dt)
 
-        if player.velocity.y > 0:
-            # Si en mouvement vers le bas, réduit cette composante et ajoute une impulsion vers le haut
-            player.velocity.y = player.velocity.y * 0.9 - 10
-        else:
-            # Si déjà en mouvement vers le haut, amplifie la vitesse
-            player.velocity.y = player.velocity.y * 1.1
+        player.update()
 
     def update(self, dt: float) -> None:
         """
-        Fonction principale qui met à jour la physique du jeu pour tous les joueurs.
+        Fonction principale qui met à jour la physique du jeu pour tous les joueurs (un pas de durée dt).
+        Les effets des bonus sont lus dans player.modifiers, publiés par les bonus eux-mêmes.
         """
+        now = time.time()  # Pour les bonus limités dans le temps (aimant)
 
         for player in self.players:
             # Si le joueur a terminé, on ignore ses calculs physiques
             if player.finished:
                 continue
 
-            #limitation de vitesse
-            if not isinstance(player.bonus,BonusSpeed):
-                max_velocity = 1200
-            else:
-                max_velocity = 2500
+            # Un joueur endormi ne coûte rien tant que rien ne le met en mouvement
+            if player.asleep:
+                if not self.should_wake(player):
+                    continue
+                player.wake()
 
+            #limitation de vitesse (plus haute avec le bonus de vitesse)
+            max_velocity = player.modifiers.max_velocity
             player.velocity.x = max(-max_velocity, min(player.velocity.x, max_velocity))
             player.velocity.y = max(-max_velocity, min(player.velocity.y, max_velocity))
 
@@ -468,83 +500,103 @@ class Engine:
 
             # Application du bonus aimant s'il est actif
             # Ce bonus attire le joueur vers le trou final
-            if isinstance(player.bonus, BonusAimant) and player.bonus.isActive():
-                self.apply_bonus_aimant(player)
+            if player.modifiers.is_attracted(now):
+                self.apply_bonus_aimant(player, dt)
 
             # Mise à jour du rectangle de collision du joueur
             player.update()
 
             # 2. Vérification des bonus à ramasser
-            self.resolve_bonus()
-
-            # 3. Gestion des collisions avec les tuiles
-            collision_detected = True
-            max_iterations = 3  # Limite le nombre de tentatives pour éviter les boucles infinies
-            iterations = 0
-
-            # Boucle de résolution des collisions (plusieurs passes possibles)
-            while collision_detected and iterations < max_iterations:
-                iterations += 1
-                collision_detected = False
-
-                # Traitement des collisions avec obstacles
-                for tile in self.level.map.tiles:
-                    # Collision avec obstacle (bord de map)
-                    if tile.id == "Collision" and player.rect.colliderect(tile.rect):
-                        self.resolve_player_obstacle_collision(player, tile)
-                        collision_detected = True
-                        # Mise à jour du rectangle du joueur
-                        player.update()
-
-                    # Collision avec bumper (ressort)
-                    elif tile.id == "Bounce" and player.rect.colliderect(tile.rect):
-                        self.resolve_player_bounce_collision(player, tile)
-                        collision_detected = True
-
-                    # Collision avec accélérateur vers la droite
-                    elif tile.id == "Speed_right" and player.rect.colliderect(tile.rect):
-                        self.resolve_player_speed_right(player)
-                        collision_detected = True
-
-                    # Collision avec accélérateur vers la gauche
-                    elif tile.id == "Speed_left" and player.rect.colliderect(tile.rect):
-                        self.resolve_player_speed_left(player)
-                        collision_detected = True
-
-                    # Collision avec accélérateur vers le bas
-                    elif tile.id == "Speed_down" and player.rect.colliderect(tile.rect):
-                        self.resolve_player_speed_down(player)
-                        collision_detected = True
-
-                    # Collision avec accélérateur vers le haut
-                    elif tile.id == "Speed_up" and player.rect.colliderect(tile.rect):
-                        self.resolve_player_speed_up(player)
-                        collision_detected = True
-
-                player.update()
-
-            # Si atteint nombre max d'itérations, le joueur pourrait être bloqué
-            if iterations == max_iterations and collision_detected:
-                # Application d'une petite impulsion aléatoire pour aider à sortir de cette situation
-                import random
-                player.velocity.x += random.uniform(-50, 50)
-                player.velocity.y += random.uniform(-50, 50)
-                player.update()
+            self.resolve_bonus(player)
+
+            # 3. Gestion des collisions avec les tuiles, en une seule passe
+            self.resolve_tile_collisions(player, dt)
 
             # 4. On vérifie que le joueur est sur la map et s'il à terminé
             self.resolve_out_of_bounds(player)  # Vérifie si le joueur est sorti du terrain
             self.is_on_finish(player)  # Vérifie si le joueur a atteint le trou
 
-        # 5. Gestion des collisions entre joueurs
-        for i in range(len(self.players)):
-            for j in range(i + 1, len(self.players)):
-                self.resolve_player_player_collision(self.players[i], self.players[j])
+            # 5. Le joueur s'endort s'il reste immobile assez longtemps
+            self.update_sleep(player, dt)
 
-        # 6. Mise à jour finale des joueurs
+        # 6. Gestion des collisions entre joueurs (deux joueurs endormis ne peuvent pas se toucher)
+        for player1, player2 in self.get_player_pairs():
+            if player1.asleep and player2.asleep:
+                continue
+            self.resolve_player_player_collision(player1, player2)
+
+        # 7. Mise à jour finale des joueurs
         for player in self.players:
             player.update()
 
-    def apply_bonus_aimant(self, player: Player):
+        # 8. Événement "tous à l'arrêt", une seule fois quand le dernier joueur s'arrête
+        self.update_rest_state()
+
+    def update_player_hash(self) -> None:
+        """
+        Met à jour la grille spatiale (rangée par indice de joueur) : seuls les joueurs qui ont changé
+        de case y sont déplacés, et ceux qui ont terminé en sont retirés.
+        """
+        for index, player in enumerate(self.players):
+            if player.finished:
+                self.player_hash.remove(index)
+            else:
+                self.player_hash.move(index, player.position)
+
+    def get_player_pairs(self) -> list[tuple[Player, Player]]:
+        """
+        Paires de joueurs assez proches pour se toucher, dans l'ordre de la liste des joueurs
+        (comme l'ancienne boucle sur toutes les paires, pour que les résultats ne changent pas).
+        Les contacts créés pendant la résolution elle-même (balles poussées très loin) attendent le pas suivant.
+        """
+        self.update_player_hash()
+        pairs = sorted((i, j) if i < j else (j, i) for i, j in self.player_hash.pairs())
+        return [(self.players[i], self.players[j]) for i, j in pairs]
+
+    def get_players_around(self, position, radius: float) -> list[Player]:
+        """
+        Joueurs en jeu qui peuvent être à moins de radius d'une position (pré-sélection par la grille spatiale).
+        La grille est à jour depuis le dernier pas physique.
+        """
+        return [self.players[index] for index in self.player_hash.query_radius(position, radius)]
+
+    def should_wake(self, player: Player) -> bool:
+        """
+        Indique si un joueur endormi doit se réveiller: quelque chose l'a mis en mouvement
+        (collision, explosion...) ou le bonus aimant l'attire vers le trou.
+        """
+        if player.velocity.length_squared() > VELOCITY_THRESHOLD ** 2:
+            return True
+        return player.modifiers.is_attracted(time.time())
+
+    def update_sleep(self, player: Player, dt: float) -> None:
+        """
+        Endort le joueur quand sa vitesse reste sous VELOCITY_THRESHOLD pendant SLEEP_DELAY secondes.
+        Il est alors retiré des calculs physiques jusqu'à ce que quelque chose le touche.
+        """
+        if self.should_wake(player):
+            player.rest_time = 0.0
+            return
+
+        player.rest_time += dt
+        if player.rest_time >= SLEEP_DELAY:
+            player.sleep()
+
+    def update_rest_state(self) -> None:
+        """
+        Met à jour self.at_rest et prévient le rest_sink quand tous les joueurs viennent de s'arrêter.
+        """
+        for player in self.players:
+            if not player.finished and not player.asleep and player.velocity.length_squared() > VELOCITY_THRESHOLD ** 2:
+                self.at_rest = False
+                return
+
+        if not self.at_rest:
+            self.at_rest = True
+            if self.rest_sink is not None:
+                self.rest_sink()
+
+    def apply_bonus_aimant(self, player: Player, dt: float):
         """
         Applique le bonus d'aimant qui attire le joueur vers le trou.
         """
@@ -561,4 +613,4 @@ class Engine:
         attraction_force = direction.normalize() * (1 / max(direction.length(), 0.001) * 5) * 100
 
         # Application de la force
-        player.velocity += attraction_force
+        player.velocity += attraction_force * self.reference_steps(dt)
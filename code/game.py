@@ -1,12 +1,19 @@
 import os
 
+import pygame_gui
+
 from settings import *
+from assets import ASSETS, get_image
 from pygame.locals import *
 from scene_config import ConfigurationScene
 from scene_manager import SceneManager
 from scene_play import PlayScene
 from scene_start_menu import StartMenuScene
-from sound import SoundManager
+from sound import SoundManager, load_sound
+from startup import StartupLoader
+from ui_text import get_font
+from bonus_manager import preload_bonus_gifs
+from map_cache import load_compiled_map
 from pygame_gui.core import ObjectID
 from interface_manager import InterfaceManager
 
@@ -35,22 +42,52 @@ class Game:
         self.clock = pygame.time.Clock()
         self.dt = DELTA_TIME  # Temps entre les updates de pygame
 
-        if not DEBUG_MODE:
-            # Affichage du splash screen de lancement
-            self.screen.blit(SPLASH_SCREEN, (0, 0))
-            pygame.display.flip()
-
         self.maps = MAPS
         self.game_info = dict()  # Infos d'une partie
+        self.error_window = None  # Pour afficher des messages d'erreur
 
-        # Audio : lance la musique de lancement
-        self.sound_manager = SoundManager()
-        self.sound_manager.play_music(MUSICS["launch"], loops=0)
+        # Construits pendant le chargement (voir les méthodes build_*)
+        self.ui_manager: pygame_gui.UIManager = None
+        self.sound_manager: SoundManager = None
+        self.scene_manager: SceneManager = None
+        self.interface_manager: InterfaceManager = None
 
-        # Gestionnaire d'interface UI avec pygame_gui
-        self.ui_manager = pygame_gui.UIManager((WINDOW_WIDTH, WINDOW_HEIGHT), theme_path="../data/ui-theme.json")
+        # Chargement pendant l'affichage du splash screen (sauf en debug) : les fichiers sont décodés
+        # dans un pool de threads, l'interface est construite en même temps sur le thread principal
+        startup = StartupLoader(self.screen, show=not DEBUG_MODE)
+        startup.draw()
+
+        # Audio : lance la musique de lancement
+        SoundManager.play_music(MUSICS["launch"], loops=0)
+
+        images = [startup.submit(ASSETS.get, name) for name in IMAGES_WARM_UP]
+        sounds = [startup.submit(load_sound, sound_path) for sound_path in SOUNDS.values()]
+        # GIFs des bonus et cartes compilées : seulement utiles en partie, le menu ne les attend pas
+        # (load_compiled_map ne compile qu'une fois une carte demandée aussi par le préchargement des niveaux)
+        startup.submit(preload_bonus_gifs, required=False)
+        for map_info in self.maps.values():
+            startup.submit(load_compiled_map, map_info["path"], required=False)
+
+        # Les polices restent sur le thread principal : SDL_ttf partage une seule bibliothèque FreeType
+        for font_size in STARTUP_FONT_SIZES:
+            startup.call(get_font, FONT_PATH, font_size)
+        startup.call(self.build_ui_manager)
+        startup.call(self.build_sound_manager, after=sounds)
+        startup.call(self.build_scenes, after=images)
+        if not startup.run():
+            self.running = False  # Fenêtre fermée pendant le chargement
+
+    def build_ui_manager(self):
+        """Gestionnaire d'interface UI avec pygame_gui (lecture du thème)"""
+        self.ui_manager = pygame_gui.UIManager((WINDOW_WIDTH, WINDOW_HEIGHT), theme_path=UI_THEME_PATH)
         self.ui_manager.set_visual_debug_mode(DEBUG_MODE)
 
+    def build_sound_manager(self):
+        """Gestionnaire audio, une fois les sons décodés"""
+        self.sound_manager = SoundManager()
+
+    def build_scenes(self):
+        """Création des scènes et des interfaces "règles" et "crédits", puis affichage de la première scène"""
         # Gestionnaire de scènes
         # On charge les trois scènes principales
         self.scene_manager = SceneManager()
@@ -58,6 +95,11 @@ class Game:
         self.scene_manager.add("config_scene", ConfigurationScene(2, self))
         self.scene_manager.add("play_scene", PlayScene(3, self))
 
+        # Création des interfaces "règles" et "crédits"
+        self.interface_manager = InterfaceManager()
+        self.build_rules_window()
+        self.build_credits_window()
+
         # En mode debug on saute le menu et on va directement dans la scène de jeu
         if DEBUG_MODE:
             self.game_info = DEBUG_CONFIG
@@ -65,17 +107,6 @@ class Game:
         else:
             self.scene_manager.change("start_menu_scene")
 
-        self.error_window = None  # Pour afficher des messages d'erreur
-
-        # Petite pause avant avant d'afficher le menu principal
-        # C'est utile pour afficher le splash screen
-        pygame.time.wait(3000)
-
-        # Création des interfaces "règles" et "crédits"
-        self.interface_manager = InterfaceManager()
-        self.build_rules_window()
-        self.build_credits_window()
-
     def run(self):
         # Boucle principale du jeu
         clock = pygame.time.Clock()
@@ -150,7 +181,7 @@ class Game:
         pygame_gui.elements.UIImage(
             starting_height=11,
             relative_rect=(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT),
-            image_surface=RULES_IMAGE,
+            image_surface=get_image("RULES_IMAGE"),
             manager=self.ui_manager,
             image_is_alpha_premultiplied=False,
             container=container,
@@ -187,7 +218,7 @@ class Game:
         pygame_gui.elements.UIImage(
             starting_height=14,
             relative_rect=(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT),
-            image_surface=CREDITS_IMAGE,
+            image_surface=get_image("CREDITS_IMAGE"),
             manager=self.ui_manager,
             image_is_alpha_premultiplied=False,
             container=container,
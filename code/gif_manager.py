@@ -61,12 +61,12 @@ class Gif:
 
         self.current_duration = self.durations[0] if self.max_frame > 0 else 100
 
-    def update(self, surface: pygame.Surface):
+    def update(self, surface: pygame.Surface, offset: tuple[int, int] = (0, 0)):
         if self.hide or self.max_frame == 0:
             return
 
-        # Afficher la frame actuelle
-        surface.blit(self.frames[self.current_frame], (self.x, self.y))
+        # Afficher la frame actuelle (offset permet de dessiner sur une surface qui ne part pas de (0, 0))
+        surface.blit(self.frames[self.current_frame], (self.x + offset[0], self.y + offset[1]))
 
         current_time = pygame.time.get_ticks()
         if current_time - self.last_update < self.current_duration:
@@ -79,6 +79,12 @@ class Gif:
         # Mettre à jour la durée pour la prochaine frame
         self.current_duration = self.durations[self.current_frame]
 
+    def get_rect(self) -> pygame.Rect:
+        """Retourne le rectangle occupé par la frame actuelle"""
+        if self.max_frame == 0:
+            return pygame.Rect(self.x, self.y, 0, 0)
+        return self.frames[self.current_frame].get_rect(topleft=(self.x, self.y))
+
     def reset(self):
         """Réinitialise l'animation"""
         self.current_frame = 0
@@ -8,6 +8,7 @@ import pygame
 from bonus_manager import BonusSpeed, BonusType, BonusFantome, BonusAimant, BonusExplosion
 from bonus_manager import BonusSpeed, BonusType
 from engine import Engine
+from predictor import RollOutPredictor
 from score import ScoreManager
 from broadcast import BroadcastManager
 from player import Player
@@ -24,7 +25,10 @@ class Level:
 
         self.map: Map = map_obj
         self.players: list[Player] = players
-        self.engine: Engine = Engine(self)
+        self.engine: Engine = Engine(self,
+                                     sound_sink=self.game.sound_manager.play_sound,
+                                     respawn_sink=self.centerOnPlayer,
+                                     rest_sink=self.on_all_at_rest)
         self.score_manager: ScoreManager = score_manager
         self.broadcast_manager: BroadcastManager = broadcast_manager
 
@@ -32,6 +36,8 @@ class Level:
         self.cur_player_index: int = 0
         self.cur_player: Player = None
         self.shot_taken: bool = False  # Indique si le joueur actif a joué
+        self.fast_forward: bool = False  # Passe l'animation du tir en cours (touche F)
+        self.predictor: RollOutPredictor = None  # Construit au premier passage d'animation
 
         # Variables pour la ligne de visée
         self.dragging: bool = False
@@ -44,7 +50,8 @@ class Level:
         # Configuration des surfaces et des gifs
         self.map_size = (self.map.map_width, self.map.map_height)
         self.overlay_surf: pygame.surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert_alpha()
-        self.map_surf: pygame.surface = pygame.Surface(self.map_size).convert()
+        # Surface de travail des éléments dynamiques (voir draw_world_element), agrandie au besoin
+        self.element_surf: pygame.Surface = None
         self.bonus_gifs: list[str] = []
         self.debug_collisions = []
         self.debug_grid = False
@@ -75,8 +82,9 @@ class Level:
 
     def load_graphics(self):
         """Charge les ressources graphiques comme les GIFs"""
-        # Chargement des GIFs des bonus
-        self.map.load_gif_bonuses(self.map_surf)
+        # Les animations des GIFs des bonus démarrent avec le niveau
+        for bonus in self.map.bonuses:
+            bonus.gif.reset()
         # self.gif_manager.add_gif("../asset/GIF/Cactus.gif", 1511, 153, .5, True, False)
 
     def process_event(self, event):
@@ -89,9 +97,17 @@ class Level:
             elif event.key == pygame.K_h:
                 self.cur_player.position.x = self.map.hole.x
                 self.cur_player.position.y = self.map.hole.y
+                self.cur_player.wake()  # Pour que le moteur voie le joueur dans le trou
             elif event.key == pygame.K_e:
-                if isinstance(self.cur_player.bonus, BonusType):
+                if isinstance(self.cur_player.bonus, BonusExplosion):
+                    # L'explosion ne touche que les joueurs proches, trouvés par la grille spatiale du moteur
+                    targets = self.engine.get_players_around(self.cur_player.position, EXPLOSION_RADIUS)
+                    self.cur_player.bonus.consume_bonus(self.cur_player, targets, self.overlay_surf)
+                elif isinstance(self.cur_player.bonus, BonusType):
                     self.cur_player.bonus.consume_bonus(self.cur_player, self.players, self.overlay_surf)
+            elif event.key == pygame.K_f:
+                if self.shot_taken:
+                    self.fast_forward = True
             elif event.key == pygame.K_o:
                 self.debug_grid = not self.debug_grid
         # Si bouton gauche de la souris est enfoncé
@@ -142,39 +158,45 @@ class Level:
         """Met à jour les différents éléments du jeu"""
         self.update_bonuses()
         self.map.camera.animator.update()
-        self.engine.update(dt)
-
-    def update_gifs(self):
-        """Met à jour les animations GIF"""
-        self.map.load_gif_bonuses(self.map_surf)
-        self.cur_player.update_gifs(self.overlay_surf)
+        if self.fast_forward:
+            # Animation passée : le tir est résolu d'un coup, avec les mêmes pas que d'habitude
+            if self.predictor is None:
+                self.predictor = RollOutPredictor(self.engine)
+            self.predictor.run_until_rest(PHYSICS_DT, FAST_FORWARD_MAX_STEPS)
+        else:
+            # La physique avance par pas fixes, quel que soit le temps de la frame
+            self.engine.step(dt)
 
     def update_bonuses(self):
         """Met à jour les bonus"""
         for bonus in self.map.bonuses:
-            bonus.update_bonus(self.map_surf)
+            bonus.update_bonus()
 
         # Gestion des bonus du joueur actuel
         if isinstance(self.cur_player.bonus, BonusType):
             self.bonus_gifs.append(self.cur_player.bonus.icon_id)
 
     def check_turn_end(self):
-        """Vérifie si le tour est terminé et passe au joueur suivant."""
+        """
+        Suit les joueurs pendant le tour. Le passage au joueur suivant est déclenché par
+        l'événement "tous à l'arrêt" du moteur (on_all_at_rest), sans parcourir les vitesses à chaque frame.
+        """
         if self.shot_taken:
             self.centerOnPlayers(self.players)
 
-            # Vérifier si tous les joueurs sont immobiles
-            is_next_turn = True
-            for player in self.players:
-                if player.velocity.length() > VELOCITY_THRESHOLD:
-                    is_next_turn = False
-                    break
-            if is_next_turn:
+            # Le joueur actif a terminé sans tirer et rien ne bouge : aucun événement ne viendra
+            if self.cur_player.finished and self.engine.at_rest:
                 self.next_turn()
 
+    def on_all_at_rest(self):
+        """Appelée par le moteur quand tous les joueurs viennent de s'arrêter"""
+        if self.shot_taken:
+            self.next_turn()
+
     def next_turn(self):
         """Passe au tour du joueur suivant."""
         self.shot_taken = False
+        self.fast_forward = False
 
         # Recherche du prochain joueur actif
         for i in range(len(self.players)):
@@ -231,54 +253,49 @@ class Level:
         zoom = self.map.camera.zoom_factor
         center = (screen.get_width() / 2, screen.get_height() / 2)
 
-        # Réinitialise les surfaces
-        self.map_surf.fill("#BDDFFF")
+        # Réinitialise la surface de l'overlay
         self.overlay_surf.fill((0, 0, 0, 0))
 
-        self.draw_map_elements()
-        self.draw_players()
+        # Le fond puis les éléments dynamiques sont directement rendus à l'écran avec le zoom
+        self.draw_map_background(screen, center, zoom)
+        self.draw_map_elements(screen, center, zoom)
+        self.draw_players(screen, center, zoom)
         self.draw_aiming_line(center, zoom)
 
-        # Application du zoom et rendu final
-        self.render_map_to_screen(screen, center, zoom)
-
-    def draw_map_elements(self):
-        """Dessine les éléments de la carte"""
-        # Dessiner les tuiles
-        for tile in self.map.tiles:
-            if tile.id in {"Collision", "Bounce"} and not DEBUG_MODE:
-                continue
-            tile.draw(self.map_surf)
-
+    def draw_map_elements(self, screen, center, zoom):
+        """Dessine les éléments dynamiques de la carte (les tuiles sont dans les chunks du fond)"""
         # Dessiner le trou
-        pygame.draw.circle(
-            surface=self.map_surf,
+        hole_rect = pygame.Rect(self.map.hole.x - 20, self.map.hole.y - 20, 40, 40)
+        self.draw_world_element(screen, center, zoom, hole_rect, lambda surface, offset: pygame.draw.circle(
+            surface=surface,
             color=pygame.Color("black"),
-            center=(self.map.hole.x, self.map.hole.y),
+            center=(self.map.hole.x + offset[0], self.map.hole.y + offset[1]),
             radius=20
-        )
-
+        ))
 
         # Dessiner les bonus
         for bonus in self.map.bonuses:
-            bonus.draw_bonus(self.map_surf)
+            self.draw_world_element(screen, center, zoom, bonus.gif.get_rect(), bonus.draw_bonus)
 
-    def draw_players(self):
+    def draw_players(self, screen, center, zoom):
         """Dessine les joueurs et met en évidence le joueur actif"""
         # Dessiner tous les joueurs
         for player in self.players:
             if not player.finished:
-                player.draw(self.map_surf)
+                self.draw_world_element(screen, center, zoom, player.render_rect, player.draw)
 
         # Cerclage du joueur actif s'il n'a pas encore joué
         if not self.shot_taken and not self.cur_player.finished:
-            pygame.draw.circle(
-                surface=self.map_surf,
+            radius = self.cur_player.radius + 5
+            circle_rect = pygame.Rect(0, 0, 2 * radius + 1, 2 * radius + 1)
+            circle_rect.center = self.cur_player.render_rect.center
+            self.draw_world_element(screen, center, zoom, circle_rect, lambda surface, offset: pygame.draw.circle(
+                surface=surface,
                 color=pygame.Color("white"),
-                center=self.cur_player.rect.center,
-                radius=self.cur_player.radius + 5,
+                center=(self.cur_player.render_rect.centerx + offset[0], self.cur_player.render_rect.centery + offset[1]),
+                radius=radius,
                 width=2
-            )
+            ))
 
     def draw_aiming_line(self, center, zoom):
         """Dessine la ligne de visée pour le tir"""
@@ -293,19 +310,114 @@ class Level:
                 width=line_width
             )
 
-    def render_map_to_screen(self, screen, center, zoom):
-        """Applique le zoom et rend la carte sur l'écran"""
-        resize_size = (int(self.map_size[0] * zoom), int(self.map_size[1] * zoom))
-        if zoom == DEFAULT_ZOOM:
-            map_surf_resized = self.map_surf
-        else:
-            map_surf_resized = pygame.transform.scale(self.map_surf, resize_size)
+    def get_map_screen_position(self, center, zoom):
+        """Position à l'écran du coin haut gauche de la carte"""
+        return (
+            center[0] - int(self.map.camera.offset_X * zoom),
+            center[1] - int(self.map.camera.offset_Y * zoom)
+        )
 
-        zoom_offset_x = int(self.map.camera.offset_X * zoom)
-        zoom_offset_y = int(self.map.camera.offset_Y * zoom)
-        m_x = center[0] - zoom_offset_x
-        m_y = center[1] - zoom_offset_y
-        screen.blit(map_surf_resized, (m_x, m_y))
+    def draw_map_background(self, screen, center, zoom):
+        """
+        Rend le fond de la carte sur l'écran.
+        Seuls les chunks qui touchent la zone visible par la caméra sont dessinés,
+        et seule leur partie visible est redimensionnée : le coût par frame dépend
+        de la taille de l'écran et non de celle de la carte.
+        """
+        chunks = self.map.chunks
+        map_pos = self.get_map_screen_position(center, zoom)
+        # Petite marge pour absorber les arrondis de la position de la carte à l'écran
+        visible_rect = self.map.camera.visible_world_rect(margin=2)
+        level_zoom = chunks.get_level_zoom(zoom)
+
+        for chunk_x, chunk_y in chunks.get_visible_chunks(visible_rect):
+            chunk_rect = chunks.get_chunk_rect(chunk_x, chunk_y)
+            self.blit_world_surface(
+                screen,
+                chunks.get_chunk(chunk_x, chunk_y, level_zoom),
+                level_zoom,
+                chunk_rect.topleft,
+                chunk_rect.clip(visible_rect),
+                map_pos,
+                zoom
+            )
+
+    def draw_world_element(self, screen, center, zoom, world_rect, draw_function):
+        """
+        Dessine un élément dynamique de la carte à l'écran.
+        L'élément est dessiné en taille réelle sur une surface transparente (réutilisée d'une frame à l'autre),
+        qui est ensuite redimensionnée avec le zoom de la caméra.
+
+        :param world_rect: Zone occupée par l'élément (coo monde)
+        :param draw_function: Fonction (surface, offset) qui dessine l'élément
+        """
+        visible_rect = self.map.camera.visible_world_rect(margin=2)
+        if not world_rect.colliderect(visible_rect):
+            return  # Élément hors de l'écran
+
+        element_surf = self.get_element_surface(world_rect.size)
+        draw_function(element_surf, (-world_rect.x, -world_rect.y))
+        self.blit_world_surface(
+            screen,
+            element_surf,
+            DEFAULT_ZOOM,
+            world_rect.topleft,
+            world_rect.clip(visible_rect),
+            self.get_map_screen_position(center, zoom),
+            zoom
+        )
+
+    def get_element_surface(self, size) -> pygame.Surface:
+        """
+        Retourne une surface transparente vide de la taille demandée, sans allocation à chaque frame :
+        c'est une sous-surface de self.element_surf, agrandie seulement pour un élément plus grand que les autres.
+        """
+        width, height = size
+        current_width, current_height = self.element_surf.get_size() if self.element_surf is not None else (0, 0)
+        if width > current_width or height > current_height:
+            self.element_surf = pygame.Surface((max(width, current_width), max(height, current_height)),
+                                               pygame.SRCALPHA)
+
+        surface = self.element_surf.subsurface((0, 0, width, height))
+        surface.fill((0, 0, 0, 0))
+        return surface
+
+    def blit_world_surface(self, screen, source, source_zoom, source_pos, world_rect, map_pos, zoom):
+        """
+        Affiche à l'écran une partie d'une surface placée dans le monde.
+
+        :param source: Surface à afficher, à l'échelle source_zoom
+        :param source_zoom: Échelle de la surface (1 = taille réelle)
+        :param source_pos: Position dans le monde du coin haut gauche de la surface
+        :param world_rect: Partie à afficher (coo monde)
+        :param map_pos: Position à l'écran du coin haut gauche de la carte
+        :param zoom: Zoom de la caméra
+        """
+        # Zone correspondante dans la surface source
+        src_left = max(0, math.floor((world_rect.left - source_pos[0]) * source_zoom))
+        src_top = max(0, math.floor((world_rect.top - source_pos[1]) * source_zoom))
+        src_right = min(source.get_width(), math.ceil((world_rect.right - source_pos[0]) * source_zoom))
+        src_bottom = min(source.get_height(), math.ceil((world_rect.bottom - source_pos[1]) * source_zoom))
+        if src_right <= src_left or src_bottom <= src_top:
+            return
+
+        # Position à l'écran des bords de la zone une fois zoomée
+        scale = zoom / source_zoom
+        origin_x = map_pos[0] + source_pos[0] * zoom
+        origin_y = map_pos[1] + source_pos[1] * zoom
+        dest_left = round(origin_x + src_left * scale)
+        dest_top = round(origin_y + src_top * scale)
+        dest_size = (round(origin_x + src_right * scale) - dest_left,
+                     round(origin_y + src_bottom * scale) - dest_top)
+        if dest_size[0] <= 0 or dest_size[1] <= 0:
+            return
+
+        area = pygame.Rect(src_left, src_top, src_right - src_left, src_bottom - src_top)
+        if dest_size == area.size:
+            # La surface est déjà à la bonne échelle, un simple blit suffit
+            screen.blit(source, (dest_left, dest_top), area)
+        else:
+            screen.blit(pygame.transform.scale(source.subsurface(area), dest_size), (dest_left, dest_top))
 
     def draw(self, screen):
         """Dessine le niveau complet sur l'écran."""
@@ -321,7 +433,7 @@ class Level:
 
     def reset_bonuses(self):
         for player in self.players:
-            player.bonus = None
+            player.clear_bonus()
 
     def centerOnPlayer(self, player: Player):
         """Centre la caméra sur un joueur"""
@@ -516,26 +628,29 @@ class Level:
             return
 
         # Only render tiles that are visible
-        for tile in self.map.tiles:
-            if camera.is_world_position_on_screen(tile.rect.centerx, tile.rect.centery):
+        for layer in self.map.layers:
+            for x, y, gid in layer.iter_tiles():
+                tile_rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, *self.map.tile_sizes[gid])
+                if not camera.is_world_position_on_screen(tile_rect.centerx, tile_rect.centery):
+                    continue
                 # Convert to screen coordinates
                 screen_rect = pygame.Rect(
-                    *camera.world_to_screen(tile.rect.left, tile.rect.top),
-                    tile.rect.width * camera.zoom_factor,
-                    tile.rect.height * camera.zoom_factor
+                    *camera.world_to_screen(tile_rect.left, tile_rect.top),
+                    tile_rect.width * camera.zoom_factor,
+                    tile_rect.height * camera.zoom_factor
                 )
 
                 # Draw tile outline
-                color = (255, 0, 0) if tile.id == "Collision" else (
-                    (0, 0, 255) if tile.id == "Water" else
-                    (0, 255, 0) if tile.id == "Grass" else (100, 100, 100))
+                color = (255, 0, 0) if layer.name == "Collision" else (
+                    (0, 0, 255) if layer.name == "Water" else
+                    (0, 255, 0) if layer.name == "Grass" else (100, 100, 100))
 
                 pygame.draw.rect(screen, color, screen_rect, 1)
 
                 # Render tile ID for debugging - only when zoomed in enough
                 if camera.zoom_factor > 0.7:
                     font = pygame.font.Font(None, 18)
-                    text = font.render(tile.id, True, (255, 255, 255))
+                    text = font.render(layer.name, True, (255, 255, 255))
                     text_rect = text.get_rect(center=screen_rect.center)
 
                     # Add semi-transparent background for text
@@ -1,89 +1,279 @@
+from operator import attrgetter, itemgetter
+
 from settings import *
-import pytmx
+import numpy as np
 from camera import Camera
-from bonus_manager import Bonus
+from bonus_manager import Bonus, preload_bonus_gifs
 from broadcast import BroadcastManager
 from tile import Tile
+from terrain import build_terrain_table, get_terrain_id
+from map_cache import CompiledMap, load_compiled_map
+from chunk_cache import ChunkCache
+from spatial_hash import SpatialHash
+from tile_atlas import TileAtlas
+
+
+class TileLayer:
+    """Calque de tuiles de la carte, gardé tel quel : une grille de gids au lieu d'un objet par tuile"""
+
+    def __init__(self, name: str, grid: np.ndarray):
+        """
+        :param name: Nom du calque Tiled ("Grass", "Collision", ...)
+        :param grid: Tableau (lignes, colonnes) des gids, 0 pour une case vide
+        """
+        self.name = name
+        self.terrain = get_terrain_id(name)  # Identifiant du type de terrain (voir terrain.py)
+        self.grid = grid
 
+    def iter_tiles(self):
+        """Parcourt les cases non vides, ligne par ligne : générateur de (colonne, ligne, gid)"""
+        for y, x in zip(*np.nonzero(self.grid)):
+            yield int(x), int(y), int(self.grid[y, x])
 
-def load_tiled_map(map_path: str, tile_size: int, broadcast: BroadcastManager):
+
+def load_tiled_layers(compiled_map: CompiledMap):
     """
-    Charge une carte Tiled à partir d’un fichier .tmx et crée tous les objets nécessaires
+    Lit les calques de tuiles et les objets d'une carte Tiled compilée (voir map_cache.py), sans aucune image.
+    N'utilise ni l'écran ni le mixer : sert à la simulation sans affichage et au préchargement (voir MapPreloader).
 
-    :param map_path: Chemin vers le fichier de la carte (.tmx)
-    :param tile_size: Taille d’une tuile (en pixels)
-    :param broadcast: Gestionnaire de broadcast
-    :return: Tuple avec groupe de tuiles, point du spawn, du trou, et liste des bonus
+    :param compiled_map: Carte compilée
+    :return: Tuple avec les calques, la taille de l'image de chaque gid, le spawn, le trou
+             et la liste des emplacements de bonus
     """
-    tmx_data = pytmx.load_pygame(map_path)
-    tiles = pygame.sprite.Group()
-    bonuses = []
+    bonus_objects = []
     spawn, hole = None, None
 
-    # Parcours de chaque "calque" de la carte
-    for layer in tmx_data.layers:
-        # Si le calque contient des objets (comme le spawn, le trou ou les bonus)
-        if layer.name == "Objects":
-            for obj in layer:
-                if obj.name == "spawn":
-                    spawn = obj  # Enregistre le point de spawn
-                elif obj.name == "hole":
-                    hole = obj  # Enregistre le point du trou
-                elif obj.name == "bonus":
-                    b = Bonus(obj, broadcast)  # Crée un objet bonus
-                    if DEBUG_MODE:
-                        b.print_bonus_log()
-                    bonuses.append(b)  # Ajoute à la liste des bonus
-
-        if isinstance(layer, pytmx.TiledTileLayer):
-            for x, y, gid in layer:
-                if gid != 0:
-                    tile_image = tmx_data.get_tile_image_by_gid(gid)  # Récupère l’image de la tuile
-                    tile_image = pygame.Surface.convert(tile_image)
-                    # Crée la tuile
-                    tile = Tile(
-                        tile_type_id=layer.name,
-                        x=x * tile_size,
-                        y=y * tile_size,
-                        width=tile_size,
-                        height=tile_size,
-                        image=tile_image,
-                    )
-                    tiles.add(tile)  # Ajoute la tuile au groupe de sprites
-
-    return tiles, spawn, hole, bonuses
-
-
-class Map:
-    def __init__(self, infos: dict, screen: pygame.Surface, broadcast: BroadcastManager):
+    # Objets du calque "Objects" (comme le spawn, le trou ou les bonus)
+    for obj in compiled_map.objects:
+        if obj.layer != "Objects":
+            continue
+        if obj.name == "spawn":
+            spawn = obj  # Enregistre le point de spawn
+        elif obj.name == "hole":
+            hole = obj  # Enregistre le point du trou
+        elif obj.name == "bonus":
+            bonus_objects.append(obj)  # Les bonus sont créés sur le thread principal (Map.finish_loading)
+
+    layers = [TileLayer(name, grid) for name, _, grid in compiled_map.layers]
+    tile_sizes = {gid: compiled_map.get_tile_size(gid) for gid in compiled_map.tiles}
+    return layers, tile_sizes, spawn, hole, bonus_objects
+
+
+def get_rect_cells(rect: pygame.Rect, tile_size: int):
+    """
+    Parcourt les cellules de la grille touchées par un rectangle.
+
+    :param rect: Rectangle dans le monde
+    :param tile_size: Taille d’une cellule (en pixels)
+    :return: Générateur de cellules (colonne, ligne)
+    """
+    for cell_y in range(rect.top // tile_size, (rect.bottom - 1) // tile_size + 1):
+        for cell_x in range(rect.left // tile_size, (rect.right - 1) // tile_size + 1):
+            yield cell_x, cell_y
+
+
+def build_tile_index(tiles: list, tile_size: int, get_rect=attrgetter("rect")) -> dict:
+    """
+    Construit un index des tuiles par cellule de la grille.
+    L'ordre de la liste (calque par calque) est conservé dans chaque cellule,
+    ce qui donne la priorité des calques lors des requêtes sur le terrain.
+    Les images des tuiles peuvent déborder de la grille (64px pour une grille de 63px),
+    une tuile est donc référencée dans toutes les cellules que son rect touche.
+
+    :param tiles: Tuiles à indexer (objets Tile, ou couples (rect, terrain) avec get_rect=itemgetter(0))
+    :param tile_size: Taille d’une tuile (en pixels)
+    :param get_rect: Fonction qui donne le rect d'une tuile
+    :return: Dictionnaire {(colonne, ligne): [tuiles...]}
+    """
+    tile_index = dict()
+    for tile in tiles:
+        for cell in get_rect_cells(get_rect(tile), tile_size):
+            if cell not in tile_index:
+                tile_index[cell] = []
+            tile_index[cell].append(tile)
+    return tile_index
+
+
+def merge_collision_tiles(layers: list[TileLayer], tile_sizes: dict, tile_size: int, terrains: list) -> list:
+    """
+    Fusionne les tuiles d'obstacles ("Collision") voisines en le moins de rectangles possible (méthode gloutonne).
+    On part de chaque cellule libre (ligne par ligne), on s'étend vers la droite,
+    puis vers le bas tant que toute la ligne de cellules est disponible.
+    Les rectangles couvrent exactement la même zone que les rects des tuiles fusionnées.
+
+    :param layers: Calques de tuiles de la carte
+    :param tile_sizes: Taille de l'image de chaque gid
+    :param tile_size: Taille d’une tuile (en pixels)
+    :param terrains: Types de terrain de la carte (voir build_terrain_table), qui disent quels calques sont solides
+    :return: Liste de rectangles (pygame.Rect) des obstacles
+    """
+    cells = dict()  # {(colonne, ligne): taille de l'image de la tuile}
+    for layer in layers:
+        if terrains[layer.terrain].solid:
+            for x, y, gid in layer.iter_tiles():
+                cells[(x, y)] = tile_sizes[gid]
+
+    colliders = []
+    used = set()
+    for cell_x, cell_y in sorted(cells, key=lambda cell: (cell[1], cell[0])):
+        if (cell_x, cell_y) in used:
+            continue
+
+        # Extension vers la droite
+        width = 1
+        while (cell_x + width, cell_y) in cells and (cell_x + width, cell_y) not in used:
+            width += 1
+
+        # Extension vers le bas, tant que toute la ligne est libre
+        height = 1
+        while all((x, cell_y + height) in cells and (x, cell_y + height) not in used
+                  for x in range(cell_x, cell_x + width)):
+            height += 1
+
+        for y in range(cell_y, cell_y + height):
+            for x in range(cell_x, cell_x + width):
+                used.add((x, y))
+
+        # La dernière tuile peut déborder de la grille (image de 64px pour une grille de 63px)
+        last_width, last_height = cells[(cell_x + width - 1, cell_y + height - 1)]
+        colliders.append(pygame.Rect(
+            cell_x * tile_size,
+            cell_y * tile_size,
+            (width - 1) * tile_size + last_width,
+            (height - 1) * tile_size + last_height
+        ))
+    return colliders
+
+
+class MapTerrain:
+    """Données du terrain d’une carte (calques de tuiles, spawn, trou, bonus), sans caméra ni rendu"""
+
+    def __init__(self, layers: list[TileLayer], tile_sizes: dict, spawn, hole, bonuses: list,
+                 map_width: int, map_height: int, terrains: list = None):
         """
-        Initialise une nouvelle instance de Map à partir d’un fichier .tmx.
-        Gère le chargement des tuiles, le spawn, le trou, les bonus et initialise la caméra.
+        :param layers: Calques de tuiles de la carte (grilles de gids)
+        :param tile_sizes: Taille de l'image de chaque gid
+        :param spawn: Point de spawn
+        :param hole: Point du trou
+        :param bonuses: Liste des bonus de la carte
+        :param map_width: Largeur de la carte (en pixels)
+        :param map_height: Hauteur de la carte (en pixels)
+        :param terrains: Types de terrain de la carte, par identifiant (voir build_terrain_table).
+                         Les valeurs par défaut si None
+        """
+        self.layers, self.tile_sizes = layers, tile_sizes
+        # Propriétés physiques propres à cette carte : le moteur lit cette table, jamais le registre
+        self.terrains = terrains if terrains is not None else build_terrain_table()
+        self.spawn, self.hole = spawn, hole
+        self.map_width = map_width
+        self.map_height = map_height
+        # Plus grande image de tuile : les tuiles débordent au plus de cette taille sur leurs voisines
+        self.max_tile_size = max((max(size) for size in tile_sizes.values()), default=TILE_SIZE)
 
-        :param infos: Dictionnaire contenant les informations de la carte (notamment le chemin du fichier)
-        :param screen: Surface Pygame sur laquelle la carte sera affichée
-        :param broadcast: Objet chargé de diffuser les événements liés aux bonus
+        # Index du terrain par cellule pour les requêtes en O(1) : (rect, terrain) de chaque tuile
+        self.terrain_index = build_tile_index(
+            [(pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, *tile_sizes[gid]), layer.terrain)
+             for layer in layers for x, y, gid in layer.iter_tiles()],
+            TILE_SIZE, get_rect=itemgetter(0)
+        )
+
+        # Seules les tuiles qui agissent au contact (bumpers, accélérateurs) sont des objets Tile
+        self.contact_tiles = [
+            Tile(layer.name, x * TILE_SIZE, y * TILE_SIZE, *tile_sizes[gid])
+            for layer in layers if self.terrains[layer.terrain].contact for x, y, gid in layer.iter_tiles()
+        ]
+        self.contact_index = build_tile_index(self.contact_tiles, TILE_SIZE)
+        self.tile_order = {tile: order for order, tile in enumerate(self.contact_tiles)}
+
+        # Obstacles statiques : tuiles "Collision" fusionnées en grands rectangles
+        self.colliders = merge_collision_tiles(layers, tile_sizes, TILE_SIZE, self.terrains)
+        self.collider_index = dict()  # {(colonne, ligne): [indices des obstacles...]}
+        for collider_id, collider in enumerate(self.colliders):
+            for cell in get_rect_cells(collider, TILE_SIZE):
+                if cell not in self.collider_index:
+                    self.collider_index[cell] = []
+                self.collider_index[cell].append(collider_id)
+
+        self.set_bonuses(bonuses)
+
+    def set_bonuses(self, bonuses: list) -> None:
         """
-        self.infos = infos
-        self.tiles, self.spawn, self.hole, self.bonuses = load_tiled_map(self.infos["path"], TILE_SIZE, broadcast)
+        Remplace les bonus de la carte et les range dans une grille spatiale (ils ne bougent pas).
 
-        # Création et configuration de la caméra
-        self.camera = Camera(screen)
-        # Caméra centrée sur le trou
-        self.camera.offset_X = self.hole.x
-        self.camera.offset_Y = self.hole.y
-        self.camera.zoom_factor = 0.5
+        :param bonuses: Liste des bonus de la carte
+        """
+        self.bonuses = bonuses
+        self.bonus_hash = SpatialHash(TILE_SIZE)
+        for bonus in self.bonuses:
+            self.bonus_hash.move(bonus, (bonus.x, bonus.y))
+
+    @classmethod
+    def from_tmx(cls, map_path: str):
+        """
+        Charge le terrain d’un fichier .tmx sans affichage (pas de bonus, ils dépendent du rendu et du son).
+
+        :param map_path: Chemin vers le fichier de la carte (.tmx)
+        """
+        compiled_map = load_compiled_map(map_path)
+        layers, tile_sizes, spawn, hole, _ = load_tiled_layers(compiled_map)
+        # Propriétés physiques personnalisées (calques, tileset)
+        return cls(layers, tile_sizes, spawn, hole, [], *compiled_map.pixel_size, build_terrain_table(compiled_map))
+
+    def get_terrains_at_point(self, point) -> list[int]:
+        """
+        Retourne les types de terrain des tuiles présentes sous un point, dans l'ordre des calques.
+
+        :param point: Position (x, y) dans le monde
+        """
+        # int() tronque comme Rect.collidepoint le fait pour les coordonnées flottantes
+        x, y = int(point[0]), int(point[1])
+        cell_tiles = self.terrain_index.get((x // TILE_SIZE, y // TILE_SIZE), [])
+        return [terrain for rect, terrain in cell_tiles if rect.collidepoint(x, y)]
+
+    def get_contact_tiles_around_rect(self, rect: pygame.Rect, margin: int = TILE_SIZE) -> list:
+        """
+        Retourne les tuiles qui agissent au contact (bumpers, accélérateurs) des cellules sous un rectangle
+        élargi d'une marge, dans l'ordre des calques puis des lignes et des colonnes.
+        Seules ces quelques cellules sont parcourues au lieu de toute la carte.
+        La marge couvre le déplacement du joueur pendant une passe de résolution des collisions.
+
+        :param rect: Rectangle dans le monde (ex : le rect d'un joueur)
+        :param margin: Marge ajoutée autour du rectangle (en pixels)
+        """
+        area = rect.inflate(2 * margin, 2 * margin)
+        candidates = set()
+        for cell_y in range(area.top // TILE_SIZE, (area.bottom - 1) // TILE_SIZE + 1):
+            for cell_x in range(area.left // TILE_SIZE, (area.right - 1) // TILE_SIZE + 1):
+                candidates.update(self.contact_index.get((cell_x, cell_y), ()))
+        if not candidates:
+            return []
+        return sorted(candidates, key=self.tile_order.__getitem__)
+
+    def get_bonuses_around(self, point, radius: float) -> list:
+        """
+        Retourne les emplacements de bonus qui peuvent être à moins de radius d'un point
+        (pré-sélection par la grille, la distance exacte reste à tester).
+
+        :param point: Position (x, y) dans le monde
+        :param radius: Distance de recherche (en pixels)
+        """
+        return self.bonus_hash.query_radius(point, radius)
 
-        # On récupère les dimensions de la carte
-        tmx_data = pytmx.TiledMap(self.infos["path"])
-        map_width = tmx_data.width
-        map_height = tmx_data.height
-        tile_width = tmx_data.tilewidth
-        tile_height = tmx_data.tileheight
+    def get_colliders_around_rect(self, rect: pygame.Rect, margin: int = TILE_SIZE) -> list:
+        """
+        Retourne les obstacles (rectangles fusionnés) qui touchent les cellules sous un rectangle élargi d'une marge.
 
-        # On termine par calculer les dimensions de la carte
-        self.map_width = map_width * tile_width
-        self.map_height = map_height * tile_height
+        :param rect: Rectangle dans le monde (ex : le rect d'un joueur)
+        :param margin: Marge ajoutée autour du rectangle (en pixels)
+        """
+        area = rect.inflate(2 * margin, 2 * margin)
+        candidates = set()  # Un obstacle couvre en général plusieurs cellules
+        for cell_y in range(area.top // TILE_SIZE, (area.bottom - 1) // TILE_SIZE + 1):
+            for cell_x in range(area.left // TILE_SIZE, (area.right - 1) // TILE_SIZE + 1):
+                candidates.update(self.collider_index.get((cell_x, cell_y), ()))
+        if not candidates:
+            return []
+        return [self.colliders[collider_id] for collider_id in sorted(candidates)]
 
     def teleportPlayersToSpawn(self, players: list):
         """
@@ -102,14 +292,66 @@ class Map:
         """
         player.position.x = self.spawn.x
         player.position.y = self.spawn.y
+        player.save_state()  # Pas d'interpolation entre l'ancienne position et le spawn
+
 
-    def load_gif_bonuses(self, map_surf: pygame.Surface):
+class Map(MapTerrain):
+    def __init__(self, infos: dict, screen: pygame.Surface = None, broadcast: BroadcastManager = None):
         """
-        Charge les GIFs liés aux bonus présents sur la carte.
+        Initialise une nouvelle instance de Map à partir d’un fichier .tmx.
+        Gère le chargement des tuiles, le spawn, le trou, les bonus et initialise la caméra.
+        Sans écran, la carte est seulement préchargée (calques, obstacles, atlas, chunks du fond) : cette partie
+        n'utilise pas l'affichage et peut tourner dans un autre thread (voir MapPreloader).
+        Il faut ensuite appeler finish_loading sur le thread principal.
 
-        :param map_surf: Surface Pygame sur laquelle afficher les GIFs
+        :param infos: Dictionnaire contenant les informations de la carte (notamment le chemin du fichier)
+        :param screen: Surface Pygame sur laquelle la carte sera affichée
+        :param broadcast: Objet chargé de diffuser les événements liés aux bonus
         """
-        if len(self.bonuses) == 0:
-            return  # S'il n’y a pas de bonus, on ne fait rien
-        for bonus in self.bonuses:
-            bonus.gif.update(map_surf)  # Met à jour l’animation du bonus
+        self.infos = infos
+        # Une seule lecture de la carte (compilée), dimensions comprises
+        self.compiled_map = load_compiled_map(self.infos["path"])
+        layers, tile_sizes, spawn, hole, self.bonus_objects = load_tiled_layers(self.compiled_map)
+        map_width, map_height = self.compiled_map.pixel_size
+        super().__init__(layers, tile_sizes, spawn, hole, [], map_width, map_height,
+                         build_terrain_table(self.compiled_map))
+
+        # Images des tuiles, une par gid, regroupées dans une seule surface
+        self.atlas = TileAtlas.from_compiled_map(self.compiled_map)
+
+        # Fond statique de la carte, découpé en chunks dessinés à la demande
+        self.chunks = ChunkCache(self)
+        self.chunks.bake()  # Chunks dessinés d'avance, convertis à leur premier affichage
+        if self.bonus_objects:
+            preload_bonus_gifs()  # Le type de chaque bonus n'est tiré qu'à la création : tous les GIFs sont décodés
+
+        self.camera: Camera = None
+        self.loaded = False  # Vrai quand finish_loading a été appelé
+        if screen is not None:
+            self.finish_loading(screen, broadcast)
+
+    def finish_loading(self, screen: pygame.Surface, broadcast: BroadcastManager) -> None:
+        """
+        Termine le chargement sur le thread principal : conversion de l'atlas au format de l'écran,
+        création des bonus et de la caméra.
+
+        :param screen: Surface Pygame sur laquelle la carte sera affichée
+        :param broadcast: Objet chargé de diffuser les événements liés aux bonus
+        """
+        self.atlas.convert()
+
+        bonuses = []
+        for obj in self.bonus_objects:
+            b = Bonus(obj, broadcast)  # Crée un objet bonus
+            if DEBUG_MODE:
+                b.print_bonus_log()
+            bonuses.append(b)  # Ajoute à la liste des bonus
+        self.set_bonuses(bonuses)
+
+        # Création et configuration de la caméra
+        self.camera = Camera(screen)
+        # Caméra centrée sur le trou
+        self.camera.offset_X = self.hole.x
+        self.camera.offset_Y = self.hole.y
+        self.camera.zoom_factor = 0.5
+        self.loaded = True
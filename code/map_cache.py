@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+
+import numpy as np
+import pytmx
+
+from settings import *
+
+MAGIC = b"GOATMAP1"  # Début de chaque fichier compilé
+COMPILER_VERSION = 1  # À incrémenter quand le format change (invalide le cache)
+
+COMPILE_LOCKS: dict[str, threading.Lock] = {}  # Fichier du cache -> verrou de sa compilation
+COMPILE_LOCKS_GUARD = threading.Lock()  # Protège la création des verrous
+
+
+class MapObject:
+    """Objet d'un calque d'objets Tiled (spawn, trou, bonus...), tel qu'enregistré dans la carte compilée"""
+
+    def __init__(self, layer: str, name: str, x: float, y: float, width: float, height: float, properties: dict):
+        self.layer = layer  # Nom du calque d'objets
+        self.name = name
+        self.x, self.y = x, y
+        self.width, self.height = width, height
+        self.properties = properties
+
+
+class CompiledMap:
+    """
+    Carte Tiled compilée : dimensions, une grille de gids par calque de tuiles (tableau NumPy),
+    la liste des objets et, pour chaque gid, la référence de son image dans le tileset.
+    """
+
+    def __init__(self, header: dict, grids: np.ndarray):
+        """
+        :param header: En-tête JSON du fichier compilé
+        :param grids: Tableau (calques, lignes, colonnes) des gids, 0 pour une case vide
+        """
+        self.width, self.height = header["width"], header["height"]  # En nombre de tuiles
+        self.tile_width, self.tile_height = header["tile_width"], header["tile_height"]
+        # Calques de tuiles dans l'ordre de la carte : (nom, propriétés, grille de gids)
+        self.layers = [(layer["name"], layer["properties"], grids[index])
+                       for index, layer in enumerate(header["layers"])]
+        self.objects = [MapObject(**obj) for obj in header["objects"]]
+        # gid -> {"source", "rect", "flags", "properties"} (clés JSON converties en entiers)
+        self.tiles = {int(gid): tile for gid, tile in header["tiles"].items()}
+
+    def get_tile_size(self, gid: int) -> tuple[int, int]:
+        """Dimensions (en pixels) de l'image d'un gid, sans la charger"""
+        tile = self.tiles[gid]
+        if tile["rect"]:
+            width, height = tile["rect"][2:]
+        else:
+            # Collection d'images : pytmx donne la taille de chaque image dans les propriétés
+            width = int(tile["properties"].get("width", self.tile_width))
+            height = int(tile["properties"].get("height", self.tile_height))
+        if tile["flags"] and tile["flags"][2]:
+            width, height = height, width  # Rotation d'un quart de tour (retournement diagonal)
+        return width, height
+
+    @property
+    def pixel_size(self) -> tuple[int, int]:
+        """Dimensions de la carte en pixels"""
+        return self.width * self.tile_width, self.height * self.tile_height
+
+
+def get_map_key(map_path: str) -> str:
+    """
+    Clé de cache d'une carte : empreinte du fichier .tmx, des tilesets externes (.tsx) qu'il utilise
+    et de la version du compilateur.
+    """
+    digest = hashlib.sha1(str(COMPILER_VERSION).encode())
+    with open(map_path, "rb") as file:
+        data = file.read()
+    digest.update(data)
+
+    # Les tilesets externes changent aussi le résultat (propriétés des tuiles, images)
+    for source in re.findall(rb'<tileset[^>]*source="([^"]+)"', data):
+        tileset_path = os.path.join(os.path.dirname(map_path), source.decode())
+        with open(tileset_path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def get_cache_path(map_path: str, cache_dir: str) -> str:
+    """
+    Fichier du cache d'une carte : "<empreinte du chemin>-<clé du contenu>.map".
+    Toutes les versions compilées d'une même carte ont le même préfixe (voir remove_stale_entries).
+    """
+    source_key = hashlib.sha1(os.path.abspath(map_path).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{source_key}-{get_map_key(map_path)}.map")
+
+
+def remove_stale_entries(cache_path: str) -> None:
+    """
+    Supprime les anciennes versions compilées de la carte d'un fichier du cache (même préfixe, autre contenu),
+    ainsi que les fichiers de l'ancien format de nom (sans préfixe) : le cache ne grossit pas à chaque modification.
+    """
+    directory, name = os.path.split(cache_path)
+    prefix = name.split("-")[0] + "-"
+    for other in os.listdir(directory):
+        if other == name or not other.endswith(".map"):
+            continue
+        if other.startswith(prefix) or "-" not in other:
+            try:
+                os.remove(os.path.join(directory, other))
+            except OSError:
+                pass  # Encore ouvert ailleurs (Windows) : il sera supprimé à la prochaine compilation
+
+
+def compile_map(map_path: str) -> tuple[dict, np.ndarray]:
+    """
+    Lit un fichier .tmx avec pytmx (sans charger d'images) et en extrait tout ce que le jeu utilise.
+
+    :param map_path: Chemin vers le fichier de la carte (.tmx)
+    :return: Tuple (en-tête, grilles de gids)
+    """
+    tmx_data = pytmx.TiledMap(map_path)
+
+    layers, grids, objects = [], [], []
+    for layer in tmx_data.layers:
+        if isinstance(layer, pytmx.TiledTileLayer):
+            layers.append({"name": layer.name, "properties": dict(layer.properties)})
+            grids.append(np.array(layer.data, dtype=np.uint32).reshape(tmx_data.height, tmx_data.width))
+        elif isinstance(layer, pytmx.TiledObjectGroup):
+            for obj in layer:
+                objects.append({"layer": layer.name, "name": obj.name, "x": obj.x, "y": obj.y,
+                                "width": obj.width, "height": obj.height, "properties": dict(obj.properties)})
+
+    # Référence de l'image de chaque gid utilisé, comme pytmx la donnerait à son loader
+    tiles = dict()
+    for gid in np.unique(grids) if grids else []:
+        if gid == 0:
+            continue
+        source, rect, flags = tmx_data.images[gid]
+        properties = tmx_data.get_tile_properties_by_gid(gid) or dict()
+        tiles[int(gid)] = {
+            "source": os.path.normpath(source),
+            "rect": list(rect) if rect else None,
+            "flags": list(flags) if flags else None,
+            # Seules les propriétés simples sont gardées (pas les animations)
+            "properties": {key: value for key, value in properties.items()
+                           if isinstance(value, (str, int, float, bool))},
+        }
+
+    header = {
+        "width": tmx_data.width,
+        "height": tmx_data.height,
+        "tile_width": tmx_data.tilewidth,
+        "tile_height": tmx_data.tileheight,
+        "layers": layers,
+        "objects": objects,
+        "tiles": tiles,
+    }
+    shape = (len(grids), tmx_data.height, tmx_data.width)
+    return header, np.array(grids, dtype=np.uint32).reshape(shape)
+
+
+def write_compiled_map(path: str, header: dict, grids: np.ndarray) -> None:
+    """
+    Écrit une carte compilée : MAGIC, taille de l'en-tête (4 octets), en-tête JSON complété
+    à un multiple de 4 octets, puis les grilles de gids brutes (uint32).
+    L'écriture passe par un fichier temporaire (nom unique, dans le même dossier) renommé à la fin :
+    un lecteur ne voit jamais de fichier à moitié écrit, même si plusieurs threads ou processus écrivent.
+    """
+    header = dict(header, shape=list(grids.shape))
+    data = json.dumps(header).encode("utf-8")
+    data += b" " * (-len(data) % 4)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(MAGIC)
+            file.write(len(data).to_bytes(4, "little"))
+            file.write(data)
+            file.write(grids.astype("<u4").tobytes())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def read_compiled_map(path: str) -> CompiledMap:
+    """
+    Lit une carte compilée en projetant le fichier en mémoire : les grilles ne sont pas copiées.
+
+    :raise ValueError: Si le fichier n'est pas une carte compilée
+    """
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    if bytes(buffer[:len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{path} n'est pas une carte compilée")
+
+    start = len(MAGIC) + 4
+    header_size = int.from_bytes(bytes(buffer[len(MAGIC):start]), "little")
+    header = json.loads(bytes(buffer[start:start + header_size]).decode("utf-8"))
+    grids = buffer[start + header_size:].view("<u4").reshape(header["shape"])
+    return CompiledMap(header, grids)
+
+
+def get_compile_lock(cache_path: str) -> threading.Lock:
+    """Verrou de la compilation d'une carte, le même pour tous les threads"""
+    with COMPILE_LOCKS_GUARD:
+        return COMPILE_LOCKS.setdefault(cache_path, threading.Lock())
+
+
+def load_compiled_map(map_path: str, cache_dir: str = None) -> CompiledMap:
+    """
+    Retourne la carte compilée d'un fichier .tmx, depuis le cache disque si elle y est déjà
+    (clé : empreinte des fichiers), sinon elle est compilée et enregistrée à la place de ses anciennes versions.
+    C'est le seul point d'entrée de la compilation : une carte demandée par plusieurs threads en même temps
+    (lancement, préchargement, niveau en cours) n'est compilée qu'une fois, les autres attendent le fichier.
+
+    :param map_path: Chemin vers le fichier de la carte (.tmx)
+    :param cache_dir: Dossier du cache (MAP_CACHE_DIR si None)
+    """
+    if cache_dir is None:
+        cache_dir = MAP_CACHE_DIR
+    cache_path = get_cache_path(map_path, cache_dir)
+    if not os.path.exists(cache_path):
+        with get_compile_lock(cache_path):
+            # Un autre thread a pu l'écrire pendant qu'on attendait le verrou
+            if not os.path.exists(cache_path):
+                write_compiled_map(cache_path, *compile_map(map_path))
+                remove_stale_entries(cache_path)
+    return read_compiled_map(cache_path)
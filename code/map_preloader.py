@@ -0,0 +1,51 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from settings import *
+from broadcast import BroadcastManager
+from map import Map
+
+
+class MapPreloader:
+    """
+    Précharge les cartes dans un thread pendant que le niveau en cours est joué (ou son écran d'info affiché) :
+    lecture de la carte, tuiles, obstacles et dessin du fond (voir Map).
+    Seules les conversions au format de l'écran restent sur le thread principal (Map.finish_loading).
+    La carte compilée passe par load_compiled_map, comme les chargements du thread principal et du lancement :
+    une carte demandée des deux côtés en même temps n'est compilée qu'une fois.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map_preloader")
+        self.pending: dict[str, Future] = {}  # Chemin de la carte -> chargement en cours ou terminé
+
+    def preload(self, map_info: dict) -> None:
+        """
+        Lance le chargement d'une carte en arrière-plan (sans effet si elle est déjà demandée).
+
+        :param map_info: Informations de la carte (notamment le chemin du fichier)
+        """
+        if map_info["path"] not in self.pending:
+            self.pending[map_info["path"]] = self.executor.submit(Map, map_info)
+
+    def get(self, map_info: dict, screen: pygame.Surface, broadcast: BroadcastManager) -> Map:
+        """
+        Retourne une carte prête à jouer : celle préchargée (en attendant la fin de son chargement si besoin),
+        sinon elle est chargée tout de suite.
+
+        :param map_info: Informations de la carte (notamment le chemin du fichier)
+        :param screen: Surface Pygame sur laquelle la carte sera affichée
+        :param broadcast: Objet chargé de diffuser les événements liés aux bonus
+        """
+        future = self.pending.pop(map_info["path"], None)
+        if future is None:
+            return Map(map_info, screen, broadcast)
+
+        map_obj = future.result()  # Relance dans ce thread l'éventuelle erreur du chargement
+        map_obj.finish_loading(screen, broadcast)
+        return map_obj
+
+    def clear(self) -> None:
+        """Oublie les cartes préchargées (un chargement déjà commencé se termine dans le vide)"""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
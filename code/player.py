@@ -2,6 +2,32 @@ from settings import *
 import time
 
 
+class BonusModifiers:
+    """
+    Effets des bonus d'un joueur sur la physique, publiés par les bonus (bonus_manager.py)
+    quand leur état change. Le moteur lit ces valeurs au lieu de tester le type de chaque bonus.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Revient aux valeurs sans bonus"""
+        self.ghost = False  # Traverse les obstacles, les bumpers, les autres joueurs et l'eau
+        self.speed_multiplier = 1  # Facteur appliqué au déplacement
+        self.max_velocity = MAX_BALL_SPEED  # Vitesse maximale sur chaque axe
+        self.extra_friction = 0.0  # Friction ajoutée à celle du terrain
+        self.attractor_until = -1.0  # Heure (time.time()) jusqu'à laquelle le joueur est attiré par le trou
+
+    def is_attracted(self, now: float) -> bool:
+        """Indique si le joueur est attiré par le trou à l'heure donnée"""
+        return now <= self.attractor_until
+
+    def is_neutral(self, now: float) -> bool:
+        """Indique si aucun bonus ne modifie la physique du joueur (à part la vitesse maximale)"""
+        return not (self.ghost or self.speed_multiplier != 1 or self.extra_friction or self.is_attracted(now))
+
+
 # Class Player qui représente un joueur dans le jeu.
 # Elle hérite de pygame.sprite.Sprite.
 class Player(pygame.sprite.Sprite):
@@ -16,13 +42,22 @@ class Player(pygame.sprite.Sprite):
 
         self.finished = False  # Indique si le joueur a terminé le niveau/trajet
 
+        # Un joueur "endormi" est immobile et ignoré par le moteur physique jusqu'à ce qu'on le touche
+        self.asleep = False
+        self.rest_time = 0.0  # Temps passé sous le seuil de vitesse (en secondes)
+
         self.bonus = None  # Contiendra un bonus actif (ou None s’il n’y en a pas)
+        self.modifiers = BonusModifiers()  # Effets du bonus sur la physique
 
         # Création de l’image représentant le joueur : un cercle de couleur dessiné
         self.image = pygame.Surface((2 * self.radius, 2 * self.radius), pygame.SRCALPHA)
         pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
         self.rect = self.image.get_rect(center=position)
 
+        # État du pas physique précédent, pour interpoler l’affichage entre deux pas
+        self.previous_position = Vector(position)
+        self.render_rect = self.rect.copy()  # Rectangle où le joueur est dessiné
+
     def get_velocity(self):
         """Retourne la vitesse du joueur (norme du vecteur de vitesse)"""
         return self.velocity.length()
@@ -30,10 +65,42 @@ class Player(pygame.sprite.Sprite):
     def update(self):
         """Met à jour la position du sprite pour qu’elle suive la position logique du joueur"""
         self.rect.center = (int(self.position.x), int(self.position.y))
+        self.render_rect.center = self.rect.center  # Sans interpolation, on affiche l’état actuel
+
+    def sleep(self):
+        """Endort le joueur : il s’arrête et n’est plus simulé"""
+        self.asleep = True
+        self.velocity.x, self.velocity.y = 0, 0
+        self.rest_time = 0.0
+
+    def wake(self):
+        """Réveille le joueur pour qu’il soit de nouveau simulé"""
+        self.asleep = False
+        self.rest_time = 0.0
+
+    def clear_bonus(self):
+        """Retire le bonus du joueur et ses effets sur la physique"""
+        self.bonus = None
+        self.modifiers.reset()
+
+    def save_state(self):
+        """Mémorise la position avant un pas physique"""
+        self.previous_position.update(self.position)
+
+    def interpolate(self, alpha: float):
+        """
+        Place le rectangle d’affichage entre les deux derniers états physiques
+        alpha vaut 0 pour l’état précédent et 1 pour l’état actuel
+        """
+        render_position = self.previous_position.lerp(self.position, alpha)
+        self.render_rect.center = (int(render_position.x), int(render_position.y))
 
-    def draw(self, surface):
-        """Affiche le joueur sur la surface donnée, en tenant compte d’un éventuel effet de bonus"""
-        if self.bonus is not None and self.bonus.name == "BonusFantome" and self.bonus.active:
+    def draw(self, surface, offset=(0, 0)):
+        """
+        Affiche le joueur sur la surface donnée, en tenant compte d’un éventuel effet de bonus
+        offset permet de dessiner sur une surface qui ne part pas de (0, 0) dans le monde
+        """
+        if self.modifiers.ghost:
             # Si le bonus "Fantôme" est actif, on dessine un cercle transparent
             transparent_color = (
             self.color[0], self.color[1], self.color[2], 100)  # Applique une transparence à la couleur
@@ -42,13 +109,15 @@ class Player(pygame.sprite.Sprite):
             # Sinon, dessine un cercle normal
             pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
 
-        surface.blit(self.image, self.rect)
+        surface.blit(self.image, self.render_rect.move(offset))
 
     def reset(self):
         """Réinitialise les paramètres du joueur (utile entre deux parties)"""
         self.finished = False  # Le joueur recommence, donc n’a pas fini
+        self.wake()
         self.mass = BALL_MASS  # Réinitialise la masse
         self.position.x, self.position.y = 0, 0  # Replace le joueur au point d’origine
+        self.save_state()  # Pas d’interpolation depuis l’ancienne position
         self.velocity.x, self.velocity.y = 0, 0  # Annule toute vitesse
         self.radius = BALL_RADIUS  # Réinitialise le rayon
 
@@ -78,7 +147,7 @@ class Player(pygame.sprite.Sprite):
                 self.bonus.active = False
                 self.bonus.start_time = -1
                 self.bonus.endtime = -1
-                self.bonus = None
+                self.clear_bonus()
                 overlay.fill((255, 255, 255, 0))
                 return
 
@@ -0,0 +1,222 @@
+import time
+from math import ceil, exp, floor, inf, log, sqrt
+
+import numpy as np
+
+from settings import *
+from batch_engine import TerrainGrid
+from engine import Engine
+from player import Player
+
+
+class RollOutPredictor:
+    """
+    Prédiction analytique du roulement d'une balle, sur le modèle de friction du moteur.
+    Tant que la balle roule en ligne droite sur un terrain uniforme sans rien toucher, chaque pas
+    du moteur fait p(i+1) = p(i) + v(i)·dt puis v(i+1) = v(i)·r avec r = e^(-k·dt) et k = friction/masse.
+    Après n pas : v(n) = v0·r^n et p(n) = p0 + v0·dt·(1 - r^n) / (1 - r).
+    On saute donc directement jusqu'au dernier pas avant un changement de terrain ou un contact
+    (obstacle, tuile à contact, bonus, trou, autre balle), le moteur reprend ensuite pas à pas.
+    """
+
+    def __init__(self, engine: Engine):
+        """
+        :param engine: Moteur dont on reprend le terrain, les joueurs et les règles
+        """
+        self.engine = engine
+        self.map = engine.level.map
+        self.grid = TerrainGrid(self.map, engine)
+
+        # Friction des cellules uniformes (mêmes valeurs dans les 4 zones, et pas d'eau), NaN sinon
+        # Les obstacles et les tuiles à contact sont testés à part, au plus près (distance_to_rects)
+        friction = self.grid.friction
+        uniform = np.all(friction == friction[:, :, :1], axis=2) & np.all(self.grid.valid, axis=2)
+        self.cell_friction = np.where(uniform, friction[:, :, 0], np.nan)
+
+    def can_predict(self, player: Player) -> bool:
+        """
+        Indique si le mouvement du joueur suit le modèle simple : seul joueur en mouvement,
+        sans bonus qui modifie sa physique et sous sa vitesse maximale (sinon la limitation de vitesse s'applique).
+        """
+        if player.finished or player.asleep:
+            return False
+        if not player.modifiers.is_neutral(time.time()):
+            return False
+        max_velocity = player.modifiers.max_velocity
+        if abs(player.velocity.x) > max_velocity or abs(player.velocity.y) > max_velocity:
+            return False
+        return all(other is player or other.finished or other.asleep for other in self.engine.players)
+
+    def advance(self, player: Player, dt: float = PHYSICS_DT, max_steps: int = 60 * PHYSICS_RATE) -> int:
+        """
+        Fait avancer le joueur analytiquement d'autant de pas du moteur que possible.
+        On s'arrête avant que sa vitesse ne passe sous VELOCITY_THRESHOLD, pour que le moteur gère l'arrêt.
+
+        :param player: Joueur à faire avancer
+        :param dt: Pas de temps du moteur (en secondes)
+        :param max_steps: Nombre maximum de pas sautés
+        :return: Nombre de pas sautés (0 si la prédiction n'est pas possible ici)
+        """
+        if not self.can_predict(player):
+            return 0
+
+        speed = player.velocity.length()
+        if speed <= VELOCITY_THRESHOLD:
+            return 0
+        direction = player.velocity / speed
+
+        cell = self.get_cell(player.position)
+        if cell is None or np.isnan(self.cell_friction[cell]):
+            return 0
+        friction = self.cell_friction[cell]
+        ratio = exp(-(friction / BALL_MASS) * dt)
+
+        # Dernier pas où la vitesse est encore au-dessus du seuil
+        last_step = ceil(log(VELOCITY_THRESHOLD / speed) / log(ratio)) - 1
+        step_distance = speed * dt  # Distance du premier pas
+        max_distance = step_distance * (1 - ratio ** last_step) / (1 - ratio)
+
+        # Tests les moins coûteux d'abord : les rectangles ne sont cherchés que sur la distance restante
+        free_distance = min(self.free_distance(player, direction, max_distance, friction),
+                            self.distance_to_circles(player, direction))
+        if free_distance <= 0:
+            return 0
+        free_distance = self.distance_to_rects(player, direction, min(free_distance, max_distance))
+        if free_distance <= 0:
+            return 0
+
+        # Nombre de pas dont toutes les positions restent dans la zone libre
+        steps = floor(log(1 - free_distance * (1 - ratio) / step_distance) / log(ratio)) \
+            if free_distance < max_distance else last_step
+        steps = min(steps, last_step, max_steps)
+        if steps <= 0:
+            return 0
+
+        decay = ratio ** steps
+        player.position += player.velocity * (dt * (1 - decay) / (1 - ratio))
+        player.velocity *= decay
+        player.save_state()  # Pas d'interpolation sur un saut
+        player.update()
+        return steps
+
+    def run_until_rest(self, dt: float = PHYSICS_DT, max_steps: int = 60 * PHYSICS_RATE) -> int:
+        """
+        Fait avancer le moteur jusqu'à ce que tous les joueurs soient immobiles, en sautant
+        les lignes droites quand c'est possible et pas à pas sinon. Le résultat est le même qu'avec Engine.update.
+
+        :param dt: Pas de temps du moteur (en secondes)
+        :param max_steps: Nombre maximum de pas effectués ou sautés
+        :return: Nombre de pas effectués ou sautés
+        """
+        steps = 0
+        while steps < max_steps and not self.engine.at_rest:
+            skipped = 0
+            for player in self.engine.players:
+                skipped = max(skipped, self.advance(player, dt, max_steps - steps))
+            if skipped:
+                steps += skipped
+                continue
+
+            self.engine.update(dt)
+            steps += 1
+        return steps
+
+    def get_cell(self, position):
+        """Cellule (ligne, colonne) sous une position, ou None en dehors de la grille"""
+        cell_x, cell_y = int(position[0]) // TILE_SIZE, int(position[1]) // TILE_SIZE
+        if 0 <= cell_x < self.grid.columns and 0 <= cell_y < self.grid.rows and position[0] >= 0 and position[1] >= 0:
+            return cell_y, cell_x
+        return None
+
+    def is_free_cell(self, cell_x: int, cell_y: int, friction: float) -> bool:
+        """Indique si une cellule a la friction donnée partout (sans eau)"""
+        if not (0 <= cell_x < self.grid.columns and 0 <= cell_y < self.grid.rows):
+            return False
+        return self.cell_friction[cell_y, cell_x] == friction
+
+    def free_distance(self, player: Player, direction: Vector, limit: float, friction: float) -> float:
+        """
+        Distance que le centre peut parcourir le long de sa direction en restant sur la même friction.
+        Les cellules traversées sont parcourues une à une (algorithme de Amanatides et Woo).
+
+        :param limit: Distance au-delà de laquelle on arrête la recherche
+        """
+        x, y = player.position.x, player.position.y
+        cell_x, cell_y = int(x) // TILE_SIZE, int(y) // TILE_SIZE
+
+        step_x = 1 if direction.x > 0 else -1
+        step_y = 1 if direction.y > 0 else -1
+        # Distance jusqu'au prochain bord de cellule sur chaque axe, et distance entre deux bords
+        next_x = ((cell_x + (step_x > 0)) * TILE_SIZE - x) / direction.x if direction.x != 0 else inf
+        next_y = ((cell_y + (step_y > 0)) * TILE_SIZE - y) / direction.y if direction.y != 0 else inf
+        delta_x = TILE_SIZE / abs(direction.x) if direction.x != 0 else inf
+        delta_y = TILE_SIZE / abs(direction.y) if direction.y != 0 else inf
+
+        distance = 0.0
+        while distance <= limit:
+            if not self.is_free_cell(cell_x, cell_y, friction):
+                return distance - 1  # Un pixel de marge pour la troncature des positions
+            if next_x < next_y:
+                distance, next_x, cell_x = next_x, next_x + delta_x, cell_x + step_x
+            else:
+                distance, next_y, cell_y = next_y, next_y + delta_y, cell_y + step_y
+        return limit
+
+    def distance_to_rects(self, player: Player, direction: Vector, limit: float) -> float:
+        """
+        Distance que le centre peut parcourir avant d'approcher un obstacle ou une tuile à contact.
+        Les rectangles proches du trajet sont élargis du rayon plus une marge, sans arrondir les coins
+        (les accélérateurs testent le rectangle du joueur), et on lance un rayon depuis le centre.
+
+        :param limit: Distance au-delà de laquelle on arrête la recherche
+        """
+        margin = player.radius + CONTACT_SKIN + 2
+        x, y = player.position.x, player.position.y
+        end_x, end_y = x + direction.x * limit, y + direction.y * limit
+        path = pygame.Rect(min(x, end_x), min(y, end_y), abs(end_x - x) + 1, abs(end_y - y) + 1)
+        path.inflate_ip(2 * margin + 2, 2 * margin + 2)
+        rects = self.map.get_colliders_around_rect(path)
+        rects += [tile.rect for tile in self.map.get_contact_tiles_around_rect(path)]
+
+        nearest = limit
+        for rect in rects:
+            # Test des plaques sur le rectangle élargi
+            t_enter, t_exit = -inf, inf
+            for position, component, low, high in (
+                    (x, direction.x, rect.left - margin, rect.right + margin),
+                    (y, direction.y, rect.top - margin, rect.bottom + margin)):
+                if component == 0:
+                    if position < low or position > high:
+                        t_enter = inf  # Parallèle à la plaque et en dehors
+                    continue
+                t1, t2 = (low - position) / component, (high - position) / component
+                t_enter, t_exit = max(t_enter, min(t1, t2)), min(t_exit, max(t1, t2))
+            if t_enter > t_exit or t_exit < 0:
+                continue  # Le rectangle n'est pas sur le chemin
+            if t_enter <= 0:
+                return 0.0  # Déjà trop près
+            nearest = min(nearest, t_enter - 1)
+        return nearest
+
+    def distance_to_circles(self, player: Player, direction: Vector) -> float:
+        """
+        Distance que le centre peut parcourir avant d'approcher le trou, un bonus ou une autre balle.
+        """
+        circles = [(self.map.hole.x, self.map.hole.y, BALL_RADIUS + 2)]
+        circles += [(bonus.x, bonus.y, BONUS_PICKUP_RADIUS + 1) for bonus in self.map.bonuses]
+        circles += [(other.position.x, other.position.y, player.radius + other.radius + 2)
+                    for other in self.engine.players if other is not player and not other.finished]
+
+        nearest = inf
+        for center_x, center_y, radius in circles:
+            # Intersection du rayon p + s·d avec le cercle (d est unitaire)
+            fx, fy = player.position.x - center_x, player.position.y - center_y
+            b = fx * direction.x + fy * direction.y
+            c = fx * fx + fy * fy - radius * radius
+            if c <= 0:
+                return 0.0  # Déjà trop près
+            discriminant = b * b - c
+            if discriminant < 0 or b > 0:
+                continue  # Le cercle n'est pas sur le chemin
+            nearest = min(nearest, -b - sqrt(discriminant) - 1)
+        return nearest
@@ -1,8 +1,10 @@
+import pygame_gui
 from pygame_gui.elements import UILabel, UIButton, UIPanel, UITextEntryLine as UITextField
 from pygame_gui.core import ObjectID
 from interface_manager import InterfaceManager
 from scene_manager import Scene
 from settings import *
+from assets import get_image
 
 
 class ConfigurationScene(Scene):
@@ -288,7 +290,7 @@ class ConfigurationScene(Scene):
         self.scene_manager.change("play_scene")
 
     def draw(self, screen: pygame.surface.Surface) -> None:
-        screen.blit(SCENE_BG_IMAGE, (0, 0))
+        screen.blit(get_image("SCENE_BG_IMAGE"), (0, 0))
 
     def update(self, dt: int) -> None:
         for name_field in self.names_fields:
@@ -1,3 +1,5 @@
+import pygame_gui
+
 from settings import *
 
 
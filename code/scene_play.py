@@ -3,10 +3,11 @@ from settings import *
 from player import Player
 from level import Level
 from score import ScoreManager
-from map import Map
+from map_preloader import MapPreloader
 from scene_manager import Scene
 from broadcast import BroadcastManager
 from ui_text import Text
+from assets import get_image
 
 
 class PlayScene(Scene):
@@ -34,6 +35,8 @@ class PlayScene(Scene):
 
         self.score_manager: ScoreManager = None
         self.broadcast_manager: BroadcastManager = BroadcastManager()
+        # Chargement en arrière-plan de la carte du trou suivant
+        self.map_preloader: MapPreloader = MapPreloader()
 
         # État de la scène ("level_info", "playing", "end_info")
         self.current_state: str = self.STATE_LEVEL_INFO
@@ -60,6 +63,7 @@ class PlayScene(Scene):
 
         # Sélection des maps
         self.select_maps(holes_number)
+        self.map_preloader.clear()  # Les cartes préchargées d'une partie précédente ne servent plus
 
         # On réinitialise les variables du level
         self.cur_level_index = -1
@@ -97,7 +101,7 @@ class PlayScene(Scene):
         """Crée un niveau à partir d'une map."""
         return Level(
             hole_index=hole_index,
-            map_obj=Map(map_info, self.game.screen, self.broadcast_manager),
+            map_obj=self.map_preloader.get(map_info, self.game.screen, self.broadcast_manager),
             players=self.players,
             score_manager=self.score_manager,
             broadcast_manager=self.broadcast_manager,
@@ -117,6 +121,10 @@ class PlayScene(Scene):
             self.cur_level = self.create_level(self.cur_level_index, map_info)
             self.score_manager.set_current_hole(self.cur_level_index)
 
+            # La carte suivante se charge pendant l'écran d'info et la partie
+            if self.cur_level_index + 1 < len(self.selected_maps):
+                self.map_preloader.preload(self.selected_maps[self.cur_level_index + 1])
+
             # Passage à l'affichage d'info du niveau
             self.build_level_info_surface()
             self.current_state = self.STATE_LEVEL_INFO
@@ -182,7 +190,7 @@ class PlayScene(Scene):
 
     def build_level_info_surface(self):
         """Construit l’écran avec les infos de la carte."""
-        self.level_info_surface.blit(SPLASH_BG, (0, 0))
+        self.level_info_surface.blit(get_image("SPLASH_BG"), (0, 0))
 
         Text(
             text=f"Trou n°{self.cur_level_index + 1}",
@@ -190,7 +198,7 @@ class PlayScene(Scene):
                 self.game.screen.get_width() // 2,
                 self.game.screen.get_height() // 2 - 65
             ),
-            font_size=17,
+            font_size=INFO_HOLE_FONT_SIZE,
             color="black",
             align="center"
         ).draw(self.level_info_surface)
@@ -201,7 +209,7 @@ class PlayScene(Scene):
                 self.game.screen.get_width() // 2,
                 self.game.screen.get_height() // 2
             ),
-            font_size=40,
+            font_size=INFO_TITLE_FONT_SIZE,
             color="#D55534",
             align="center"
         ).draw(self.level_info_surface)
@@ -212,14 +220,14 @@ class PlayScene(Scene):
                 self.game.screen.get_width() // 2,
                 self.game.screen.get_height() // 2 + 65
             ),
-            font_size=16,
+            font_size=TEXT_FONT_SIZE,
             color="black",
             align="center"
         ).draw(self.level_info_surface)
 
     def build_end_info_surface(self):
         """Construit l’écran final de fin de partie avec le récap des scores."""
-        self.end_info_surface.blit(SPLASH_BG, (0, 0))
+        self.end_info_surface.blit(get_image("SPLASH_BG"), (0, 0))
 
         Text(
             text="Partie terminée !",
@@ -227,7 +235,7 @@ class PlayScene(Scene):
                 self.game.screen.get_width() // 2,
                 self.game.screen.get_height() // 2 - 115
             ),
-            font_size=40,
+            font_size=INFO_TITLE_FONT_SIZE,
             color="#D55534",
             align="center"
         ).draw(self.end_info_surface)
@@ -238,7 +246,7 @@ class PlayScene(Scene):
                 self.game.screen.get_width() // 2,
                 self.game.screen.get_height() // 2 - 70
             ),
-            font_size=16,
+            font_size=TEXT_FONT_SIZE,
             color="black",
             align="center"
         ).draw(self.end_info_surface)
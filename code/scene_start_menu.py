@@ -1,6 +1,8 @@
+import pygame_gui
 from pygame_gui.core import ObjectID
 from scene_manager import *
 from settings import *
+from assets import get_image
 
 
 class StartMenuScene(Scene):
@@ -123,4 +125,4 @@ class StartMenuScene(Scene):
 
     def draw(self, screen):
         """Dessine la scène."""
-        screen.blit(SCENE_BG_IMAGE, (0, 0))
+        screen.blit(get_image("SCENE_BG_IMAGE"), (0, 0))
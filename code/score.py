@@ -26,9 +26,14 @@ class ScoreManager:
                             OVERLAY_CELL_GAP * (self.holes_number + 1) +
                             OVERLAY_MENU_PADDING * 2
                             )
+        # Surface du menu pré-dessinée, reconstruite seulement quand son contenu change
+        self.panel_surf: pygame.Surface = None
+        self.panel_dirty = True  # Indique si le menu doit être redessiné
+        self.panel_names = None  # Noms des joueurs au moment du dernier rendu
 
     def set_current_hole(self, hole_number):
         self.current_hole = hole_number
+        self.panel_dirty = True
 
     # def toggle_menu(self):
     #     # Si le menu est collapsed, on inverse son état
@@ -54,6 +59,7 @@ class ScoreManager:
         # Puis met à jour le total
         self.score[player]["score"][hole] += 1
         self.score_calculation()
+        self.panel_dirty = True
 
     def score_calculation(self):
         # Calcule le score total pour chaque joueur en additionnant ses scores trou par trou
@@ -70,22 +76,32 @@ class ScoreManager:
             for i in range(self.holes_number):
                 self.score[player]["score"][i] = 0
             self.score[player]["total"] = 0
+        self.panel_dirty = True
 
     def draw(self, screen):
         """Appelée pour afficher le menu des scores en jeu"""
+        # Le menu n'est redessiné que si les scores, le trou ou les noms des joueurs ont changé
+        names = tuple(player.name for player in self.players)
+        if self.panel_dirty or self.panel_surf is None or names != self.panel_names:
+            self.build_panel()
+            self.panel_names = names
+
         # Position du menu en bas à droite de l'écran
         start_x = screen.get_width() - OVERLAY_MENU_MARGIN - self.menu_width
         start_y = screen.get_height() - OVERLAY_MENU_MARGIN - self.menu_height
+        screen.blit(self.panel_surf, (start_x, start_y))
+
+    def build_panel(self):
+        """Dessine le menu des scores sur sa surface"""
+        self.panel_surf = pygame.Surface((self.menu_width, self.menu_height))
 
         # Dessin du fond du menu (rectangle orange) et de sa bordure
-        pygame.draw.rect(screen, (213, 85, 52), (start_x, start_y, self.menu_width, self.menu_height))
-        pygame.draw.rect(screen, '#3F170D', (start_x, start_y, self.menu_width, self.menu_height), 3)
+        pygame.draw.rect(self.panel_surf, (213, 85, 52), (0, 0, self.menu_width, self.menu_height))
+        pygame.draw.rect(self.panel_surf, '#3F170D', (0, 0, self.menu_width, self.menu_height), 3)
 
         # Décalage interne pour ne pas coller le contenu aux bords du menu
-        start_x += OVERLAY_MENU_PADDING
-        start_y += OVERLAY_MENU_PADDING
-
-        self.draw_menu(start_x, start_y, "white", screen)
+        self.draw_menu(OVERLAY_MENU_PADDING, OVERLAY_MENU_PADDING, "white", self.panel_surf)
+        self.panel_dirty = False
 
     def draw_menu(self, start_x: int, start_y: int, text_color: str, screen: pygame.Surface):
         """Permet d'afficher le menu des scores à une position donnée"""
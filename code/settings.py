@@ -1,10 +1,10 @@
 import pygame
-import pygame_gui
 from pygame.math import Vector2 as Vector
 
 ## Chemins des fichiers du jeu
 ASSET_PATH = "../asset"
 UI_THEME_PATH = "../data/ui-theme.json"
+MAP_CACHE_DIR = "../cache/maps"  # Cartes compilées (voir map_cache.py), recréées si le .tmx change
 FONT_PATH = "../asset/font/font-regular-v2.ttf"
 MAPS = {
     "0": {
@@ -102,6 +102,12 @@ FPS = 60
 TILE_SIZE = 63
 BALL_RADIUS = 15
 
+## Chargement au lancement (voir startup.py)
+STARTUP_WORKERS = 4  # Threads qui décodent les fichiers pendant le splash screen
+STARTUP_PROGRESS_SIZE = (400, 8)  # Dimensions de la barre de progression
+STARTUP_PROGRESS_MARGIN = 60  # Distance entre la barre et le bas de l'écran
+STARTUP_PROGRESS_COLOR = "#D55534"
+
 ## Paramètres de configuration d'une partie
 MAX_PLAYERS_NUMBER = 5
 MAX_HOLES_NUMBER = 5
@@ -112,12 +118,24 @@ PLAYER_COLORS = [(255, 0, 0), (0, 0, 255), (0, 255, 0), (255, 255, 0), (0, 255,
 ## Variables physiques
 DELTA_TIME = 0
 VELOCITY_THRESHOLD = 10
+SLEEP_DELAY = 0.5  # Temps (en secondes) sous VELOCITY_THRESHOLD avant qu'une balle ne s'endorme
 MAX_PLAYER_VELOCITY = Vector(1000, 1000)
+MAX_BALL_SPEED = 1200  # Vitesse maximale d'une balle sur chaque axe (en px/s)
+MAX_BALL_SPEED_BONUS = 2500  # Vitesse maximale sur chaque axe avec le bonus de vitesse
+BONUS_PICKUP_RADIUS = BALL_RADIUS + 5  # Distance (en pixels) entre le centre d'une balle et un bonus pour le ramasser
+EXPLOSION_RADIUS = 500  # Distance (en pixels) jusqu'à laquelle le bonus explosion repousse les autres joueurs
 FORCE_MULTIPLIER = 5
 BALL_MASS = 0.05
 GROUND_GRASS_FRICTION = 0.06
 GROUND_SAND_FRICTION = 0.30
 GROUND_ICE_FRICTION = 0.02
+PHYSICS_RATE = 60  # Nombre de pas physiques par seconde
+PHYSICS_DT = 1 / PHYSICS_RATE  # Durée d'un pas physique (en secondes)
+MAX_PHYSICS_SUBSTEPS = 5  # Nombre maximum de pas physiques par frame
+CONTACT_SKIN = 2  # Pénétration (en pixels) laissée au contact d'un obstacle pour déclencher sa résolution
+FAST_FORWARD_MAX_STEPS = 10 * PHYSICS_RATE  # Nombre maximum de pas physiques par frame quand on passe l'animation
+EFFECTS_REFERENCE_RATE = 60  # Fréquence (en pas par seconde) pour laquelle les effets par pas sont réglés
+BOOST_STRENGTH = 3  # Nombre d'applications d'un accélérateur par pas de référence
 
 ## Paramètres des composants d'interfaces
 INPUT_WIDTH = 300
@@ -133,28 +151,15 @@ PANEL_MARGINS = {
     "right": 50
 
 }
-SCENE_BG_IMAGE = pygame.transform.scale(
-    pygame.image.load('../asset/image/terrain_bg.jpg'),
-    (WINDOW_WIDTH, WINDOW_HEIGHT)
-)
-SPLASH_SCREEN = pygame.transform.scale(
-    pygame.image.load('../asset/image/splash_bg.png'),
-    (WINDOW_WIDTH, WINDOW_HEIGHT)
-)
-SPLASH_BG = pygame.transform.scale(
-    pygame.image.load('../asset/image/empty_splash_bg.png'),
-    (WINDOW_WIDTH, WINDOW_HEIGHT)
-)
-
-RULES_IMAGE = pygame.transform.scale(
-    pygame.image.load('../asset/image/rules_image.png'),
-    (WINDOW_WIDTH, WINDOW_HEIGHT)
-)
-
-CREDITS_IMAGE = pygame.transform.scale(
-    pygame.image.load('../asset/image/credits_image.png'),
-    (WINDOW_WIDTH, WINDOW_HEIGHT)
-)
+# Images plein écran, chargées à la première utilisation (voir assets.py) : nom -> (chemin, taille)
+IMAGES = {
+    "SCENE_BG_IMAGE": ('../asset/image/terrain_bg.jpg', (WINDOW_WIDTH, WINDOW_HEIGHT)),
+    "SPLASH_SCREEN": ('../asset/image/splash_bg.png', (WINDOW_WIDTH, WINDOW_HEIGHT)),
+    "SPLASH_BG": ('../asset/image/empty_splash_bg.png', (WINDOW_WIDTH, WINDOW_HEIGHT)),
+    "RULES_IMAGE": ('../asset/image/rules_image.png', (WINDOW_WIDTH, WINDOW_HEIGHT)),
+    "CREDITS_IMAGE": ('../asset/image/credits_image.png', (WINDOW_WIDTH, WINDOW_HEIGHT)),
+}
+IMAGES_WARM_UP = list(IMAGES)  # Images chargées à l'avance au lancement du jeu (voir startup.py, AssetRegistry.warm_up)
 
 # DEBUG
 DEBUG_MODE = False
@@ -164,6 +169,10 @@ DEBUG_CONFIG = {'players': 2, 'holes': 4, 'names': ["player0","player1"]}
 DEFAULT_ZOOM = 1
 MAX_ZOOM = 2
 MIN_ZOOM = 0.5
+ZOOM_CACHE_LEVELS = [MIN_ZOOM, 0.75]  # Niveaux de zoom pré-calculés pour le fond de la carte
+CHUNK_SIZE = 512  # Taille (en pixels du monde) d'un morceau du fond de la carte
+CHUNK_CACHE_BUDGET = 96 * 1024 * 1024  # Mémoire max (en octets) des morceaux gardés en mémoire, par carte
+TILE_ATLAS_WIDTH = 1024  # Largeur maximale (en pixels) de la surface qui regroupe les images des tuiles
 
 ## Dimensions de la fenêtre d'erreur
 WINDOW_ERROR_WIDTH = PANEL_WIDTH - 100
@@ -177,6 +186,16 @@ OVERLAY_MENU_PADDING = 20  # Espace entre le contenu et le menu
 OVERLAY_MENU_MARGIN = 20  # Espace entre le menu et les bords de l'écran
 OVERLAY_MENU_FONT_SIZE = 11  # Taille de la police du menu
 
+## Tailles de police des textes (ui_text.py)
+TEXT_FONT_SIZE = 16  # Taille par défaut d'un texte
+BROADCAST_FONT_SIZE = 12  # Messages affichés en haut de l'écran
+INFO_TITLE_FONT_SIZE = 40  # Titre des écrans d'info (nom de la carte, fin de partie)
+INFO_HOLE_FONT_SIZE = 17  # Numéro du trou sur l'écran d'info
+# Tailles de FONT_PATH chargées au lancement (voir game.py) : toute nouvelle taille doit être ajoutée ici
+STARTUP_FONT_SIZES = sorted({TEXT_FONT_SIZE, BROADCAST_FONT_SIZE, INFO_TITLE_FONT_SIZE, INFO_HOLE_FONT_SIZE,
+                             OVERLAY_MENU_FONT_SIZE})
+TEXT_CACHE_SIZE = 256  # Nombre de textes rendus gardés en cache
+
 ## Musiques et sons
 MUSICS = {
     "launch": "../asset/musics/Lancement jeu.wav",
@@ -193,5 +212,16 @@ SOUNDS = {
     "magnet": "../asset/musics/aimant.wav",
     "water": "../asset/musics/eau.wav"
 }
+SOUND_CATEGORIES = {
+    "ball": "ui",
+    "clic": "ui",
+    "magnet": "ui",
+    "bounce": "physics",
+    "boost": "physics",
+    "victory": "events",
+    "water": "events"
+}
+SOUND_CHANNELS = {"ui": 2, "physics": 3, "events": 2}  # Channels réservés par catégorie de sons
+SOUND_MIN_INTERVAL = 100  # Temps minimum (en ms) entre deux lectures du même son
 VOLUME_SOUND = 0.5
 VOLUME_MUSIC = 0.5
@@ -0,0 +1,99 @@
+from settings import *
+from engine import Engine
+from player import Player
+from map import MapTerrain
+from predictor import RollOutPredictor
+
+
+class Simulation:
+    """
+    Simulation de la physique sans affichage, sans son et sans caméra.
+    Charge le terrain d'une carte .tmx, place les joueurs et fait avancer le moteur physique.
+    Sert de base pour l'analyse en masse des tirs ou pour une partie côté serveur.
+    """
+
+    def __init__(self, map_path: str, players: list[Player], sound_sink=None, respawn_sink=None):
+        """
+        :param map_path: Chemin vers le fichier de la carte (.tmx)
+        :param players: Liste des joueurs à simuler
+        :param sound_sink: Fonction appelée avec le chemin de chaque son déclenché (optionnel)
+        :param respawn_sink: Fonction appelée avec chaque joueur replacé au spawn (optionnel)
+        """
+        self.map: MapTerrain = MapTerrain.from_tmx(map_path)
+        self.players: list[Player] = players
+        self.debug_collisions = []  # Rempli par le moteur en mode DEBUG
+
+        self.engine = Engine(self, sound_sink=sound_sink, respawn_sink=respawn_sink)
+        self.predictor = None  # Construit à la première avance rapide
+        self.time = 0.0  # Temps simulé (en secondes)
+
+        # Placement initial des joueurs
+        self.map.teleportPlayersToSpawn(self.players)
+        for player in self.players:
+            player.update()
+
+    def shoot(self, player: Player, velocity_vector: Vector) -> None:
+        """
+        Applique un tir au joueur, comme lorsqu'il relâche la souris en jeu.
+
+        :param player: Joueur qui tire
+        :param velocity_vector: Impulsion du tir
+        """
+        self.engine.resolve_shot(player, Vector(velocity_vector))
+
+    def step(self, dt: float = PHYSICS_DT) -> None:
+        """
+        Fait avancer la physique d'un pas de temps.
+
+        :param dt: Pas de temps (en secondes)
+        """
+        self.engine.update(dt)
+        self.time += dt
+
+    def is_at_rest(self) -> bool:
+        """Indique si tous les joueurs encore en jeu sont immobiles (même seuil que le jeu)"""
+        return self.engine.at_rest
+
+    def run_until_rest(self, dt: float = PHYSICS_DT, max_steps: int = 60 * PHYSICS_RATE) -> int:
+        """
+        Fait avancer la physique jusqu'à ce que tous les joueurs soient immobiles.
+
+        :param dt: Pas de temps (en secondes)
+        :param max_steps: Nombre maximum de pas simulés
+        :return: Nombre de pas effectués
+        """
+        steps = 0
+        while steps < max_steps:
+            self.step(dt)
+            steps += 1
+            if self.is_at_rest():
+                break
+        return steps
+
+    def fast_forward_until_rest(self, max_steps: int = 60 * PHYSICS_RATE) -> int:
+        """
+        Comme run_until_rest (pas de PHYSICS_DT), mais les lignes droites sur un terrain uniforme
+        sont sautées analytiquement par le RollOutPredictor.
+
+        :param max_steps: Nombre maximum de pas simulés
+        :return: Nombre de pas du moteur effectués ou sautés
+        """
+        if self.predictor is None:
+            self.predictor = RollOutPredictor(self.engine)
+
+        steps = self.predictor.run_until_rest(PHYSICS_DT, max_steps)
+        self.time += steps * PHYSICS_DT
+        return steps
+
+
+if __name__ == '__main__':
+    events = []
+    players = [Player(PLAYER_COLORS[0], (0, 0), name="player0")]
+    simulation = Simulation(MAPS["0"]["path"], players,
+                            sound_sink=lambda sound: events.append(("son", sound)),
+                            respawn_sink=lambda player: events.append(("spawn", player.name)))
+    simulation.shoot(players[0], Vector(600, -200))
+    steps = simulation.run_until_rest()
+    print(f"{steps} pas, {simulation.time:.2f}s simulées")
+    print(f"Position finale : {players[0].position}, terminé : {players[0].finished}")
+    print(f"Événements : {events}")
@@ -1,12 +1,61 @@
 from settings import *
 
+# Banque de sons partagée par tous les SoundManager : chaque fichier n'est décodé qu'une seule fois
+SOUND_BANK = {}
+# Channels réservés pour chaque catégorie de sons
+SOUND_CHANNELS_POOL = {}
+# Catégorie de chaque son, indexée par le chemin du fichier
+SOUND_PATH_CATEGORIES = {path: SOUND_CATEGORIES.get(name) for name, path in SOUNDS.items()}
+# Dernier instant (en ms) où chaque son a été joué, pour limiter les répétitions
+SOUND_LAST_PLAYED = {}
+
+
+def load_sound(sound_path: str) -> pygame.mixer.Sound:
+    """
+    Retourne un son décodé, chargé dans SOUND_BANK au premier appel.
+    N'utilise que le mixer (déjà initialisé) : peut tourner dans un autre thread (voir startup.py).
+    """
+    sound = SOUND_BANK.get(sound_path)
+    if sound is None:
+        sound = pygame.mixer.Sound(sound_path)
+        # Définit le volume du son
+        sound.set_volume(VOLUME_SOUND)
+        # Si deux threads chargent le même son, le premier arrivé est gardé
+        sound = SOUND_BANK.setdefault(sound_path, sound)
+    return sound
+
 
 class SoundManager:
     def __init__(self, frequency=44100, size=-16, channels=2, buffer=512):
         # Initialise le système audio de pygame
         pygame.mixer.init(frequency, size, channels, buffer)
+        # Décode tous les sons et réserve les channels (une seule fois pour tout le jeu)
+        self.load_sounds()
+        self.reserve_channels()
+
+    def load_sounds(self):
+        """Charge tous les sons de SOUNDS en mémoire s'ils ne le sont pas déjà"""
+        for sound_path in SOUNDS.values():
+            load_sound(sound_path)
+
+    def reserve_channels(self):
+        """Réserve des channels pour chaque catégorie de sons (SOUND_CHANNELS)"""
+        if SOUND_CHANNELS_POOL:
+            return
 
-    def play_music(self, music_path: str, loops: int = -1, fade_ms: int = 1000):
+        reserved_number = sum(SOUND_CHANNELS.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved_number))
+        # Les channels réservés ne sont plus utilisés par pygame.mixer.find_channel()
+        pygame.mixer.set_reserved(reserved_number)
+
+        channel_id = 0
+        for category, channels_number in SOUND_CHANNELS.items():
+            SOUND_CHANNELS_POOL[category] = [pygame.mixer.Channel(channel_id + i) for i in range(channels_number)]
+            channel_id += channels_number
+
+    @staticmethod
+    def play_music(music_path: str, loops: int = -1, fade_ms: int = 1000):
+        """Joue une musique en streaming (ne dépend pas des sons chargés, utilisable sans instance)"""
         # Charge un fichier à jouer en tant que musique
         pygame.mixer.music.load(music_path)
         # Joue la musique en boucle
@@ -17,15 +66,20 @@ class SoundManager:
             print(f"[SoundManager] Lecture musique: {music_path}")
 
     def play_sound(self, sound_path: str):
-        # On charge un son
-        sound = pygame.mixer.Sound(sound_path)
-        # Définit le volume du son
-        sound.set_volume(VOLUME_SOUND)
-        # On cherche un channel pour jouer le son
-        channel = pygame.mixer.find_channel()
+        # Un même son joué plusieurs fois en peu de temps (ex : collisions en chaîne) n'est joué qu'une fois
+        current_time = pygame.time.get_ticks()
+        if current_time - SOUND_LAST_PLAYED.get(sound_path, -SOUND_MIN_INTERVAL) < SOUND_MIN_INTERVAL:
+            return
+
+        # On récupère le son déjà décodé (chargé à la volée s'il ne fait pas partie de SOUNDS)
+        sound = load_sound(sound_path)
+
+        # On cherche un channel libre parmi ceux réservés à la catégorie du son
+        channel = self.find_channel(sound_path)
         if channel:
             # Joue le son sur ce channel
             channel.play(sound)
+            SOUND_LAST_PLAYED[sound_path] = current_time
             if DEBUG_MODE:
                 print(f"[SoundManager] Son joué: {sound_path}")
         else:
@@ -33,3 +87,14 @@ class SoundManager:
             if DEBUG_MODE:
                 print("[SoundManager] Aucun canal libre, le son ne peut pas être joué")
 
+    def find_channel(self, sound_path: str):
+        """Retourne un channel libre de la catégorie du son, ou None"""
+        category = SOUND_PATH_CATEGORIES.get(sound_path)
+        if category not in SOUND_CHANNELS_POOL:
+            # Son sans catégorie : on utilise les channels non réservés
+            return pygame.mixer.find_channel()
+
+        for channel in SOUND_CHANNELS_POOL[category]:
+            if not channel.get_busy():
+                return channel
+        return None
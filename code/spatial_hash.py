@@ -0,0 +1,86 @@
+from math import floor
+
+
+class SpatialHash:
+    """
+    Grille de hachage spatiale : chaque objet est rangé dans la case qui contient sa position.
+    Seules les cases occupées existent (dictionnaire), la carte peut donc être aussi grande qu'on veut.
+    Les objets sont déplacés un par un quand ils changent de case, sans reconstruire la grille.
+    """
+
+    def __init__(self, cell_size: float):
+        """
+        :param cell_size: Taille d'une case (en pixels), au moins le diamètre des objets pour les paires
+        """
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list] = {}  # Case -> objets qu'elle contient
+        self.item_cells: dict = {}  # Objet -> case où il est rangé
+
+    def get_cell(self, x: float, y: float) -> tuple[int, int]:
+        """Case qui contient une position"""
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def move(self, item, position) -> None:
+        """
+        Range un objet à sa position, ou le déplace s'il a changé de case.
+
+        :param item: Objet à ranger (hachable)
+        :param position: Position (x, y) de l'objet
+        """
+        cell = self.get_cell(position[0], position[1])
+        old_cell = self.item_cells.get(item)
+        if old_cell == cell:
+            return  # Toujours dans la même case : rien à faire
+
+        if old_cell is not None:
+            self.remove(item)
+        self.cells.setdefault(cell, []).append(item)
+        self.item_cells[item] = cell
+
+    def remove(self, item) -> None:
+        """Retire un objet de la grille (s'il y est)"""
+        cell = self.item_cells.pop(item, None)
+        if cell is None:
+            return
+        items = self.cells[cell]
+        items.remove(item)
+        if not items:
+            del self.cells[cell]
+
+    def query_radius(self, position, radius: float) -> list:
+        """
+        Objets rangés dans les cases qui touchent le carré englobant un cercle.
+        C'est une pré-sélection : la distance exacte reste à tester.
+
+        :param position: Centre (x, y) du cercle
+        :param radius: Rayon du cercle
+        """
+        x, y = position[0], position[1]
+        min_x, min_y = self.get_cell(x - radius, y - radius)
+        max_x, max_y = self.get_cell(x + radius, y + radius)
+
+        found = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                found.extend(self.cells.get((cell_x, cell_y), ()))
+        return found
+
+    def pairs(self) -> list[tuple]:
+        """
+        Paires d'objets rangés dans la même case ou dans deux cases voisines, chaque paire une seule fois.
+        Si la taille des cases est au moins la somme des rayons, aucune paire en contact n'est oubliée.
+        """
+        found = []
+        for (cell_x, cell_y), items in self.cells.items():
+            # Paires à l'intérieur de la case
+            for i in range(len(items)):
+                for j in range(i + 1, len(items)):
+                    found.append((items[i], items[j]))
+
+            # Paires avec la moitié des cases voisines, pour ne compter chaque paire qu'une fois
+            for neighbour in ((cell_x + 1, cell_y - 1), (cell_x + 1, cell_y), (cell_x + 1, cell_y + 1),
+                              (cell_x, cell_y + 1)):
+                for other in self.cells.get(neighbour, ()):
+                    for item in items:
+                        found.append((item, other))
+        return found
@@ -0,0 +1,122 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from settings import *
+from assets import get_image
+
+
+class StartupLoader:
+    """
+    Chargement du jeu au lancement, pendant l'affichage du splash screen et d'une barre de progression.
+    Les décodages de fichiers (images, sons, GIFs, cartes) tournent dans un pool de threads, les étapes
+    qui utilisent l'écran ou les polices (interface pygame_gui, scènes) sur le thread principal, entre deux images.
+    Le menu est affiché dès que les tâches obligatoires sont terminées : les autres continuent en arrière-plan.
+    """
+
+    def __init__(self, screen: pygame.Surface, show: bool = True, workers: int = STARTUP_WORKERS):
+        """
+        :param screen: Surface de la fenêtre
+        :param show: Vrai pour afficher le splash screen et la progression
+        :param workers: Nombre de threads du pool
+        """
+        self.screen = screen
+        self.show = show
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="startup")
+        self.required: list[Future] = []  # Tâches à attendre avant d'afficher le menu
+        self.optional: list[tuple] = []  # Tâches facultatives (fonction, arguments), lancées après les autres
+        self.optional_futures: list[Future] = []  # Tâches facultatives lancées, en cours ou terminées
+        self.steps: list[tuple] = []  # Étapes du thread principal (fonction, arguments, tâches à attendre)
+        self.done_steps = 0
+        self.clock = pygame.time.Clock()
+        self.background: pygame.Surface = None  # Splash screen converti, redessiné à chaque image
+
+    def submit(self, function, *args, required: bool = True) -> Future:
+        """
+        Lance une tâche dans le pool. Elle ne doit pas utiliser l'écran (pas de convert, pas de pygame_gui).
+        Une tâche facultative n'est lancée qu'une fois les tâches obligatoires terminées,
+        pour ne pas leur prendre de temps (elle se termine alors pendant le menu).
+
+        :param function: Fonction à appeler
+        :param required: Faux si le menu peut s'afficher avant la fin de la tâche
+        :return: Future de la tâche, None pour une tâche facultative
+        """
+        if not required:
+            self.optional.append((function, args))
+            return None
+        future = self.executor.submit(function, *args)
+        self.required.append(future)
+        return future
+
+    def call(self, function, *args, after: list[Future] = ()) -> None:
+        """
+        Ajoute une étape à exécuter sur le thread principal pendant le chargement (voir run).
+        Les étapes sont exécutées dans l'ordre où elles sont ajoutées.
+
+        :param function: Fonction à appeler
+        :param after: Tâches du pool qui doivent être terminées avant l'étape (ex : les fichiers qu'elle utilise)
+        """
+        self.steps.append((function, args, list(after)))
+
+    @property
+    def progress(self) -> float:
+        """Avancement du chargement obligatoire, entre 0 et 1"""
+        total = len(self.required) + len(self.steps)
+        if total == 0:
+            return 1.0
+        return (sum(future.done() for future in self.required) + self.done_steps) / total
+
+    def run(self) -> bool:
+        """
+        Exécute les étapes du thread principal (une par image) et attend les tâches obligatoires,
+        en affichant la progression. Les erreurs des tâches obligatoires sont relancées ici.
+
+        :return: Faux si la fenêtre a été fermée pendant le chargement
+        """
+        while self.done_steps < len(self.steps) or not all(future.done() for future in self.required):
+            for _ in pygame.event.get(pygame.QUIT):
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                return False
+
+            # Autant d'étapes que possible pendant une image, puis on redessine la progression
+            frame_end = pygame.time.get_ticks() + 1000 // FPS
+            while self.done_steps < len(self.steps) and pygame.time.get_ticks() < frame_end:
+                function, args, after = self.steps[self.done_steps]
+                if not all(future.done() for future in after):
+                    break
+                function(*args)
+                self.done_steps += 1
+            self.draw()
+            self.clock.tick(FPS)  # Attente du pool sans bloquer la fenêtre
+
+        for future in self.required:
+            future.result()
+        self.draw()
+
+        # Les tâches facultatives se terminent en arrière-plan, puis les threads s'arrêtent
+        for function, args in self.optional:
+            future = self.executor.submit(function, *args)
+            future.add_done_callback(self.report_optional_error)
+            self.optional_futures.append(future)
+        self.executor.shutdown(wait=False)
+        return True
+
+    @staticmethod
+    def report_optional_error(future: Future) -> None:
+        """Affiche l'erreur d'une tâche facultative : personne n'attend son résultat pour la relancer"""
+        error = None if future.cancelled() else future.exception()
+        if error is not None:
+            print(f"[StartupLoader] Échec d'une tâche facultative : {type(error).__name__}: {error}")
+
+    def draw(self) -> None:
+        """Affiche le splash screen et la barre de progression"""
+        if not self.show:
+            return
+        if self.background is None:
+            self.background = get_image("SPLASH_SCREEN").convert()
+        self.screen.blit(self.background, (0, 0))
+
+        width, height = STARTUP_PROGRESS_SIZE
+        bar = pygame.Rect(0, 0, width, height)
+        bar.midbottom = (self.screen.get_width() // 2, self.screen.get_height() - STARTUP_PROGRESS_MARGIN)
+        pygame.draw.rect(self.screen, "white", bar)
+        pygame.draw.rect(self.screen, STARTUP_PROGRESS_COLOR, (bar.x, bar.y, round(width * self.progress), height))
+        pygame.display.flip()
@@ -0,0 +1,133 @@
+import threading
+from copy import copy
+
+from settings import *
+
+
+class TerrainType:
+    """
+    Type de terrain (un calque Tiled : "Grass", "Bounce", ...) et ses propriétés physiques.
+    Chaque type reçoit un petit identifiant entier au chargement des cartes, les tuiles gardent
+    cet identifiant (Tile.terrain) et le moteur n'a plus qu'à lire une table au lieu de comparer des chaînes.
+    """
+
+    def __init__(self, name: str, friction: float = None, restitution: float = 0.0, boost=(0, 0),
+                 handler: str = None, solid: bool = False, out_of_bounds: bool = False):
+        """
+        :param name: Nom du calque Tiled
+        :param friction: Coefficient de friction au sol (None si le terrain ne compte pas pour la friction)
+        :param restitution: Coefficient de rebond sur la normale de contact (1 : rebond parfait)
+        :param boost: Direction (x, y) de l'accélération donnée au contact
+        :param handler: Nom de la méthode du moteur appelée au contact (None si rien à faire)
+        :param solid: Vrai pour les obstacles, fusionnés en rectangles (voir merge_collision_tiles)
+        :param out_of_bounds: Vrai si un joueur sur ce terrain est hors des limites
+        """
+        self.id = -1  # Donné par register_terrain
+        self.name = name
+        self.friction = friction
+        self.restitution = restitution
+        self.boost = Vector(boost)
+        self.handler = handler
+        self.solid = solid
+        self.out_of_bounds = out_of_bounds
+
+    @property
+    def contact(self) -> bool:
+        """Vrai si le terrain agit au contact du joueur (bumper, accélérateur...)"""
+        return self.handler is not None
+
+
+TERRAIN_TYPES: list[TerrainType] = []  # Types de terrain, rangés par identifiant
+TERRAIN_IDS: dict[str, int] = {}  # Nom du calque -> identifiant
+TERRAIN_LOCK = threading.RLock()  # Les cartes peuvent enregistrer des terrains depuis le thread de préchargement
+
+
+def register_terrain(terrain: TerrainType) -> int:
+    """
+    Ajoute un type de terrain au registre, ou remplace celui qui porte le même nom (même identifiant).
+
+    :return: Identifiant du type de terrain
+    """
+    with TERRAIN_LOCK:
+        if terrain.name in TERRAIN_IDS:
+            terrain.id = TERRAIN_IDS[terrain.name]
+            TERRAIN_TYPES[terrain.id] = terrain
+        else:
+            terrain.id = len(TERRAIN_TYPES)
+            TERRAIN_TYPES.append(terrain)
+            TERRAIN_IDS[terrain.name] = terrain.id
+        return terrain.id
+
+
+def get_terrain_id(name: str) -> int:
+    """
+    Identifiant d'un type de terrain à partir du nom de son calque.
+    Un calque inconnu (décor...) devient un terrain sans effet.
+    """
+    terrain_id = TERRAIN_IDS.get(name)
+    if terrain_id is None:
+        with TERRAIN_LOCK:
+            # Un autre thread (préchargement d'une carte) a pu l'enregistrer entre-temps
+            terrain_id = TERRAIN_IDS.get(name)
+            if terrain_id is None:
+                terrain_id = register_terrain(TerrainType(name))
+    return terrain_id
+
+
+def configure_terrain(terrains: list[TerrainType], name: str, properties: dict) -> None:
+    """
+    Applique les propriétés personnalisées Tiled d'un type de terrain : "friction", "restitution",
+    "boost_x", "boost_y" et "solid". Elles peuvent être posées sur un calque, ou sur une tuile du tileset
+    (tileSet.tsx) avec une propriété "terrain" qui donne le nom du calque.
+
+    :param terrains: Table des terrains d'une carte (voir build_terrain_table), modifiée sur place
+    """
+    terrain = terrains[get_terrain_id(name)]
+    if "friction" in properties:
+        terrain.friction = float(properties["friction"])
+    if "restitution" in properties:
+        terrain.restitution = float(properties["restitution"])
+    if "solid" in properties:
+        terrain.solid = bool(properties["solid"])
+    if "boost_x" in properties or "boost_y" in properties:
+        terrain.boost = Vector(float(properties.get("boost_x", terrain.boost.x)),
+                               float(properties.get("boost_y", terrain.boost.y)))
+
+
+def build_terrain_table(compiled_map=None) -> list[TerrainType]:
+    """
+    Table des types de terrain d'une carte, rangée par identifiant comme TERRAIN_TYPES : une copie
+    des valeurs par défaut du registre, modifiée par les propriétés des calques et des tuiles de la carte
+    compilée (voir map_cache.py). Le registre n'est jamais modifié : une carte ne change pas la physique des autres.
+
+    :param compiled_map: Carte compilée (None pour les valeurs par défaut)
+    """
+    configured = []  # (nom du terrain, propriétés) dans l'ordre où elles s'appliquent
+    if compiled_map is not None:
+        for name, properties, _ in compiled_map.layers:
+            get_terrain_id(name)  # Tous les calques de la carte doivent avoir une entrée dans la table
+            if properties:
+                configured.append((name, properties))
+        for tile in compiled_map.tiles.values():
+            if "terrain" in tile["properties"]:
+                get_terrain_id(tile["properties"]["terrain"])
+                configured.append((tile["properties"]["terrain"], tile["properties"]))
+
+    with TERRAIN_LOCK:
+        terrains = [copy(terrain) for terrain in TERRAIN_TYPES]
+    for name, properties in configured:
+        configure_terrain(terrains, name, properties)
+    return terrains
+
+
+# Types de terrain du jeu et valeurs par défaut (modifiables par carte avec les propriétés Tiled)
+GRASS = register_terrain(TerrainType("Grass", friction=GROUND_GRASS_FRICTION))  # Herbe: friction moyenne
+SAND = register_terrain(TerrainType("Sand", friction=GROUND_SAND_FRICTION))  # Sable: friction élevée
+ICE = register_terrain(TerrainType("Ice", friction=GROUND_ICE_FRICTION))  # Glace: friction faible
+WATER = register_terrain(TerrainType("Water", out_of_bounds=True))
+COLLISION = register_terrain(TerrainType("Collision", restitution=1.0, solid=True))
+BOUNCE = register_terrain(TerrainType("Bounce", restitution=2.0, handler="resolve_player_bounce_collision"))
+SPEED_RIGHT = register_terrain(TerrainType("Speed_right", boost=(1, 0), handler="resolve_player_speed_collision"))
+SPEED_LEFT = register_terrain(TerrainType("Speed_left", boost=(-1, 0), handler="resolve_player_speed_collision"))
+SPEED_DOWN = register_terrain(TerrainType("Speed_down", boost=(0, 1), handler="resolve_player_speed_collision"))
+SPEED_UP = register_terrain(TerrainType("Speed_up", boost=(0, -1), handler="resolve_player_speed_collision"))
@@ -1,13 +1,15 @@
 from settings import *
+from terrain import get_terrain_id
 
 
 class Tile(pygame.sprite.Sprite):
-    def __init__(self, tile_type_id, x, y, width, height, image):
+    def __init__(self, tile_type_id, x, y, width, height, image=None):
         super().__init__()
 
         # Identifiant du type de la tuile
         # Ex : "Sand", "Grass", "Water", ...
         self.id = tile_type_id
+        self.terrain = get_terrain_id(tile_type_id)  # Identifiant entier du type de terrain (voir terrain.py)
 
         # Surface de l'image associée à la tuile
         self.image = image
@@ -15,7 +17,11 @@ class Tile(pygame.sprite.Sprite):
         # On initialise la position de la tuile
         # get_rect() est utilisée pour obtenir un rectangle représentant la position et la taille de l'image
         # Le rectangle est positionné en haut à gauche aux coordonnées (x, y)
-        self.rect = self.image.get_rect(topleft=(x, y))
+        # Sans image (tuiles du moteur physique, dessinées depuis l'atlas de la carte), on prend width et height
+        if self.image is not None:
+            self.rect = self.image.get_rect(topleft=(x, y))
+        else:
+            self.rect = pygame.Rect(x, y, width, height)
 
     def draw(self, surface):
         # Permet de dessiner la tuile sur une surface donnée
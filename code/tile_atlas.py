@@ -0,0 +1,59 @@
+from settings import *
+from pytmx import TileFlags
+from pytmx.util_pygame import handle_transformation
+
+
+def load_tile_image(tile: dict) -> pygame.Surface:
+    """
+    Charge l'image d'une tuile de la carte compilée, avec les mêmes étapes que le loader pygame de pytmx
+    (découpe, retournements). La transparence est retirée comme le ferait la conversion au format de l'écran,
+    qui ne peut se faire que sur le thread principal (voir TileAtlas.convert).
+
+    :param tile: Référence de l'image dans le tileset ({"source", "rect", "flags", ...})
+    """
+    image = pygame.image.load(tile["source"])
+    image = image.subsurface(tile["rect"]) if tile["rect"] else image.copy()
+    if tile["flags"] and any(tile["flags"]):
+        image = handle_transformation(image, TileFlags(*tile["flags"]))
+    return pygame.image.frombytes(pygame.image.tobytes(image, "RGBX"), image.get_size(), "RGBX")
+
+
+class TileAtlas:
+    """
+    Images des tuiles d'une carte, chacune chargée une seule fois (par gid) et rangées dans une seule surface.
+    Les images sont placées par rangées (étagères), de la plus haute à la plus basse.
+    Une tuile se dessine avec blit(atlas.surface, position, atlas.rects[gid]).
+    """
+
+    def __init__(self, images: dict[int, pygame.Surface], width: int = TILE_ATLAS_WIDTH):
+        """
+        :param images: Image de chaque gid
+        :param width: Largeur maximale de l'atlas (en pixels)
+        """
+        self.rects: dict[int, pygame.Rect] = {}  # gid -> zone de son image dans l'atlas
+
+        x, y, shelf_height, atlas_width = 0, 0, 0, 1
+        for gid in sorted(images, key=lambda gid: (-images[gid].get_height(), gid)):
+            image_width, image_height = images[gid].get_size()
+            if x > 0 and x + image_width > width:
+                # Rangée pleine : on passe à la suivante
+                x, y, shelf_height = 0, y + shelf_height, 0
+            self.rects[gid] = pygame.Rect(x, y, image_width, image_height)
+            x += image_width
+            shelf_height = max(shelf_height, image_height)
+            atlas_width = max(atlas_width, x)
+
+        self.surface = pygame.Surface((atlas_width, max(1, y + shelf_height)))
+        self.surface.blits([(images[gid], rect) for gid, rect in self.rects.items()], doreturn=False)
+
+    @classmethod
+    def from_compiled_map(cls, compiled_map):
+        """
+        Charge les images des tuiles utilisées par une carte compilée (voir map_cache.py).
+        N'utilise pas l'écran : peut tourner dans le thread qui précharge la carte.
+        """
+        return cls({gid: load_tile_image(tile) for gid, tile in compiled_map.tiles.items()})
+
+    def convert(self) -> None:
+        """Convertit l'atlas au format de l'écran (blits plus rapides). À appeler sur le thread principal."""
+        self.surface = self.surface.convert()
@@ -1,8 +1,41 @@
+from collections import OrderedDict
+
 from settings import *
 
+# Cache des polices déjà chargées, indexées par (chemin, taille)
+FONT_CACHE = {}
+# Cache LRU des textes déjà rendus, indexés par (chemin, taille, texte, couleur)
+RENDER_CACHE = OrderedDict()
+
+
+def get_font(font_name, font_size) -> pygame.font.Font:
+    """Retourne la police demandée, en ne lisant le fichier TTF qu'une seule fois"""
+    key = (font_name, font_size)
+    if key not in FONT_CACHE:
+        FONT_CACHE[key] = pygame.font.Font(font_name, font_size)
+    return FONT_CACHE[key]
+
+
+def render_text(text, font_name, font_size, color) -> pygame.Surface:
+    """
+    Retourne la surface d'un texte rendu, en la gardant en cache.
+    Les surfaces renvoyées sont partagées : il ne faut pas dessiner dessus.
+    """
+    # pygame.Color permet d'avoir la même clé pour "white", (255, 255, 255), ...
+    key = (font_name, font_size, text, tuple(pygame.Color(color)))
+    if key in RENDER_CACHE:
+        RENDER_CACHE.move_to_end(key)  # Texte le plus récemment utilisé
+        return RENDER_CACHE[key]
+
+    rendered_text = get_font(font_name, font_size).render(text, True, color)
+    RENDER_CACHE[key] = rendered_text
+    if len(RENDER_CACHE) > TEXT_CACHE_SIZE:
+        RENDER_CACHE.popitem(last=False)  # Suppression du texte le moins récemment utilisé
+    return rendered_text
+
 
 class Text:
-    def __init__(self, text, pos, font_size=16, color=(0, 0, 0), font_name=FONT_PATH, align="topleft"):
+    def __init__(self, text, pos, font_size=TEXT_FONT_SIZE, color=(0, 0, 0), font_name=FONT_PATH, align="topleft"):
         """
         Initialise un objet texte à afficher.
 
@@ -16,10 +49,12 @@ class Text:
         self.text = text
         self.pos = pos
         self.color = color
-        self.font = pygame.font.Font(font_name, font_size)  # Charge la police avec la taille donnée
+        self.font_name = font_name
+        self.font_size = font_size
+        self.font = get_font(font_name, font_size)  # Charge la police avec la taille donnée (mise en cache)
         self.align = align
 
-        self.rendered_text = self.font.render(self.text, True, self.color)
+        self.rendered_text = render_text(self.text, self.font_name, self.font_size, self.color)
         self.rect = self.rendered_text.get_rect()
         self.set_position(self.pos, self.align)
 
@@ -30,14 +65,14 @@ class Text:
     def set_text(self, new_text):
         """Modifie le contenu du texte et le re-render."""
         self.text = new_text
-        self.rendered_text = self.font.render(self.text, True, self.color)
+        self.rendered_text = render_text(self.text, self.font_name, self.font_size, self.color)
         self.rect = self.rendered_text.get_rect()
         self.set_position(self.pos, self.align)
 
     def set_color(self, new_color):
         """Change la couleur du texte et le re-render."""
         self.color = new_color
-        self.rendered_text = self.font.render(self.text, True, self.color)
+        self.rendered_text = render_text(self.text, self.font_name, self.font_size, self.color)
         self.rect = self.rendered_text.get_rect()
         self.set_position(self.pos, self.align)
 
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# Le jeu se lance depuis le dossier code/ : imports et chemins des fichiers (../asset) en dépendent
+CODE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "code")
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)
+
+# Pas de fenêtre ni de carte son pendant les tests
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def compile_calls(monkeypatch):
+    """Compte les compilations de cartes (map_cache.compile_map) : liste des chemins compilés"""
+    import map_cache
+
+    calls = []
+    compile_map = map_cache.compile_map
+
+    def counting_compile_map(map_path):
+        calls.append(map_path)
+        return compile_map(map_path)
+
+    monkeypatch.setattr(map_cache, "compile_map", counting_compile_map)
+    return calls
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from settings import *
+from batch_engine import BatchEngine
+from map import MapTerrain
+from player import Player
+from simulation import Simulation
+
+
+@pytest.mark.parametrize("map_key", ["0", "1", "12"])
+def test_batch_engine_follows_engine_with_sleep(map_key):
+    rng = random.Random(7)
+    shots = [Vector(rng.uniform(-1500, 1500), rng.uniform(-1500, 1500)) for _ in range(4)]
+    steps = 4 * PHYSICS_RATE  # Assez longtemps pour que la balle s'arrête et s'endorme
+
+    random.seed(1)  # Les rebonds sur les bumpers ont une petite part d'aléatoire
+    player = Player((255, 0, 0), (0, 0))
+    simulation = Simulation(MAPS[map_key]["path"], [player])
+    expected = []
+    for shot in shots:
+        simulation.shoot(player, shot)
+        for _ in range(steps):
+            simulation.step()
+        expected.append((player.position.x, player.position.y, player.asleep))
+
+    random.seed(1)
+    batch = BatchEngine(MapTerrain.from_tmx(MAPS[map_key]["path"]), 1)
+    positions = []
+    for shot in shots:
+        batch.shoot([shot.x, shot.y])
+        for _ in range(steps):
+            batch.step()
+        positions.append((*batch.positions[0], bool(batch.asleep[0])))
+
+    assert any(asleep for _, _, asleep in expected)
+    for (x, y, asleep), (batch_x, batch_y, batch_asleep) in zip(expected, positions):
+        assert batch_x == pytest.approx(x, abs=1e-6)
+        assert batch_y == pytest.approx(y, abs=1e-6)
+        assert batch_asleep == asleep
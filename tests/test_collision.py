@@ -0,0 +1,29 @@
+import math
+
+import pytest
+
+from settings import *
+from collision import sweep_circle_rect
+
+WALL = pygame.Rect(100, 100, 63, 63)
+RADIUS = 15
+
+
+def test_diagonal_sweep_from_a_corner_zone_hits_the_rounded_corner():
+    # (88, 88) est dans le rectangle élargi du rayon, mais à plus d'un rayon du coin (100, 100)
+    t = sweep_circle_rect((88, 88), (88, 88), RADIUS, WALL)
+
+    # Contact quand le centre est à un rayon du coin, sur la diagonale
+    assert t == pytest.approx((100 - RADIUS / math.sqrt(2) - 88) / 88)
+
+
+def test_diagonal_sweep_from_outside_the_expanded_rect():
+    assert sweep_circle_rect((80, 80), (88, 88), RADIUS, WALL) == pytest.approx(0.10674, abs=1e-5)
+
+
+def test_sweep_starting_in_contact_has_no_impact():
+    assert sweep_circle_rect((95, 95), (88, 88), RADIUS, WALL) is None
+
+
+def test_sweep_leaving_a_corner_zone_has_no_impact():
+    assert sweep_circle_rect((88, 88), (-8, -8), RADIUS, WALL) is None
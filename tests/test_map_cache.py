@@ -0,0 +1,57 @@
+import os
+import shutil
+import threading
+
+import numpy as np
+
+from settings import *
+import map_cache
+from map_cache import load_compiled_map
+
+
+def test_concurrent_loads_compile_once(tmp_path, compile_calls):
+    map_path = MAPS["0"]["path"]
+    barrier = threading.Barrier(8)
+    results, errors = [], []
+
+    def load():
+        barrier.wait()  # Tous les threads demandent la carte en même temps
+        try:
+            results.append(load_compiled_map(map_path, cache_dir=str(tmp_path)))
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(compile_calls) == 1
+    # Un seul fichier dans le cache, complet, et aucun fichier temporaire oublié
+    assert os.listdir(tmp_path) == [os.path.basename(map_cache.get_cache_path(map_path, str(tmp_path)))]
+    for compiled_map in results:
+        assert len(compiled_map.layers) == len(results[0].layers)
+        for (_, _, grid), (_, _, expected) in zip(compiled_map.layers, results[0].layers):
+            assert np.array_equal(grid, expected)
+
+
+def test_recompiling_an_edited_map_replaces_its_old_cache_entry(tmp_path, compile_calls):
+    # Copie du projet Tiled (carte et tilesets) pour pouvoir modifier la carte
+    project = tmp_path / "TiledProject"
+    shutil.copytree(os.path.dirname(os.path.dirname(MAPS["0"]["path"])), project)
+    map_path = str(project / "maps" / os.path.basename(MAPS["0"]["path"]))
+    other_map_path = str(project / "maps" / os.path.basename(MAPS["1"]["path"]))
+    cache_dir = tmp_path / "cache"
+
+    load_compiled_map(map_path, cache_dir=str(cache_dir))
+    load_compiled_map(other_map_path, cache_dir=str(cache_dir))
+    with open(map_path, "a", encoding="utf-8") as file:
+        file.write("\n")  # La carte change : nouvelle clé de cache
+    load_compiled_map(map_path, cache_dir=str(cache_dir))
+
+    assert len(compile_calls) == 3
+    # La nouvelle version remplace l'ancienne, la carte voisine garde la sienne
+    assert sorted(os.listdir(cache_dir)) == sorted(os.path.basename(map_cache.get_cache_path(path, str(cache_dir)))
+                                                   for path in (map_path, other_map_path))
@@ -0,0 +1,35 @@
+import os
+
+import numpy as np
+import pytest
+
+from settings import *
+import map_cache
+from broadcast import BroadcastManager
+from map import Map
+from map_preloader import MapPreloader
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.quit()
+
+
+def test_preload_and_synchronous_load_of_an_uncached_map(screen, tmp_path, monkeypatch, compile_calls):
+    monkeypatch.setattr(map_cache, "MAP_CACHE_DIR", str(tmp_path))  # Aucune carte compilée au départ
+
+    map_info = MAPS["0"]
+    preloader = MapPreloader()
+    preloader.preload(map_info)
+    loaded = Map(map_info)  # Même carte, chargée sur le thread principal pendant le préchargement
+    preloaded = preloader.get(map_info, screen, BroadcastManager())
+
+    assert len(compile_calls) == 1
+    assert os.listdir(tmp_path) == [os.path.basename(map_cache.get_cache_path(map_info["path"], str(tmp_path)))]
+    assert preloaded.loaded
+    assert [layer.name for layer in preloaded.layers] == [layer.name for layer in loaded.layers]
+    for layer, expected in zip(preloaded.layers, loaded.layers):
+        assert np.array_equal(layer.grid, expected.grid)
+    assert preloaded.colliders == loaded.colliders
@@ -0,0 +1,68 @@
+import numpy as np
+
+from settings import *
+from engine import Engine
+from map import MapTerrain, load_tiled_layers
+from map_cache import CompiledMap
+from terrain import TERRAIN_TYPES, ICE, SPEED_RIGHT, build_terrain_table
+
+
+def make_compiled_map(layers: dict) -> CompiledMap:
+    """Carte compilée d'une seule case, avec une tuile sur chaque calque {nom: propriétés}"""
+    header = {
+        "width": 1, "height": 1, "tile_width": TILE_SIZE, "tile_height": TILE_SIZE,
+        "layers": [{"name": name, "properties": properties} for name, properties in layers.items()],
+        "objects": [],
+        "tiles": {"1": {"source": "", "rect": [0, 0, TILE_SIZE, TILE_SIZE], "flags": None, "properties": {}}},
+    }
+    return CompiledMap(header, np.ones((len(layers), 1, 1), dtype=np.uint32))
+
+
+def load_terrain(compiled_map: CompiledMap) -> MapTerrain:
+    """Terrain d'une carte compilée, comme MapTerrain.from_tmx"""
+    layers, tile_sizes, spawn, hole, _ = load_tiled_layers(compiled_map)
+    return MapTerrain(layers, tile_sizes, spawn, hole, [], *compiled_map.pixel_size,
+                      build_terrain_table(compiled_map))
+
+
+class FakeLevel:
+    """Le strict nécessaire à Engine : une carte et des joueurs"""
+
+    def __init__(self, map_terrain: MapTerrain):
+        self.map = map_terrain
+        self.players = []
+
+
+def test_terrain_properties_do_not_leak_between_maps():
+    default_friction = TERRAIN_TYPES[ICE].friction
+    default_boost = Vector(TERRAIN_TYPES[SPEED_RIGHT].boost)
+
+    terrain_a = load_terrain(make_compiled_map({"Ice": {"friction": 0.9}, "Speed_right": {"boost_x": 3}}))
+    terrain_b = load_terrain(make_compiled_map({"Ice": {}, "Speed_right": {}}))
+
+    # La carte A a ses propres valeurs
+    assert terrain_a.terrains[ICE].friction == 0.9
+    assert terrain_a.terrains[SPEED_RIGHT].boost == Vector(3, 0)
+    # La carte B, chargée ensuite, garde les valeurs par défaut
+    assert terrain_b.terrains[ICE].friction == default_friction
+    assert terrain_b.terrains[SPEED_RIGHT].boost == default_boost
+    # Le registre n'a pas changé
+    assert TERRAIN_TYPES[ICE].friction == default_friction
+    assert TERRAIN_TYPES[SPEED_RIGHT].boost == default_boost
+
+
+def test_engine_reads_the_terrain_of_its_map():
+    engine_a = Engine(FakeLevel(load_terrain(make_compiled_map({"Ice": {"friction": 0.9}}))))
+    engine_b = Engine(FakeLevel(load_terrain(make_compiled_map({"Ice": {}}))))
+
+    center = (TILE_SIZE / 2, TILE_SIZE / 2)
+    assert engine_a.get_friction_at_point(center) == 0.9
+    assert engine_b.get_friction_at_point(center) == TERRAIN_TYPES[ICE].friction
+
+
+def test_solid_property_is_read_from_the_map_table():
+    terrain_a = load_terrain(make_compiled_map({"Sand": {"solid": True}}))
+    terrain_b = load_terrain(make_compiled_map({"Sand": {}}))
+
+    assert terrain_a.colliders == [pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE)]
+    assert terrain_b.colliders == []